@@ -1,4 +1,5 @@
 from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings
 import os
 from pydantic import Field
@@ -13,6 +14,8 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # 통계/리포트 조회용 읽기 전용 복제본 (없으면 DATABASE_URL 사용)
+    DATABASE_REPLICA_URL: Optional[str] = None
 
     # Frontend URL
     FRONTEND_URL: str
@@ -61,6 +64,53 @@ class Settings(BaseSettings):
     # 카카오 API 키 설정 추가
     KAKAO_REST_API_KEY: str
 
+    # 길찾기 경로 캐시 설정
+    DIRECTIONS_CACHE_SIZE: int = 10000
+    DIRECTIONS_CACHE_TTL_SECONDS: int = 86400
+
+    # 거리 계산 설정 (길찾기 API가 지연 예산을 넘기면 로컬 계산으로 전환)
+    DISTANCE_LATENCY_BUDGET_SECONDS: float = 1.5
+    DISTANCE_FALLBACK_COOLDOWN_SECONDS: float = 30.0
+    DISTANCE_ROAD_FACTOR: float = 1.3
+    DISTANCE_MATRIX_CACHE_SIZE: int = 16
+    # 거리 행렬 캐시 전체 바이트 한도 (이보다 큰 행렬은 캐시하지 않고 스트리밍만 함)
+    DISTANCE_MATRIX_CACHE_BYTES: int = 64 * 1024 * 1024
+
+    # 주소 검색 캐시 설정
+    GEOCODE_CACHE_SIZE: int = 10000
+    GEOCODE_STORE_TTL_DAYS: int = 30
+    GEOCODE_PREWARM_LIMIT: int = 500
+
+    # Redis 공유 캐시 (REDIS_URL이 없으면 워커별 로컬 캐시만 사용)
+    REDIS_URL: Optional[str] = None
+    REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    # REDIS_URL 없이 프로세스 내 메모리 백엔드 사용 (테스트/단일 워커 개발 환경 전용)
+    # 워커마다 세션/락/캐시 태그가 따로 생기고 재시작하면 사라지므로 운영에서는 켜지 않음
+    REDIS_ALLOW_MEMORY_BACKEND: bool = False
+    CACHE_KEY_PREFIX: str = "bigmove"
+    CACHE_LOCAL_TTL_SECONDS: float = 5.0
+
+    # DB 커넥션 풀/엔진 설정 (PostgreSQL 등 서버형 DB)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 10.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_STATEMENT_CACHE_SIZE: int = 500
+    DB_ECHO: bool = False
+
+    # SQLite 설정 (쓰기는 한 번에 하나이므로 풀을 작게 유지)
+    SQLITE_POOL_SIZE: int = 5
+    SQLITE_MAX_OVERFLOW: int = 10
+    SQLITE_BUSY_TIMEOUT_SECONDS: float = 5.0
+
+    # 주문 진행상황(드래프트) 저장 설정
+    ORDER_PROGRESS_TTL_SECONDS: int = 7 * 24 * 3600
+    ORDER_PROGRESS_FLUSH_INTERVAL_SECONDS: float = 1.0
+    ORDER_PROGRESS_FLUSH_BATCH_SIZE: int = 500
+
     model_config = {
         'from_attributes': True,  # 이전의 orm_mode를 대체
         'env_file': '.env',
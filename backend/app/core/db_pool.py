@@ -0,0 +1,85 @@
+from collections import deque
+from typing import Any, Dict, Type
+import threading
+import time
+import numpy as np
+from sqlalchemy import exc
+from sqlalchemy.pool import Pool, QueuePool
+
+class PoolMetrics:
+    """커넥션 풀 체크아웃 대기 시간과 overflow 사용 지표"""
+
+    def __init__(self, name: str, max_samples: int = 1000):
+        self.name = name
+        self.checkouts = 0
+        self.overflow_checkouts = 0
+        self.timeouts = 0
+        self.peak_overflow = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self._waits: deque = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def observe(self, wait: float, overflow: int) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            self._waits.append(wait)
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                self.peak_overflow = max(self.peak_overflow, overflow)
+
+    def observe_timeout(self, wait: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def stats(self, pool: Pool) -> Dict[str, Any]:
+        with self._lock:
+            waits = np.array(self._waits) * 1000 if self._waits else np.zeros(1)
+            result = {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "peak_overflow": self.peak_overflow,
+                "wait_ms_avg": self.total_wait * 1000 / self.checkouts if self.checkouts else 0.0,
+                "wait_ms_p99": float(np.percentile(waits, 99)),
+                "wait_ms_max": self.max_wait * 1000
+            }
+        if isinstance(pool, QueuePool):
+            result.update({
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0)
+            })
+        return result
+
+class _TimedCheckout:
+    """QueuePool 계열에서 커넥션을 꺼낼 때까지 걸린 시간 측정"""
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe_timeout(time.perf_counter() - started)
+            raise
+        self.metrics.observe(time.perf_counter() - started, self.overflow())
+        return connection
+
+def instrumented_pool_class(pool_class: Type[QueuePool], metrics: PoolMetrics) -> Type[QueuePool]:
+    # dispose() 후 재생성되는 풀도 같은 지표를 사용하도록 클래스에 연결
+    return type(f"Timed{pool_class.__name__}", (_TimedCheckout, pool_class), {"metrics": metrics})
+
+_metrics: Dict[str, Any] = {}
+
+def register_engine(name: str, engine: Any, metrics: PoolMetrics) -> None:
+    _metrics[name] = (engine, metrics)
+
+def pool_stats() -> Dict[str, Dict[str, Any]]:
+    """등록된 엔진별 풀 지표"""
+    return {name: metrics.stats(engine.pool) for name, (engine, metrics) in _metrics.items()}
@@ -0,0 +1,226 @@
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+import time
+from redis.exceptions import WatchError
+
+Value = Union[bytes, Set[bytes], Dict[bytes, bytes]]
+
+def _to_bytes(value: Any) -> bytes:
+    # redis-py와 같은 방식으로 값을 바이트로 변환
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (int, float)):
+        return repr(value).encode()
+    raise TypeError(f"Redis에 저장할 수 없는 타입: {type(value).__name__}")
+
+class FakeRedis:
+    """테스트/로컬 개발용 프로세스 내 Redis 대체 구현 (redis.asyncio 호환 일부 명령)
+
+    문자열, 집합, 해시와 만료 시간, 파이프라인, WATCH/MULTI/EXEC를 지원합니다.
+    값은 redis.asyncio 클라이언트(decode_responses=False)처럼 bytes로 반환합니다.
+    """
+
+    def __init__(self):
+        self._data: Dict[bytes, Tuple[Value, float]] = {}
+        self._versions: Dict[bytes, int] = {}
+
+    # 내부 헬퍼
+    def _entry(self, key: Any) -> Optional[Value]:
+        key = _to_bytes(key)
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        return value
+
+    def _store(self, key: Any, value: Value, expires_at: float = float("inf")) -> None:
+        key = _to_bytes(key)
+        self._data[key] = (value, expires_at)
+        self._touch(key)
+
+    def _remove(self, key: bytes) -> bool:
+        if self._data.pop(key, None) is None:
+            return False
+        self._touch(key)
+        return True
+
+    def _touch(self, key: bytes) -> None:
+        self._versions[key] = self._versions.get(key, 0) + 1
+
+    def _version(self, key: Any) -> int:
+        self._entry(key)
+        return self._versions.get(_to_bytes(key), 0)
+
+    def _expires_at(self, key: Any) -> float:
+        entry = self._data.get(_to_bytes(key))
+        return entry[1] if entry else float("inf")
+
+    # 문자열
+    async def get(self, key: Any) -> Optional[bytes]:
+        value = self._entry(key)
+        return value if isinstance(value, bytes) else None
+
+    async def set(
+        self,
+        key: Any,
+        value: Any,
+        ex: Optional[float] = None,
+        px: Optional[float] = None,
+        nx: bool = False,
+        xx: bool = False
+    ) -> Optional[bool]:
+        exists = self._entry(key) is not None
+        if (nx and exists) or (xx and not exists):
+            return None
+        ttl = ex if ex is not None else (px / 1000 if px is not None else None)
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        self._store(key, _to_bytes(value), expires_at)
+        return True
+
+    async def setex(self, key: Any, seconds: float, value: Any) -> bool:
+        return await self.set(key, value, ex=seconds)
+
+    async def delete(self, *keys: Any) -> int:
+        return sum(self._remove(_to_bytes(key)) for key in keys if self._entry(key) is not None)
+
+    async def exists(self, *keys: Any) -> int:
+        return sum(1 for key in keys if self._entry(key) is not None)
+
+    async def expire(self, key: Any, seconds: float) -> bool:
+        value = self._entry(key)
+        if value is None:
+            return False
+        self._store(key, value, time.monotonic() + seconds)
+        return True
+
+    async def ttl(self, key: Any) -> int:
+        if self._entry(key) is None:
+            return -2
+        expires_at = self._expires_at(key)
+        return -1 if expires_at == float("inf") else int(round(expires_at - time.monotonic()))
+
+    # 집합
+    async def sadd(self, key: Any, *members: Any) -> int:
+        current = self._entry(key)
+        members_set = set(current) if isinstance(current, set) else set()
+        before = len(members_set)
+        members_set.update(_to_bytes(member) for member in members)
+        self._store(key, members_set, self._expires_at(key) if current is not None else float("inf"))
+        return len(members_set) - before
+
+    async def smembers(self, key: Any) -> Set[bytes]:
+        value = self._entry(key)
+        return set(value) if isinstance(value, set) else set()
+
+    # 해시
+    async def hset(self, key: Any, field: Any = None, value: Any = None, mapping: Optional[Dict] = None) -> int:
+        current = self._entry(key)
+        fields = dict(current) if isinstance(current, dict) else {}
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        added = sum(1 for name in items if _to_bytes(name) not in fields)
+        fields.update({_to_bytes(name): _to_bytes(item) for name, item in items.items()})
+        self._store(key, fields, self._expires_at(key) if current is not None else float("inf"))
+        return added
+
+    async def hget(self, key: Any, field: Any) -> Optional[bytes]:
+        value = self._entry(key)
+        return value.get(_to_bytes(field)) if isinstance(value, dict) else None
+
+    async def hmget(self, key: Any, keys: Any, *args: Any) -> List[Optional[bytes]]:
+        value = self._entry(key)
+        fields = [keys] if isinstance(keys, (str, bytes)) else list(keys)
+        fields.extend(args)
+        if not isinstance(value, dict):
+            return [None] * len(fields)
+        return [value.get(_to_bytes(field)) for field in fields]
+
+    async def hgetall(self, key: Any) -> Dict[bytes, bytes]:
+        value = self._entry(key)
+        return dict(value) if isinstance(value, dict) else {}
+
+    async def hdel(self, key: Any, *fields: Any) -> int:
+        current = self._entry(key)
+        if not isinstance(current, dict):
+            return 0
+        remaining = dict(current)
+        removed = sum(1 for field in fields if remaining.pop(_to_bytes(field), None) is not None)
+        if remaining:
+            self._store(key, remaining, self._expires_at(key))
+        else:
+            self._remove(_to_bytes(key))
+        return removed
+
+    async def ping(self) -> bool:
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    async def aclose(self) -> None:
+        self._data.clear()
+
+class FakePipeline:
+    """redis.asyncio Pipeline과 같은 사용법의 파이프라인
+
+    watch() 이후 multi() 전까지는 명령을 바로 실행하고(await 필요),
+    그 외에는 명령을 모았다가 execute()에서 한 번에 실행합니다.
+    """
+
+    COMMANDS = frozenset({
+        "get", "set", "setex", "delete", "exists", "expire", "ttl",
+        "sadd", "smembers", "hset", "hget", "hmget", "hgetall", "hdel"
+    })
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._commands: List[Tuple[str, tuple, dict]] = []
+        self._watched: Dict[Any, int] = {}
+        self._immediate = False
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.reset()
+
+    def __getattr__(self, name: str):
+        if name not in self.COMMANDS:
+            raise AttributeError(name)
+
+        def command(*args, **kwargs):
+            if self._immediate:
+                return getattr(self._redis, name)(*args, **kwargs)
+            self._commands.append((name, args, kwargs))
+            return self
+        return command
+
+    async def watch(self, *keys: Any) -> None:
+        for key in keys:
+            self._watched[key] = self._redis._version(key)
+        self._immediate = True
+
+    def multi(self) -> None:
+        self._immediate = False
+
+    async def execute(self) -> List[Any]:
+        try:
+            for key, version in self._watched.items():
+                if self._redis._version(key) != version:
+                    raise WatchError("Watched variable changed.")
+            return [
+                await getattr(self._redis, name)(*args, **kwargs)
+                for name, args, kwargs in self._commands
+            ]
+        finally:
+            await self.reset()
+
+    async def reset(self) -> None:
+        self._commands = []
+        self._watched = {}
+        self._immediate = False
@@ -1,9 +1,74 @@
+from functools import lru_cache
+from typing import Optional, Union
+import logging
 from redis import Redis
+import redis.asyncio as aioredis
 from .config import settings
+from .fake_redis import FakeRedis
 
-def get_redis() -> Redis:
-    return Redis.from_url(
+logger = logging.getLogger(__name__)
+
+AsyncRedis = Union[aioredis.Redis, FakeRedis]
+
+_client: Optional[AsyncRedis] = None
+
+def create_redis() -> AsyncRedis:
+    """공유 연결 풀을 사용하는 비동기 Redis 클라이언트
+
+    REDIS_URL이 없으면 REDIS_ALLOW_MEMORY_BACKEND를 켠 경우에만 메모리 백엔드를 사용하고,
+    그렇지 않으면 앱 시작(start_redis) 시점에 실패합니다.
+    """
+    if not settings.REDIS_URL:
+        if not settings.REDIS_ALLOW_MEMORY_BACKEND:
+            raise RuntimeError(
+                "REDIS_URL이 설정되지 않았습니다. 운영 환경은 REDIS_URL을 설정하고, "
+                "Redis 없이 개발/테스트하려면 환경 변수 또는 backend/.env 파일에 "
+                "REDIS_ALLOW_MEMORY_BACKEND=True를 추가하세요 (.env.development는 자동으로 읽지 않음)"
+            )
+        logger.warning("REDIS_URL이 설정되지 않아 프로세스 내 메모리 Redis 백엔드를 사용합니다")
+        return FakeRedis()
+    pool = aioredis.ConnectionPool.from_url(
         settings.REDIS_URL,
         db=settings.REDIS_DB,
-        decode_responses=True
-    ) 
\ No newline at end of file
+        max_connections=settings.REDIS_MAX_CONNECTIONS
+    )
+    return aioredis.Redis(connection_pool=pool)
+
+def get_redis() -> AsyncRedis:
+    """앱 전체가 공유하는 비동기 Redis 클라이언트 (값은 bytes로 반환)"""
+    global _client
+    if _client is None:
+        _client = create_redis()
+    return _client
+
+async def start_redis() -> None:
+    try:
+        client = get_redis()
+    except RuntimeError as e:
+        # Redis 설정이 없으면 해결 방법을 로그로 남기고 앱 시작을 중단
+        logger.error(f"Redis 백엔드를 만들 수 없어 앱을 시작하지 않습니다: {str(e)}")
+        raise
+    try:
+        await client.ping()
+    except Exception as e:
+        # Redis 장애가 앱 시작을 막지 않도록 로그만 남김
+        logger.error(f"Redis 연결 확인 중 오류 발생: {str(e)}")
+
+async def close_redis() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def get_cache_redis() -> Optional[AsyncRedis]:
+    """공유 캐시 계층용 클라이언트 (Redis 미설정 시 None, 로컬 캐시만 사용)"""
+    if not settings.REDIS_URL:
+        return None
+    return get_redis()
+
+@lru_cache()
+def get_sync_cache_redis() -> Optional[Redis]:
+    """동기 코드에서 사용하는 공유 캐시용 Redis 클라이언트"""
+    if not settings.REDIS_URL:
+        return None
+    return Redis.from_url(settings.REDIS_URL, db=settings.REDIS_DB)
@@ -5,9 +5,15 @@ from ..services.payment_service import PaymentService
 from ..services.warehouse_service import WarehouseService
 from ..services.notification_service import NotificationService
 from ..services.furniture_service import FurnitureService
+from ..services.furniture_detail_service import FurnitureDetailService
 from ..services.quote_service import QuoteService
 from ..services.review_service import ReviewService
-from ..services.order_progress_service import OrderProgressService
+from ..services.shipping_order_service import ShippingOrderService
+from ..services.dashboard_service import DashboardService
+from ..services.performance_analysis_service import PerformanceAnalysisService
+from ..services.analytics_service import AnalyticsService
+from ..services.report_service import ReportService
+from ..services.order_progress_service import get_order_progress_service
 
 class ServiceContainer:
     def __init__(self):
@@ -19,7 +25,7 @@ class ServiceContainer:
             "username": "your_username",
             "password": "your_password"
         }
-        self.order_progress_service = OrderProgressService()
+        self.order_progress_service = get_order_progress_service()
         
     @property
     def order_service(self) -> OrderService:
@@ -43,6 +49,10 @@ class ServiceContainer:
     def furniture_service(self) -> FurnitureService:
         return self._get_service('furniture', FurnitureService)
         
+    @property
+    def furniture_detail_service(self) -> FurnitureDetailService:
+        return self._get_service('furniture_detail', FurnitureDetailService)
+
     @property
     def quote_service(self) -> QuoteService:
         return self._get_service('quote', QuoteService)
@@ -51,6 +61,37 @@ class ServiceContainer:
     def review_service(self) -> ReviewService:
         return self._get_service('review', ReviewService)
 
+    @property
+    def shipping_order_service(self) -> ShippingOrderService:
+        return self._get_service('shipping_order', ShippingOrderService)
+
+    # 통계/분석 서비스는 라우트에서 get_read_db 세션(복제본)을 받아 사용
+    @property
+    def dashboard_service(self) -> DashboardService:
+        if 'dashboard' not in self._services:
+            self._services['dashboard'] = DashboardService(
+                self.order_service, self.shipping_order_service, self.review_service
+            )
+        return self._services['dashboard']
+
+    @property
+    def performance_analysis_service(self) -> PerformanceAnalysisService:
+        if 'performance_analysis' not in self._services:
+            self._services['performance_analysis'] = PerformanceAnalysisService(
+                self.shipping_order_service, self.review_service
+            )
+        return self._services['performance_analysis']
+
+    @property
+    def analytics_service(self) -> AnalyticsService:
+        return self._get_service('analytics', AnalyticsService)
+
+    @property
+    def report_service(self) -> ReportService:
+        if 'report' not in self._services:
+            self._services['report'] = ReportService(self.analytics_service)
+        return self._services['report']
+
     def _get_service(self, service_name: str, service_class: type) -> Any:
         if service_name not in self._services:
             self._services[service_name] = service_class()
@@ -1,13 +1,125 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from .core.config import settings
+from .core.db_pool import PoolMetrics, instrumented_pool_class, register_engine
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+# 동기 드라이버 -> 비동기 드라이버
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite"
+}
+
+def to_async_url(url: str) -> str:
+    """DATABASE_URL을 비동기 드라이버 URL로 변환 (이미 비동기 드라이버면 그대로 사용)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if parsed.get_driver_name() in ("asyncpg", "aiosqlite") or backend not in ASYNC_DRIVERS:
+        return url
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    # WAL: 쓰기 중에도 읽기 가능, NORMAL: 커밋마다 fsync 하지 않음 (WAL에서는 안전)
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+def engine_options(url: str) -> Tuple[str, Dict[str, Any]]:
+    """백엔드별 엔진 옵션 (URL에 드라이버 옵션이 추가될 수 있어 URL도 함께 반환)"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = parsed.get_driver_name()
+    options: Dict[str, Any] = {
+        "echo": settings.DB_ECHO,
+        # 컴파일된 SQL 캐시 크기
+        "query_cache_size": settings.DB_STATEMENT_CACHE_SIZE
+    }
+    connect_args: Dict[str, Any] = {}
+
+    if backend == "sqlite":
+        connect_args.update(check_same_thread=False, timeout=settings.SQLITE_BUSY_TIMEOUT_SECONDS)
+        if parsed.database not in (None, "", ":memory:"):
+            options.update(
+                pool_size=settings.SQLITE_POOL_SIZE,
+                max_overflow=settings.SQLITE_MAX_OVERFLOW,
+                pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS
+            )
+    else:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=settings.DB_POOL_PRE_PING
+        )
+
+    if driver == "asyncpg":
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+        # asyncpg는 연결별로 prepared statement를 캐시
+        parsed = parsed.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+    elif driver == "psycopg2":
+        connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+    options["connect_args"] = connect_args
+    return parsed.render_as_string(hide_password=False), options
+
+def create_db_engine(url: str, name: str = "primary", is_async: bool = False):
+    """설정 기반 엔진 생성 (풀 체크아웃 대기/overflow 지표는 pool_stats()로 조회)"""
+    url, options = engine_options(url)
+    if "pool_size" in options:
+        base_pool = AsyncAdaptedQueuePool if is_async else QueuePool
+        metrics = PoolMetrics(name)
+        options["poolclass"] = instrumented_pool_class(base_pool, metrics)
+    else:
+        metrics = None
+
+    engine = create_async_engine(url, **options) if is_async else create_engine(url, **options)
+    sync_engine = engine.sync_engine if is_async else engine
+
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:"):
+        event.listen(sync_engine, "connect", _set_sqlite_pragmas)
+    if metrics is not None:
+        register_engine(name, engine, metrics)
+    return engine
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 요청 처리용 비동기 엔진 (DB 대기 중에도 이벤트 루프가 다른 요청을 처리)
+async_engine = create_db_engine(to_async_url(SQLALCHEMY_DATABASE_URL), name="primary_async", is_async=True)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+def create_read_engine(replica_url: Optional[str]):
+    """통계/리포트 조회용 엔진 (복제본 URL이 없으면 primary 엔진 공유)"""
+    if not replica_url:
+        return engine
+    return create_db_engine(replica_url, name="replica")
+
+def _reject_writes(session: Session, flush_context, instances) -> None:
+    # 복제본 세션에서 실수로 쓰기를 시도하면 primary와 데이터가 어긋나므로 차단
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("읽기 전용 세션에서는 데이터를 변경할 수 없습니다")
+
+def read_sessionmaker(bind) -> sessionmaker:
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=bind)
+    event.listen(factory, "before_flush", _reject_writes)
+    return factory
+
+# 대시보드/성능 분석/리포트처럼 무거운 읽기 전용 쿼리는 복제본으로 보내
+# 주문/결제 쓰기 경로의 primary 커넥션과 I/O를 점유하지 않도록 분리
+read_engine = create_read_engine(settings.DATABASE_REPLICA_URL)
+ReadSessionLocal = read_sessionmaker(read_engine)
+
 Base = declarative_base()
 
 # 데이터베이스 테이블 생성 함수
@@ -28,6 +140,9 @@ def init_db():
     from .models.inventory import Inventory
     from .models.warehouse import Warehouse
     from .models.delivery_booking import DeliveryBooking
+    from .models.rollup import (
+        DailyOrderRollup, DailyItemRollup, DailyShipmentRollup, DailyDriverRollup, DailyReviewRollup, DailyDeliverySketch
+    )
     
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
@@ -37,4 +152,16 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+def get_read_db():
+    """읽기 전용 세션 (쓰기 경로는 get_db/get_async_db 사용)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,17 +1,27 @@
 import os
+import asyncio
 from fastapi import FastAPI, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from .routes import (
     categories, orders, product, notification,
     admin, auth, payment, quote, review,
-    warehouse, delivery, service_options, directions
+    warehouse, delivery, service_options, directions, distance, performance
 )
-from .database import engine, Base
+from .database import engine, async_engine, Base
 from .routes.auth import router as auth_router
 from .routes.coupon import router as coupon_router
 from datetime import datetime
 from .database import get_db
+from .services.furniture_catalog import get_furniture_catalog
+from .utils.http_client import start_http_client, close_http_client
+from .core.redis import start_redis, close_redis
+from .services.geocoding_service import get_geocoding_service
+from .services.order_progress_service import get_order_progress_service
+from .services.rollup_service import track_rollups
+from .utils.single_flight import single_flight_stats
+from .core.db_pool import pool_stats
+from .core.config import settings
 import logging
 from sqlalchemy import text
 import sys
@@ -20,6 +30,10 @@ logger = logging.getLogger(__name__)
 
 app = FastAPI(title="BigMove API")
 
+# 주문/배송/리뷰 저장 시 일별 집계 테이블을 같은 트랜잭션에서 증분 갱신
+track_rollups(engine)
+track_rollups(async_engine)
+
 # 로깅 설정 강화
 logging.basicConfig(
     level=logging.DEBUG,
@@ -55,6 +69,53 @@ async def health_check():
         "service": "BigMove API"
     }
 
+@app.get("/api/metrics")
+async def get_metrics():
+    # 외부 API 중복 호출 병합(single-flight)과 DB 커넥션 풀 지표
+    return {"single_flight": single_flight_stats(), "db_pool": pool_stats()}
+
+@app.on_event("startup")
+async def load_catalog():
+    # 가구 카탈로그를 미리 메모리에 적재
+    get_furniture_catalog().load()
+
+@app.on_event("startup")
+async def open_http_client():
+    # 외부 API 호출용 공유 HTTP 클라이언트 (연결 풀 재사용)
+    await start_http_client()
+
+@app.on_event("startup")
+async def prewarm_geocode_cache():
+    # 자주 검색된 주소를 메모리 캐시에 미리 적재
+    await asyncio.to_thread(get_geocoding_service().prewarm, settings.GEOCODE_PREWARM_LIMIT)
+
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await close_http_client()
+
+@app.on_event("startup")
+async def open_redis():
+    # 세션/캐시가 함께 쓰는 Redis 연결 풀
+    await start_redis()
+
+@app.on_event("startup")
+async def start_order_progress_flusher():
+    # 주문 진행상황 변경분을 주기적으로 테이블에 기록
+    get_order_progress_service().start_flusher()
+
+@app.on_event("shutdown")
+async def flush_order_progress():
+    # Redis 연결을 닫기 전에 남은 변경분 기록
+    await get_order_progress_service().stop_flusher()
+
+@app.on_event("shutdown")
+async def shutdown_redis():
+    await close_redis()
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    await async_engine.dispose()
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -89,7 +150,9 @@ ROUTER_CONFIGS = [
     (review.router, "/api/reviews", "리뷰"),
     (warehouse.router, "/api/warehouses", "창고"),
     (delivery.router, "/api/delivery", "배송"),
-    (service_options.router, "/api/service-options", "서비스 옵션")
+    (service_options.router, "/api/service-options", "서비스 옵션"),
+    (distance.router, "/api/distance", "거리"),
+    (performance.router, "/api/performance", "성능 분석")
 ]
 
 for router, prefix, tag in ROUTER_CONFIGS:
@@ -13,6 +13,10 @@ from .inventory import Inventory
 from .warehouse import Warehouse
 from .delivery import DeliveryTimeSlot, DeliveryAreaRestriction
 from .delivery_booking import DeliveryBooking
+from .geocode_cache import GeocodeCache
+from .rollup import (
+    DailyOrderRollup, DailyItemRollup, DailyShipmentRollup, DailyDriverRollup, DailyReviewRollup, DailyDeliverySketch
+)
 
 __all__ = [
     'User',
@@ -30,5 +34,12 @@ __all__ = [
     'Warehouse',
     'DeliveryTimeSlot',
     'DeliveryAreaRestriction',
-    'DeliveryBooking'
+    'DeliveryBooking',
+    'GeocodeCache',
+    'DailyOrderRollup',
+    'DailyItemRollup',
+    'DailyShipmentRollup',
+    'DailyDriverRollup',
+    'DailyReviewRollup',
+    'DailyDeliverySketch'
 ]
\ No newline at end of file
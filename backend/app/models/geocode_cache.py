@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String, JSON, DateTime
+from ..database import Base
+from datetime import datetime
+
+class GeocodeCache(Base):
+    """주소 검색 결과 캐시
+
+    카카오 로컬 주소 검색 결과를 정규화된 검색어 기준으로 저장합니다.
+    """
+    __tablename__ = "geocode_cache"
+
+    query = Column(String, primary_key=True, comment="정규화된 검색어")
+    documents = Column(JSON, nullable=False, comment="주소 검색 결과 목록")
+    hit_count = Column(Integer, default=0, index=True, comment="조회 횟수 (사전 적재 우선순위)")
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,10 +1,14 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 from datetime import datetime
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # 기간별 주문 수/매출 집계를 테이블 조회 없이 인덱스만으로 처리
+        Index("ix_orders_created_at_total_price", "created_at", "total_price"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -14,6 +18,7 @@ class Order(Base):
     to_address_id = Column(Integer, ForeignKey("addresses.id"))
     additional_options = Column(JSON, nullable=True)
     shipping_company_id = Column(Integer, ForeignKey("shipping_companies.id"), nullable=True)
+    total_price = Column(Integer, nullable=True, default=0)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -0,0 +1,104 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date
+from ..database import Base
+
+# 배송 소요 시간 히스토그램 구간 (상한 시간, 응답 라벨, 컬럼명)
+DELIVERY_TIME_BUCKETS = (
+    (2, '0-2h', 'hours_0_2'),
+    (4, '2-4h', 'hours_2_4'),
+    (8, '4-8h', 'hours_4_8'),
+    (24, '8-24h', 'hours_8_24'),
+    (None, '24h+', 'hours_24_plus')
+)
+
+# 배송 소요 시간 분위수 스케치 설정 (바꾸면 버킷 번호가 달라지므로 집계 테이블을 백필해야 함)
+DELIVERY_TIME_SKETCH_ACCURACY = 0.01
+DELIVERY_TIME_SKETCH_MIN_HOURS = 1 / 60
+
+class DailyOrderRollup(Base):
+    """일별/지역별/상태별 주문 집계
+
+    주문 저장 시 증분 갱신되며 scripts/backfill_rollups.py로 재계산합니다.
+    """
+    __tablename__ = "daily_order_rollups"
+
+    day = Column(Date, primary_key=True)
+    region = Column(String, primary_key=True, default='', comment="도착지 시/도 (미지정은 빈 문자열)")
+    status = Column(String, primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(BigInteger, nullable=False, default=0)
+
+class DailyItemRollup(Base):
+    """일별/가구별 주문 집계 (인기 가구 통계용)"""
+    __tablename__ = "daily_item_rollups"
+
+    day = Column(Date, primary_key=True)
+    furniture_id = Column(String, primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    revenue = Column(BigInteger, nullable=False, default=0)
+
+class DailyShipmentRollup(Base):
+    """일별/지역별/상태별 배송 집계 (배송 시간 합계와 구간별 건수 포함)"""
+    __tablename__ = "daily_shipment_rollups"
+
+    day = Column(Date, primary_key=True)
+    region = Column(String, primary_key=True, default='')
+    status = Column(String, primary_key=True)
+    shipment_count = Column(Integer, nullable=False, default=0)
+    shipping_fee = Column(BigInteger, nullable=False, default=0)
+    timed_count = Column(Integer, nullable=False, default=0, comment="배송 완료 시각이 있는 건수")
+    delivery_hours = Column(Float, nullable=False, default=0.0, comment="배송 소요 시간 합계")
+    hours_0_2 = Column(Integer, nullable=False, default=0)
+    hours_2_4 = Column(Integer, nullable=False, default=0)
+    hours_4_8 = Column(Integer, nullable=False, default=0)
+    hours_8_24 = Column(Integer, nullable=False, default=0)
+    hours_24_plus = Column(Integer, nullable=False, default=0)
+
+class DailyDriverRollup(Base):
+    """일별/배송사/기사별 배송 집계 (배송사 성능 분석과 기사 랭킹용)"""
+    __tablename__ = "daily_driver_rollups"
+
+    day = Column(Date, primary_key=True)
+    company_id = Column(Integer, primary_key=True, default=0, comment="미지정은 0")
+    driver_id = Column(Integer, primary_key=True, default=0, comment="미배정은 0")
+    shipment_count = Column(Integer, nullable=False, default=0)
+    delivered_count = Column(Integer, nullable=False, default=0)
+    delayed_count = Column(Integer, nullable=False, default=0)
+    shipping_fee = Column(BigInteger, nullable=False, default=0)
+    delivered_fee = Column(BigInteger, nullable=False, default=0)
+    timed_count = Column(Integer, nullable=False, default=0)
+    delivery_hours = Column(Float, nullable=False, default=0.0)
+    hours_0_2 = Column(Integer, nullable=False, default=0)
+    hours_2_4 = Column(Integer, nullable=False, default=0)
+    hours_4_8 = Column(Integer, nullable=False, default=0)
+    hours_8_24 = Column(Integer, nullable=False, default=0)
+    hours_24_plus = Column(Integer, nullable=False, default=0)
+
+class DailyReviewRollup(Base):
+    """일별/배송사/기사별 리뷰 집계 (평점 분포 포함)"""
+    __tablename__ = "daily_review_rollups"
+
+    day = Column(Date, primary_key=True)
+    company_id = Column(Integer, primary_key=True, default=0)
+    driver_id = Column(Integer, primary_key=True, default=0)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Float, nullable=False, default=0.0)
+    service_rating_sum = Column(Float, nullable=False, default=0.0)
+    driver_rating_sum = Column(Float, nullable=False, default=0.0)
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+
+class DailyDeliverySketch(Base):
+    """일별/배송사별 배송 소요 시간 DDSketch 버킷
+
+    버킷 번호별 배송 완료 건수만 저장하므로 기간 내 행을 버킷별로 합산하면
+    기간 전체의 스케치가 됩니다 (app/utils/quantile_sketch.py).
+    """
+    __tablename__ = "daily_delivery_sketches"
+
+    day = Column(Date, primary_key=True)
+    company_id = Column(Integer, primary_key=True, default=0, comment="미지정은 0")
+    bucket = Column(Integer, primary_key=True, comment="DDSketch 버킷 번호")
+    delivery_count = Column(Integer, nullable=False, default=0)
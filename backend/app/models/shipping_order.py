@@ -1,11 +1,19 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from ..database import Base
 from datetime import datetime
 
 class ShippingOrder(Base):
     __tablename__ = "shipping_orders"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # 대시보드 상태/지역/배송 시간 집계용 커버링 인덱스
+        Index("ix_shipping_orders_dashboard", "created_at", "status", "region", "delivered_at"),
+        # 배송사/기사/지역별 기간 조회와 배송 시간 분위수 계산용 (delivered_at까지 포함해 인덱스만 읽음)
+        Index("ix_shipping_orders_company_created_at", "company_id", "created_at", "delivered_at"),
+        Index("ix_shipping_orders_driver_created_at", "driver_id", "created_at", "delivered_at"),
+        Index("ix_shipping_orders_region_created_at", "region", "created_at", "delivered_at"),
+        {'extend_existing': True}
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"))
@@ -17,6 +25,10 @@ class ShippingOrder(Base):
     tracking_number = Column(String, unique=True)
     current_location = Column(String, nullable=True)
     estimated_delivery = Column(DateTime)
+    delivered_at = Column(DateTime, nullable=True)
+    shipping_fee = Column(Integer, nullable=True)
+    # 도착지 주소의 시/도 (지역별 집계용)
+    region = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
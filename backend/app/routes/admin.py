@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from typing import List, Dict
-from ..database import get_db
+from ..database import get_db, get_read_db
 from ..models import User, DeliveryTimeSlot, DeliveryAreaRestriction, DeliveryBooking
 from ..schemas.admin import (
     UserList, UserDetail, UserStats,
@@ -85,7 +85,7 @@ async def create_area_restriction(
 # 배송 현황 모니터링
 @router.get("/delivery/statistics", response_model=DeliveryStatisticsResponse)
 async def get_delivery_statistics(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_admin = Depends(get_current_admin)
 ):
     """배송 통계 조회 (관리자 전용)"""
@@ -106,7 +106,7 @@ async def get_delivery_statistics(
 @router.get("/dashboard", response_model=UserStats)
 async def get_dashboard_stats(
     current_admin: User = Depends(get_current_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """관리자 대시보드 통계 조회"""
     try:
@@ -46,7 +46,8 @@ async def search_address(
     current_user: User = Depends(get_current_user)
 ):
     try:
-        return {"message": "주소 검색 성공", "addresses": []}  # 카카오맵 API 연동 필요
+        addresses = await address_service.search_address(query)
+        return {"message": "주소 검색 성공", "addresses": addresses}
     except Exception as e:
         logger.error(f"주소 검색 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
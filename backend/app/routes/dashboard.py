@@ -1,39 +1,61 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
 from typing import Optional
 from datetime import datetime
-from ..database import get_db
+from ..database import ReadSessionLocal
 from ..models import User
 from ..utils.auth import get_current_admin_user
 from ..core.service_container import get_service_container
+from ..utils.tiered_cache import get_tiered_cache
+from fastapi.concurrency import run_in_threadpool
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 대시보드 통계는 클러스터 전체에서 1분에 한 번만 계산
+dashboard_cache = get_tiered_cache("dashboard", ttl=60)
+
+def _with_read_session(function, *args):
+    """캐시 로더용: 자체 읽기 세션으로 실행
+
+    get_or_set은 동시에 들어온 요청을 첫 요청의 로더 하나로 합치므로, 로더가
+    요청 세션을 쓰면 다른 요청의 결과가 이미 닫혔을 수 있는 세션에 의존하게 됩니다.
+    """
+    with ReadSessionLocal() as db:
+        return function(db, *args)
+
 @router.get("/stats")
 async def get_dashboard_statistics(
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
-    """대시보드 통계 조회 (관리자 전용)"""
+    """대시보드 통계 조회 (관리자 전용)
+
+    기간은 UTC 날짜 단위입니다: (현재 - days)의 날짜 0시부터 현재까지의 일별 집계를 합산합니다.
+    """
     try:
-        return container.dashboard_service.get_dashboard_stats(db, days)
+        return await dashboard_cache.get_or_set(
+            ("stats", days),
+            lambda: run_in_threadpool(_with_read_session, container.dashboard_service.get_dashboard_stats, days),
+            tags=("dashboard",)
+        )
     except Exception as e:
         logger.error(f"대시보드 통계 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="대시보드 통계 조회 중 오류가 발생했습니다")
 
 @router.get("/users")
 async def get_user_statistics(
-    db: Session = Depends(get_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
     """회원 통계 조회 (관리자 전용)"""
     try:
-        return container.dashboard_service.get_user_stats(db)
+        return await dashboard_cache.get_or_set(
+            "users",
+            lambda: run_in_threadpool(_with_read_session, container.dashboard_service.get_user_stats),
+            tags=("dashboard",)
+        )
     except Exception as e:
         logger.error(f"회원 통계 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Literal
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
-from ..database import get_db
+from ..database import get_async_db
 from ..models.delivery import DeliveryTimeSlot, DeliveryAreaRestriction
 from ..models.delivery_booking import DeliveryBooking
 from ..schemas.delivery import (
@@ -22,8 +22,7 @@ logger = logging.getLogger(__name__)
 
 @router.get("/available-dates", response_model=AvailableDatesResponse)
 async def get_available_dates(
-    delivery_type: Literal['SAME_DAY', 'NEXT_DAY', 'REGULAR'],
-    db: Session = Depends(get_db)
+    delivery_type: Literal['SAME_DAY', 'NEXT_DAY', 'REGULAR']
 ):
     """배송 타입에 따른 배송 가능한 날짜 목록 조회"""
     try:
@@ -62,8 +61,7 @@ async def get_available_dates(
 @router.get("/delivery-slots/{delivery_type}", response_model=AvailableTimeSlotsResponse)
 async def get_delivery_slots(
     delivery_type: Literal['SAME_DAY', 'NEXT_DAY', 'REGULAR'],
-    date: str,
-    db: Session = Depends(get_db)
+    date: str
 ):
     """배송 타입과 날짜에 따른 배송 가능 시간대 조회"""
     try:
@@ -140,7 +138,7 @@ async def get_delivery_slots(
 @router.post("/temporary-booking", response_model=TemporaryBookingResponse)
 async def create_temporary_booking(
     booking: TemporaryBookingCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_user)
 ):
     """배송 시간대 임시 예약"""
@@ -154,8 +152,8 @@ async def create_temporary_booking(
         )
         
         db.add(temp_booking)
-        db.commit()
-        db.refresh(temp_booking)
+        await db.commit()
+        await db.refresh(temp_booking)
         
         return TemporaryBookingResponse(
             booking_id=temp_booking.id,
@@ -165,6 +163,6 @@ async def create_temporary_booking(
             expires_at=temp_booking.expires_at
         )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         logger.error(f"임시 예약 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="임시 예약 생성 중 오류가 발생했습니다")
\ No newline at end of file
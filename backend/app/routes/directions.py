@@ -1,42 +1,29 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
 import httpx
-from typing import Optional
-from ..config import get_settings
+import logging
+from ..services.kakao_directions import KakaoDirectionsClient, get_kakao_directions_client
 
 router = APIRouter()
-settings = get_settings()
+logger = logging.getLogger(__name__)
 
 @router.get("/api/directions")
 async def get_directions(
     origin: str,
-    destination: str
+    destination: str,
+    client: KakaoDirectionsClient = Depends(get_kakao_directions_client)
 ):
     try:
-        print(f"Using API Key: KakaoAK {settings.KAKAO_REST_API_KEY}")
-        print(f"Request URL: https://apis-navi.kakaomobility.com/v1/directions")
-        print(f"Params: origin={origin}, destination={destination}")
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://apis-navi.kakaomobility.com/v1/directions",
-                params={
-                    "origin": origin,
-                    "destination": destination,
-                    "priority": "RECOMMEND"
-                },
-                headers={
-                    "Authorization": f"KakaoAK {settings.KAKAO_REST_API_KEY}"
-                }
-            )
-            
-            print(f"Response status: {response.status_code}")
-            print(f"Response body: {response.text}")
-            
-            response.raise_for_status()
-            return response.json()
-            
+        return await client.get_directions(origin, destination)
     except httpx.HTTPError as e:
+        logger.error(f"길찾기 API 호출 중 오류 발생: {str(e)}")
         raise HTTPException(
             status_code=500,
             detail="도로 거리 계산 중 오류가 발생했습니다."
-        ) 
\ No newline at end of file
+        )
+
+@router.get("/api/directions/cache-stats")
+async def get_directions_cache_stats(
+    client: KakaoDirectionsClient = Depends(get_kakao_directions_client)
+):
+    # 경로 캐시 적중/미스 및 외부 API 호출 횟수
+    return client.stats()
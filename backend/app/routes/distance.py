@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from ..models import User
+from ..schemas.distance import DistanceMatrixRequest
+from ..services.distance_matrix_service import (
+    DistanceMatrixService,
+    get_distance_matrix_service,
+    iter_binary_matrix,
+    iter_ndjson_rows
+)
+from ..utils.auth import get_current_user
+
+router = APIRouter()
+
+@router.post("/matrix")
+def get_distance_matrix(
+    request: DistanceMatrixRequest,
+    current_user: User = Depends(get_current_user),
+    service: DistanceMatrixService = Depends(get_distance_matrix_service)
+):
+    """좌표 간 도로 거리 행렬 (km)
+
+    - ndjson: 출발지 한 곳당 한 줄씩 도착지 거리 배열
+    - binary: 행/열 수(uint32 2개) + float32 행렬 (little-endian, 행 우선)
+
+    동기 함수라 스레드풀에서 실행되며, 행렬은 응답을 스트리밍하면서 행 블록 단위로
+    계산합니다 (동기 iterator는 StreamingResponse가 스레드풀에서 순회).
+    """
+    matrix = service.matrix(request.origins, request.destinations)
+    headers = {"X-Matrix-Rows": str(matrix.shape[0]), "X-Matrix-Cols": str(matrix.shape[1])}
+
+    if request.format == "binary":
+        return StreamingResponse(
+            iter_binary_matrix(matrix.shape, matrix.blocks()), media_type="application/octet-stream", headers=headers
+        )
+    return StreamingResponse(iter_ndjson_rows(matrix.blocks()), media_type="application/x-ndjson", headers=headers)
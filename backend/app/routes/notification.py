@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
-from ..database import get_db
+from ..database import get_async_db
 from ..models import User
 from ..schemas.notification import NotificationResponse, NotificationUpdate
 from ..utils.auth import get_current_user
@@ -15,13 +15,13 @@ logger = logging.getLogger(__name__)
 async def get_notifications(
     skip: int = 0,
     limit: int = 20,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
     """사용자의 알림 목록 조회"""
     try:
-        notifications = container.notification_service.get_user_notifications(
+        notifications = await container.notification_service.get_user_notifications(
             db, current_user.id, skip, limit
         )
         return notifications
@@ -32,13 +32,13 @@ async def get_notifications(
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_as_read(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
     """알림을 읽음 상태로 변경"""
     try:
-        notification = container.notification_service.mark_as_read(
+        notification = await container.notification_service.mark_as_read(
             db, notification_id, current_user.id
         )
         return notification
@@ -49,13 +49,13 @@ async def mark_notification_as_read(
 @router.delete("/{notification_id}")
 async def delete_notification(
     notification_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
     """알림 삭제"""
     try:
-        container.notification_service.delete_notification(db, notification_id, current_user.id)
+        await container.notification_service.delete_notification(db, notification_id, current_user.id)
         return {"message": "알림이 삭제되었습니다"}
     except Exception as e:
         logger.error(f"알림 삭제 중 오류 발생: {str(e)}")
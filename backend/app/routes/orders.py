@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Dict, Any
-from ..database import get_db
+from ..database import get_async_db, get_db
 from ..models import User, Order
 from ..schemas.orders import (
     OrderCreate, 
     OrderResponse, 
     OrderList, 
     OrderSummaryResponse,
+    OrderProgressSummaryResponse,
     AddressCreate,
     AddressResponse
 )
@@ -39,21 +41,21 @@ async def create_order(
         logger.error(f"주문 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="주문 처리 중 오류가 발생했습니다")
 
-@router.get("/{order_id}", response_model=OrderResponse)
+@router.get("/{order_id:int}", response_model=OrderResponse)
 async def get_order(
     order_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
-    order = container.order_service.get_order_by_id(db, order_id)
+    order = await container.order_service.get_order_by_id(db, order_id)
     if not order:
         raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
     if order.user_id != current_user.id and not current_user.is_admin:
         raise HTTPException(status_code=403, detail="이 주문에 접근할 권한이 없습니다")
     return order
 
-@router.get("/{order_id}/summary", response_model=OrderSummaryResponse)
+@router.get("/{order_id:int}/summary", response_model=OrderSummaryResponse)
 async def get_order_summary(
     order_id: int,
     db: Session = Depends(get_db),
@@ -70,7 +72,7 @@ async def get_order_summary(
 async def save_order_progress(
     step: str,
     data: Dict[str, Any],
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
@@ -83,7 +85,7 @@ async def save_order_progress(
 
 @router.get("/progress")
 async def get_order_progress(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
@@ -93,23 +95,20 @@ async def get_order_progress(
         user_id=current_user.id
     )
 
-@router.get("/summary", response_model=OrderSummaryResponse)
+@router.get("/summary", response_model=OrderProgressSummaryResponse)
 async def get_order_summary(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
     """주문 요약 정보 조회"""
     try:
-        # 현재 진행중인 주문 데이터 조회
-        progress_data = await container.order_progress_service.get_progress(db, current_user.id)
-        if not progress_data:
-            raise HTTPException(status_code=404, detail="진행중인 주문이 없습니다")
-
-        # 최종 가격 계산
-        total_price = await container.order_progress_service.calculate_current_price(
+        # 현재 진행중인 주문 데이터와 단계별로 계산해 둔 요금 조회
+        progress_data, price = await container.order_progress_service.get_progress_and_price(
             db, current_user.id
         )
+        if not progress_data:
+            raise HTTPException(status_code=404, detail="진행중인 주문이 없습니다")
 
         # 요약 정보 구성
         summary = {
@@ -120,21 +119,23 @@ async def get_order_summary(
                 "options": progress_data.get("additional_options", {})
             },
             "price_details": {
-                "base_price": total_price,  # 기본 요금
-                "distance_fee": progress_data.get("address_input", {}).get("distance_fee", 0),
-                "option_fees": progress_data.get("additional_options", {}).get("total_fees", 0),
-                "total_price": total_price
+                "base_price": price["base_price"],  # 기본 요금
+                "distance_fee": price["distance_fee"],
+                "option_fees": price["options_fee"],
+                "total_price": price["total_price"]
             },
             "status": progress_data.get("current_step", ""),
             "user_info": {
                 "name": current_user.name,
                 "email": current_user.email,
-                "phone": current_user.phone
+                "phone": getattr(current_user, "phone", None)  # User 모델에 전화번호 컬럼 없음
             }
         }
 
         return summary
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"주문 요약 조회 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"주문 요약 조회 실패: {str(e)}")
@@ -165,13 +166,14 @@ async def save_address(
 @router.post("/confirm")
 async def confirm_order(
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
     container = Depends(get_service_container)
 ):
     """주문 확정"""
     try:
         # 현재 진행중인 주문 데이터 조회
-        progress_data = await container.order_progress_service.get_progress(db, current_user.id)
+        progress_data = await container.order_progress_service.get_progress(async_db, current_user.id)
         if not progress_data:
             raise HTTPException(status_code=404, detail="진행중인 주문이 없습니다")
 
@@ -183,7 +185,7 @@ async def confirm_order(
                     detail=f"필수 단계 {step}가 완료되지 않았습니다"
                 )
 
-        # 주문 확정 처리
+        # 주문 확정 처리 (견적/주문 생성은 동기 세션 사용)
         order = await container.order_service.create_order(
             db=db,
             user_id=current_user.id,
@@ -191,7 +193,7 @@ async def confirm_order(
         )
 
         # Redis 캐시 삭제
-        await container.order_progress_service.clear_progress(current_user.id)
+        await container.order_progress_service.clear_progress(current_user.id, async_db)
 
         return {
             "message": "주문이 성공적으로 확정되었습니다",
@@ -202,21 +204,22 @@ async def confirm_order(
         logger.error(f"주문 확정 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail=f"주문 확정 실패: {str(e)}")
 
-@router.post("/{order_id}/complete")
+@router.post("/{order_id:int}/complete")
 async def complete_order(
-    order_id: str,
+    order_id: int,
     db: Session = Depends(get_db),
+    async_db: AsyncSession = Depends(get_async_db),
     container = Depends(get_service_container)
 ):
     try:
         # 1. 주문 상태 업데이트
         order = await container.order_service.update_order_status(
-            db,
+            async_db,
             order_id=order_id,
             status="PAYMENT_COMPLETED"
         )
 
-        # 2. 배송 주문 생성
+        # 2. 배송 주문 생성 (배송 서비스는 동기 세션 사용)
         shipping_order = container.shipping_order_service.create_shipping_order(
             db=db,
             order_id=order.id,
@@ -244,7 +247,7 @@ async def get_user_orders(
     user_id: int,
     skip: int = 0,
     limit: int = 10,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     container = Depends(get_service_container)
 ):
     """사용자의 주문 내역 조회"""
@@ -254,10 +257,10 @@ async def get_user_orders(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/{order_id}/details")
+@router.get("/{order_id:int}/details")
 async def get_order_details(
-    order_id: str,
-    db: Session = Depends(get_db),
+    order_id: int,
+    db: AsyncSession = Depends(get_async_db),
     container = Depends(get_service_container)
 ):
     """주문 상세 정보 조회"""
@@ -8,6 +8,8 @@ from ..schemas.payment import PaymentCreate, PaymentResponse
 from ..utils.auth import get_current_user
 from ..core.service_container import get_service_container
 from ..core.config import settings
+from ..utils.http_client import get_http_client
+from ..utils.single_flight import get_single_flight
 import httpx
 import base64
 import logging
@@ -17,6 +19,7 @@ from pydantic import BaseModel
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
+confirm_flight = get_single_flight("toss_payment_confirm")
 
 class PaymentConfirmRequest(BaseModel):
     paymentKey: str
@@ -45,6 +48,39 @@ async def create_payment(
         logger.error(f"결제 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="결제 처리 중 오류가 발생했습니다")
 
+async def _confirm_with_toss(payload: Dict) -> Dict:
+    """토스페이먼츠 결제 승인 API 호출"""
+    toss_url = "https://api.tosspayments.com/v1/payments/confirm"
+    
+    secret_key = base64.b64encode(f"{settings.TOSS_SECRET_KEY}:".encode()).decode()
+    
+    headers = {
+        "Authorization": f"Basic {secret_key}",
+        "Content-Type": "application/json"
+    }
+
+    logger.info(f"Sending request to Toss Payments - Payload: {payload}")
+    
+    response = await get_http_client().post(
+        toss_url,
+        headers=headers,
+        json=payload
+    )
+
+    logger.info(f"Toss Payments response status: {response.status_code}")
+
+    if response.status_code == 200:
+        payment_data = response.json()
+        logger.info(f"Payment confirmed successfully: {payment_data}")
+        return payment_data
+    else:
+        error_data = response.json()
+        logger.error(f"Payment confirmation failed: {error_data}")
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"결제 승인 실패: {error_data.get('message', '알 수 없는 오류')}"
+        )
+
 @router.post("/payments/confirm")
 async def confirm_payment(
     payment_data: PaymentConfirmRequest,
@@ -58,43 +94,14 @@ async def confirm_payment(
     try:
         logger.info(f"Payment confirmation started - OrderId: {payment_data.orderId}")
         
-        async with httpx.AsyncClient() as client:
-            toss_url = "https://api.tosspayments.com/v1/payments/confirm"
-            
-            secret_key = base64.b64encode(f"{settings.TOSS_SECRET_KEY}:".encode()).decode()
-            
-            headers = {
-                "Authorization": f"Basic {secret_key}",
-                "Content-Type": "application/json"
-            }
-            
-            payload = {
-                "paymentKey": payment_data.paymentKey,
-                "orderId": payment_data.orderId,
-                "amount": payment_data.amount
-            }
-
-            logger.info(f"Sending request to Toss Payments - Payload: {payload}")
-            
-            response = await client.post(
-                toss_url,
-                headers=headers,
-                json=payload
-            )
-
-            logger.info(f"Toss Payments response status: {response.status_code}")
-
-            if response.status_code == 200:
-                payment_data = response.json()
-                logger.info(f"Payment confirmed successfully: {payment_data}")
-                return payment_data
-            else:
-                error_data = response.json()
-                logger.error(f"Payment confirmation failed: {error_data}")
-                raise HTTPException(
-                    status_code=response.status_code,
-                    detail=f"결제 승인 실패: {error_data.get('message', '알 수 없는 오류')}"
-                )
+        payload = {
+            "paymentKey": payment_data.paymentKey,
+            "orderId": payment_data.orderId,
+            "amount": payment_data.amount
+        }
+        # 재시도/중복 클릭으로 같은 결제 승인이 동시에 들어오면 토스 API는 한 번만 호출
+        key = (payment_data.paymentKey, payment_data.orderId, payment_data.amount)
+        return await confirm_flight.do(key, lambda: _confirm_with_toss(payload))
                 
     except HTTPException as he:
         raise he
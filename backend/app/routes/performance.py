@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime, timedelta
-from ..database import get_db
+from ..database import get_read_db
 from ..models import User
 from ..utils.auth import get_current_admin_user
 from ..core.service_container import get_service_container
@@ -15,7 +15,7 @@ logger = logging.getLogger(__name__)
 async def analyze_company_performance(
     company_id: int,
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
@@ -35,7 +35,7 @@ async def analyze_company_performance(
 async def get_driver_performance_ranking(
     days: int = Query(30, ge=1, le=365),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
@@ -52,7 +52,8 @@ async def get_driver_performance_ranking(
 @router.get("/delivery-times")
 async def analyze_delivery_times(
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    company_id: Optional[int] = Query(None, description="배송 회사 ID (미지정 시 전체)"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
@@ -61,7 +62,7 @@ async def analyze_delivery_times(
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        return container.performance_analysis_service.analyze_delivery_times(db, start_date, end_date)
+        return container.performance_analysis_service.analyze_delivery_times(db, start_date, end_date, company_id)
     except Exception as e:
         logger.error(f"배송 시간 분석 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="배송 시간 분석 중 오류가 발생했습니다")
@@ -69,7 +70,8 @@ async def analyze_delivery_times(
 @router.get("/regional")
 async def analyze_regional_performance(
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(get_db),
+    region: Optional[str] = Query(None, description="시/도 (미지정 시 전체)"),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_admin_user),
     container = Depends(get_service_container)
 ):
@@ -78,7 +80,7 @@ async def analyze_regional_performance(
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
-        return container.performance_analysis_service.analyze_regional_performance(db, start_date, end_date)
+        return container.performance_analysis_service.analyze_regional_performance(db, start_date, end_date, region)
     except Exception as e:
         logger.error(f"지역별 성능 분석 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="지역별 성능 분석 중 오류가 발생했습니다") 
\ No newline at end of file
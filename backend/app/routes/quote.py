@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 from ..database import get_db
 from ..models import User
-from ..schemas.quote import QuoteCreate, QuoteResponse
+from ..schemas.quote import QuoteCreate, QuoteResponse, BatchPriceRequest, BatchPriceResponse
 from ..utils.auth import get_current_user
 from ..core.service_container import get_service_container
 import logging
@@ -34,6 +34,22 @@ async def create_quote(
         logger.error(f"견적 생성 중 오류 발생: {str(e)}")
         raise HTTPException(status_code=500, detail="견적 생성 중 오류가 발생했습니다")
 
+@router.post("/batch-price", response_model=BatchPriceResponse)
+def calculate_batch_prices(
+    request_data: BatchPriceRequest,
+    current_user: User = Depends(get_current_user),
+    container = Depends(get_service_container)
+):
+    """주문 N건 요금 일괄 계산 (요금표 변경 시 재견적용)
+
+    CPU 작업이므로 동기 함수로 두어 스레드풀에서 실행합니다 (이벤트 루프를 막지 않음).
+    """
+    if request_data.columns is not None:
+        prices = container.quote_service.calculate_batch_price_columns(request_data.columns)
+    else:
+        prices = container.quote_service.calculate_batch_prices(request_data.orders)
+    return {"count": len(prices), "prices": prices}
+
 @router.get("/{quote_id}", response_model=QuoteResponse)
 async def get_quote(
     quote_id: int,
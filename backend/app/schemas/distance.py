@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+from typing import List, Literal, Optional, Tuple
+
+MAX_MATRIX_POINTS = 5000
+
+class DistanceMatrixRequest(BaseModel):
+    origins: List[Tuple[float, float]] = Field(
+        ..., min_length=1, max_length=MAX_MATRIX_POINTS, description="출발지 좌표 목록 [경도, 위도]"
+    )
+    destinations: Optional[List[Tuple[float, float]]] = Field(
+        None, min_length=1, max_length=MAX_MATRIX_POINTS, description="도착지 좌표 목록 (생략 시 출발지 간 거리)"
+    )
+    format: Literal["ndjson", "binary"] = Field("ndjson", description="응답 형식")
@@ -54,6 +54,30 @@ class OrderSummaryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class OrderProgressSteps(BaseModel):
+    product: Dict[str, Any] = {}
+    date: Dict[str, Any] = {}
+    address: Dict[str, Any] = {}
+    options: Dict[str, Any] = {}
+
+class OrderProgressPriceDetails(BaseModel):
+    base_price: float
+    distance_fee: float
+    option_fees: float
+    total_price: float
+
+class OrderProgressUserInfo(BaseModel):
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+
+class OrderProgressSummaryResponse(BaseModel):
+    """진행 중인 주문(드래프트) 요약 (GET /api/orders/summary)"""
+    order_steps: OrderProgressSteps
+    price_details: OrderProgressPriceDetails
+    status: str
+    user_info: OrderProgressUserInfo
+
 class AddressCreate(BaseModel):
     from_address: str
     from_detail_address: str
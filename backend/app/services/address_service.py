@@ -3,9 +3,13 @@ from ..models.address import Address
 from fastapi import HTTPException
 from typing import List, Optional, Dict
 from datetime import datetime
-import math
-import requests
+import httpx
 from ..config import KAKAO_API_KEY
+from .distance_providers import haversine_km
+from .geocoding_service import get_geocoding_service
+import logging
+
+logger = logging.getLogger(__name__)
 
 class AddressService:
     def __init__(self):
@@ -42,34 +46,19 @@ class AddressService:
         return address
 
     def calculate_distance(self, address1: Address, address2: Address) -> float:
-        R = 6371  # 지구의 반경 (km)
-        lat1, lon1 = math.radians(address1.latitude), math.radians(address1.longitude)
-        lat2, lon2 = math.radians(address2.latitude), math.radians(address2.longitude)
-        
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        distance = R * c
-        
+        distance = haversine_km(
+            address1.latitude, address1.longitude,
+            address2.latitude, address2.longitude
+        )
         return round(distance, 2) 
 
-    def search_address(self, query: str) -> List[Dict]:
-        """카카오 주소 검색 API를 사용하여 주소 검색"""
-        headers = {
-            'Authorization': f'KakaoAK {self.kakao_api_key}'
-        }
-        
-        response = requests.get(
-            'https://dapi.kakao.com/v2/local/search/address',
-            headers=headers,
-            params={'query': query}
-        )
-        
-        if response.status_code == 200:
-            return response.json()['documents']
-        return []
+    async def search_address(self, query: str) -> List[Dict]:
+        """카카오 주소 검색 API를 사용하여 주소 검색 (결과 캐시 사용)"""
+        try:
+            return await get_geocoding_service().search(query)
+        except httpx.HTTPError as e:
+            logger.error(f"주소 검색 API 호출 중 오류 발생: {str(e)}")
+            return []
         
     def save_delivery_addresses(self, order_id: str, from_address: str, to_address: str) -> Dict:
         """배송 주소 정보 저장"""
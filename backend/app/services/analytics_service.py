@@ -2,23 +2,29 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
-from ..models import Order, ShippingOrder, Review, User
+from ..models import Order, User
+from ..models.rollup import DailyOrderRollup, DailyShipmentRollup
 from fastapi import HTTPException
 
 class AnalyticsService:
     def get_revenue_analytics(self, db: Session, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
         try:
-            orders = db.query(Order).filter(
-                Order.created_at.between(start_date, end_date),
-                Order.status != 'cancelled'
-            ).all()
+            # 일별 집계 테이블 기준 (일 단위)
+            totals = db.query(
+                func.sum(DailyOrderRollup.order_count).label('count'),
+                func.sum(DailyOrderRollup.revenue).label('revenue')
+            ).filter(
+                DailyOrderRollup.day.between(start_date.date(), end_date.date()),
+                DailyOrderRollup.status != 'cancelled'
+            ).one()
             
-            total_revenue = sum(order.total_price for order in orders)
-            avg_order_value = total_revenue / len(orders) if orders else 0
+            total_orders = totals.count or 0
+            total_revenue = totals.revenue or 0
+            avg_order_value = total_revenue / total_orders if total_orders else 0
             
             return {
                 'total_revenue': total_revenue,
-                'total_orders': len(orders),
+                'total_orders': total_orders,
                 'average_order_value': round(avg_order_value, 2),
                 'period': {
                     'start': start_date.isoformat(),
@@ -52,14 +58,19 @@ class AnalyticsService:
 
     def get_shipping_analytics(self, db: Session, period_days: int = 30) -> Dict[str, Any]:
         try:
-            start_date = datetime.utcnow() - timedelta(days=period_days)
-            shipping_orders = db.query(ShippingOrder).filter(
-                ShippingOrder.created_at >= start_date
-            ).all()
+            start_day = (datetime.utcnow() - timedelta(days=period_days)).date()
+            status_counts = dict(
+                db.query(
+                    DailyShipmentRollup.status,
+                    func.sum(DailyShipmentRollup.shipment_count)
+                ).filter(
+                    DailyShipmentRollup.day >= start_day
+                ).group_by(DailyShipmentRollup.status).all()
+            )
             
-            total_orders = len(shipping_orders)
-            completed_orders = len([so for so in shipping_orders if so.status == 'delivered'])
-            delayed_orders = len([so for so in shipping_orders if so.status == 'delayed'])
+            total_orders = sum(count or 0 for count in status_counts.values())
+            completed_orders = status_counts.get('delivered') or 0
+            delayed_orders = status_counts.get('delayed') or 0
             
             return {
                 'total_deliveries': total_orders,
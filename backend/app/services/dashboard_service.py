@@ -1,8 +1,9 @@
 from sqlalchemy.orm import Session
 from typing import Dict, Any, List
-from datetime import datetime, timedelta
-from sqlalchemy import func, desc, and_
-from ..models import Order, ShippingOrder, Review, User, Furniture
+from datetime import date, datetime, timedelta
+from sqlalchemy import case, desc, func
+from ..models import User, Furniture
+from ..models.rollup import DailyItemRollup, DailyOrderRollup, DailyReviewRollup, DailyShipmentRollup
 from ..services.order_service import OrderService
 from ..services.shipping_order_service import ShippingOrderService
 from ..services.review_service import ReviewService
@@ -19,38 +20,41 @@ class DashboardService:
         self.review_service = review_service
 
     def get_dashboard_stats(self, db: Session, days: int = 30) -> Dict[str, Any]:
+        """대시보드 통계 (일별 집계 테이블 기준)
+
+        기간은 UTC 날짜 단위로 (utcnow - days)의 날짜 0시부터 현재까지입니다.
+        시각 기준(created_at >= utcnow - days)보다 시작일의 최대 24시간이 더 포함됩니다.
+        """
         try:
-            start_date = datetime.utcnow() - timedelta(days=days)
-            
-            # 주문 통계
-            orders = self.order_service.get_orders_in_date_range(db, start_date, datetime.utcnow())
-            total_orders = len(orders)
-            total_revenue = sum(order.total_price for order in orders)
+            # 일별 집계 테이블 기준 (조회 비용은 기간 일수에 비례하고 주문 수와 무관)
+            start_day = (datetime.utcnow() - timedelta(days=days)).date()
             
             # 일별 주문 추이
             daily_orders = (
                 db.query(
-                    func.date(Order.created_at).label('date'),
-                    func.count(Order.id).label('count'),
-                    func.sum(Order.total_price).label('revenue')
+                    DailyOrderRollup.day.label('date'),
+                    func.sum(DailyOrderRollup.order_count).label('count'),
+                    func.sum(DailyOrderRollup.revenue).label('revenue')
                 )
-                .filter(Order.created_at >= start_date)
-                .group_by(func.date(Order.created_at))
-                .order_by(func.date(Order.created_at))
+                .filter(DailyOrderRollup.day >= start_day)
+                .group_by(DailyOrderRollup.day)
+                .order_by(DailyOrderRollup.day)
                 .all()
             )
+            total_orders = sum(day.count for day in daily_orders)
+            total_revenue = sum(day.revenue for day in daily_orders)
 
             # 배송 통계
-            shipping_stats = self._get_shipping_stats(db, start_date)
+            shipping_stats = self._get_shipping_stats(db, start_day)
             
             # 리뷰 통계
-            review_stats = self._get_review_stats(db, start_date)
+            review_stats = self._get_review_stats(db, start_day)
             
             # 인기 가구 통계
-            popular_items = self._get_popular_items(db, start_date)
+            popular_items = self._get_popular_items(db, start_day)
             
             # 지역별 통계
-            regional_stats = self._get_regional_stats(db, start_date)
+            regional_stats = self._get_regional_stats(db, start_day)
 
             return {
                 'summary': {
@@ -84,69 +88,85 @@ class DashboardService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"대시보드 통계 조회 중 오류가 발생했습니다: {str(e)}")
 
-    def _get_shipping_stats(self, db: Session, start_date: datetime) -> Dict[str, Any]:
-        shipping_orders = db.query(ShippingOrder).filter(
-            ShippingOrder.created_at >= start_date
-        ).all()
-        
-        status_counts = {}
-        delivery_times = []
-        completed = 0
-        
-        for order in shipping_orders:
-            status_counts[order.status] = status_counts.get(order.status, 0) + 1
-            if order.status == 'delivered':
-                completed += 1
-                if order.delivered_at and order.created_at:
-                    delivery_time = (order.delivered_at - order.created_at).total_seconds() / 3600
-                    delivery_times.append(delivery_time)
+    def _get_shipping_stats(self, db: Session, start_day: date) -> Dict[str, Any]:
+        rows = (
+            db.query(
+                DailyShipmentRollup.status,
+                func.sum(DailyShipmentRollup.shipment_count).label('count'),
+                func.sum(DailyShipmentRollup.timed_count).label('timed'),
+                func.sum(DailyShipmentRollup.delivery_hours).label('hours')
+            )
+            .filter(DailyShipmentRollup.day >= start_day)
+            .group_by(DailyShipmentRollup.status)
+            .all()
+        )
+
+        # 집계 테이블은 상태 미지정을 빈 문자열로 저장하므로 응답은 이전처럼 None으로 표시
+        status_counts = {row.status or None: row.count for row in rows if row.count}
+        total = sum(status_counts.values())
+        completed = status_counts.get('delivered', 0)
+        timed = sum(row.timed or 0 for row in rows)
+        hours = sum(row.hours or 0 for row in rows)
         
         return {
             'completed_deliveries': completed,
-            'pending_deliveries': len(shipping_orders) - completed,
+            'pending_deliveries': total - completed,
             'status_distribution': status_counts,
-            'average_delivery_time': sum(delivery_times) / len(delivery_times) if delivery_times else 0,
-            'success_rate': (completed / len(shipping_orders) * 100) if shipping_orders else 0
+            'average_delivery_time': hours / timed if timed else 0,
+            'success_rate': (completed / total * 100) if total else 0
         }
 
-    def _get_review_stats(self, db: Session, start_date: datetime) -> Dict[str, Any]:
-        reviews = db.query(Review).filter(Review.created_at >= start_date).all()
+    def _get_review_stats(self, db: Session, start_day: date) -> Dict[str, Any]:
+        buckets = [getattr(DailyReviewRollup, f'rating_{i}') for i in range(1, 6)]
+        row = (
+            db.query(
+                func.sum(DailyReviewRollup.review_count).label('count'),
+                func.sum(DailyReviewRollup.rating_sum).label('rating_sum'),
+                *[func.sum(bucket).label(bucket.key) for bucket in buckets]
+            )
+            .filter(DailyReviewRollup.day >= start_day)
+            .one()
+        )
         
-        if not reviews:
+        rating_dist = {str(i): getattr(row, f'rating_{i}') or 0 for i in range(1, 6)}
+        total_reviews = row.count or 0
+        if not total_reviews:
             return {
                 'average_rating': 0,
                 'total_reviews': 0,
-                'rating_distribution': {str(i): 0 for i in range(1, 6)},
+                'rating_distribution': rating_dist,
                 'satisfaction_score': 0
             }
         
-        rating_dist = {str(i): 0 for i in range(1, 6)}
-        for review in reviews:
-            rating_dist[str(int(review.rating))] += 1
-        
-        satisfaction_score = (
-            sum(review.rating >= 4 for review in reviews) / len(reviews) * 100
-        )
-        
         return {
-            'average_rating': sum(review.rating for review in reviews) / len(reviews),
-            'total_reviews': len(reviews),
+            'average_rating': row.rating_sum / total_reviews,
+            'total_reviews': total_reviews,
             'rating_distribution': rating_dist,
-            'satisfaction_score': satisfaction_score
+            'satisfaction_score': (rating_dist['4'] + rating_dist['5']) / total_reviews * 100
         }
 
-    def _get_popular_items(self, db: Session, start_date: datetime) -> List[Dict[str, Any]]:
+    def _get_popular_items(self, db: Session, start_day: date) -> List[Dict[str, Any]]:
+        # 가구별 합계를 먼저 구한 뒤 상위 10개만 가구 정보와 조인
+        item_counts = (
+            db.query(
+                DailyItemRollup.furniture_id,
+                func.sum(DailyItemRollup.order_count).label('order_count'),
+                func.sum(DailyItemRollup.revenue).label('total_revenue')
+            )
+            .filter(DailyItemRollup.day >= start_day)
+            .group_by(DailyItemRollup.furniture_id)
+            .subquery()
+        )
         popular_items = (
             db.query(
                 Furniture.id,
                 Furniture.name,
-                func.count(Order.id).label('order_count'),
-                func.sum(Order.total_price).label('total_revenue')
+                item_counts.c.order_count,
+                item_counts.c.total_revenue
             )
-            .join(Order, Order.items.contains(Furniture.id))
-            .filter(Order.created_at >= start_date)
-            .group_by(Furniture.id, Furniture.name)
-            .order_by(desc('order_count'))
+            .join(Furniture, Furniture.id == item_counts.c.furniture_id)
+            .filter(item_counts.c.order_count > 0)
+            .order_by(desc(item_counts.c.order_count), Furniture.id)
             .limit(10)
             .all()
         )
@@ -161,6 +181,31 @@ class DashboardService:
             for item in popular_items
         ]
 
+    def _get_regional_stats(self, db: Session, start_day: date) -> List[Dict[str, Any]]:
+        delivered = DailyShipmentRollup.status == 'delivered'
+        rows = (
+            db.query(
+                DailyShipmentRollup.region,
+                func.sum(DailyShipmentRollup.shipment_count).label('count'),
+                func.sum(case((delivered, DailyShipmentRollup.shipment_count), else_=0)).label('completed')
+            )
+            .filter(DailyShipmentRollup.day >= start_day)
+            .group_by(DailyShipmentRollup.region)
+            .having(func.sum(DailyShipmentRollup.shipment_count) > 0)
+            .order_by(desc('count'))
+            .all()
+        )
+
+        return [
+            {
+                'region': row.region or '미지정',
+                'total_shipments': row.count,
+                'completed_deliveries': row.completed or 0,
+                'success_rate': (row.completed or 0) / row.count * 100
+            }
+            for row in rows
+        ]
+
     def get_user_stats(self, db: Session) -> Dict[str, Any]:
         try:
             # 전체 회원 수
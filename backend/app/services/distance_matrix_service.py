@@ -0,0 +1,135 @@
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+import hashlib
+import json
+import logging
+import struct
+import numpy as np
+from fastapi import HTTPException
+from ..core.config import settings
+from ..utils.cache_manager import LRUCache
+from .distance_providers import HaversineDistanceProvider, get_distance_provider, haversine_matrix
+
+logger = logging.getLogger(__name__)
+
+# 바이너리 응답 헤더: 행 수, 열 수 (little-endian uint32), 이후 float32 행렬 (행 우선)
+MATRIX_HEADER = struct.Struct("<II")
+
+class DistanceMatrix:
+    """행 블록 단위로 계산하는 거리 행렬 (km, float32)
+
+    전체 행렬을 미리 만들지 않고 blocks()를 순회할 때 chunk_rows행씩 계산합니다.
+    캐시 한도 안에 들어가는 크기면 순회가 끝날 때 결과를 캐시에 저장합니다.
+    """
+
+    def __init__(self, service: "DistanceMatrixService", origins: np.ndarray, destinations: np.ndarray, key: str):
+        self.service = service
+        self.origins = origins
+        self.destinations = destinations
+        self.key = key
+        self.shape = (len(origins), len(destinations))
+        self.result: Optional[np.ndarray] = None
+
+    @property
+    def nbytes(self) -> int:
+        return self.shape[0] * self.shape[1] * np.dtype(np.float32).itemsize
+
+    def blocks(self, chunk_rows: int = 256) -> Iterator[np.ndarray]:
+        cache = self.service.cache
+        cached = cache.get(self.key)
+        if cached is not None:
+            self.result = cached
+            for start in range(0, self.shape[0], chunk_rows):
+                yield cached[start:start + chunk_rows]
+            return
+
+        result = np.empty(self.shape, dtype=np.float32) if self.nbytes <= cache.max_bytes else None
+        road_factor = self.service.local_provider.road_factor
+        dest_lon, dest_lat = self.destinations[:, 0], self.destinations[:, 1]
+        for start in range(0, self.shape[0], chunk_rows):
+            origins = self.origins[start:start + chunk_rows]
+            block = (haversine_matrix(origins[:, 0], origins[:, 1], dest_lon, dest_lat) * road_factor).astype(np.float32)
+            if result is not None:
+                result[start:start + len(block)] = block
+            yield block
+
+        if result is not None:
+            result.flags.writeable = False
+            cache.set(self.key, result)
+            self.result = result
+
+    def to_array(self) -> np.ndarray:
+        blocks = list(self.blocks())
+        return self.result if self.result is not None else np.concatenate(blocks)
+
+class DistanceMatrixService:
+    """좌표 집합 간 도로 거리 행렬 계산
+
+    로컬 대원 거리 × 도로 보정 계수를 NumPy로 행 블록 단위로 계산하고,
+    같은 좌표 집합의 행렬은 캐시에서 재사용합니다. 캐시는 항목 수와
+    전체 바이트 수(cache_bytes)를 모두 제한하며, 한도보다 큰 행렬은 캐시하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        local_provider: HaversineDistanceProvider,
+        cache_size: int = 16,
+        cache_bytes: int = 64 * 1024 * 1024
+    ):
+        self.local_provider = local_provider
+        self.cache = LRUCache(maxsize=cache_size, max_bytes=cache_bytes, sizeof=lambda matrix: matrix.nbytes)
+
+    def matrix(
+        self,
+        origins: Sequence[Tuple[float, float]],
+        destinations: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> DistanceMatrix:
+        """출발지 N개 × 도착지 M개 거리 행렬 (좌표 검증만 하고 계산은 순회 시점에 수행)"""
+        origin_array = self._to_array(origins)
+        dest_array = origin_array if destinations is None else self._to_array(destinations)
+        key = self._cache_key(origin_array, dest_array, self.local_provider.road_factor)
+        return DistanceMatrix(self, origin_array, dest_array, key)
+
+    def get_matrix(
+        self,
+        origins: Sequence[Tuple[float, float]],
+        destinations: Optional[Sequence[Tuple[float, float]]] = None
+    ) -> np.ndarray:
+        """출발지 N개 × 도착지 M개 거리 행렬 전체 (km, float32)"""
+        return self.matrix(origins, destinations).to_array()
+
+    def _to_array(self, points: Sequence[Tuple[float, float]]) -> np.ndarray:
+        array = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        lon, lat = array[:, 0], array[:, 1]
+        if not (np.all(np.abs(lon) <= 180) and np.all(np.abs(lat) <= 90)):
+            raise HTTPException(status_code=400, detail="좌표는 [경도, 위도] 범위여야 합니다")
+        return array
+
+    def _cache_key(self, origins: np.ndarray, destinations: np.ndarray, road_factor: float) -> str:
+        digest = hashlib.sha256()
+        digest.update(MATRIX_HEADER.pack(len(origins), len(destinations)))
+        digest.update(np.round(origins, 6).tobytes())
+        digest.update(np.round(destinations, 6).tobytes())
+        digest.update(struct.pack("<d", road_factor))
+        return digest.hexdigest()
+
+def iter_ndjson_rows(blocks: Iterable[np.ndarray]) -> Iterator[bytes]:
+    """행 블록을 한 줄에 한 행씩 JSON 배열로 직렬화 (km, 소수점 2자리)"""
+    for block in blocks:
+        chunk = np.round(block.astype(np.float64), 2)
+        yield "".join(json.dumps(row) + "\n" for row in chunk.tolist()).encode("utf-8")
+
+def iter_binary_matrix(shape: Tuple[int, int], blocks: Iterable[np.ndarray]) -> Iterator[bytes]:
+    """헤더 뒤에 float32 행 블록을 차례로 전송"""
+    yield MATRIX_HEADER.pack(*shape)
+    for block in blocks:
+        yield np.ascontiguousarray(block, dtype="<f4").tobytes()
+
+@lru_cache()
+def get_distance_matrix_service() -> DistanceMatrixService:
+    # 보정 계수는 길찾기 폴백 백엔드와 공유 (실제 도로 거리 관측값으로 보정됨)
+    return DistanceMatrixService(
+        get_distance_provider().fallback,
+        cache_size=settings.DISTANCE_MATRIX_CACHE_SIZE,
+        cache_bytes=settings.DISTANCE_MATRIX_CACHE_BYTES
+    )
@@ -0,0 +1,185 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Optional, Sequence
+import asyncio
+import logging
+import time
+import httpx
+import numpy as np
+from ..core.config import settings
+from .kakao_directions import KakaoDirectionsClient, get_kakao_directions_client
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+# 좌표는 카카오 API와 같은 형식 {"x": 경도, "y": 위도}
+Point = Dict[str, float]
+
+def haversine_matrix(
+    origin_lon: np.ndarray,
+    origin_lat: np.ndarray,
+    dest_lon: np.ndarray,
+    dest_lat: np.ndarray
+) -> np.ndarray:
+    """출발지 N개 × 도착지 M개의 대원 거리 행렬 (km)"""
+    lon1 = np.radians(np.asarray(origin_lon, dtype=np.float64))[:, None]
+    lat1 = np.radians(np.asarray(origin_lat, dtype=np.float64))[:, None]
+    lon2 = np.radians(np.asarray(dest_lon, dtype=np.float64))[None, :]
+    lat2 = np.radians(np.asarray(dest_lat, dtype=np.float64))[None, :]
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    return float(haversine_matrix([lon1], [lat1], [lon2], [lat2])[0, 0])
+
+def _coordinates(points: Sequence[Point]):
+    lon = np.fromiter((float(point['x']) for point in points), dtype=np.float64, count=len(points))
+    lat = np.fromiter((float(point['y']) for point in points), dtype=np.float64, count=len(points))
+    return lon, lat
+
+class DistanceProvider(ABC):
+    """도로 거리 계산 백엔드"""
+
+    name: str = ""
+
+    @abstractmethod
+    async def distance_km(self, start: Point, end: Point) -> float:
+        """두 지점 사이 도로 거리 (km, 소수점 1자리)"""
+
+    @abstractmethod
+    async def distance_matrix(self, origins: Sequence[Point], destinations: Sequence[Point]) -> np.ndarray:
+        """출발지 N개 × 도착지 M개 도로 거리 행렬 (km)"""
+
+class KakaoDistanceProvider(DistanceProvider):
+    """카카오 모빌리티 길찾기 API 기반 거리"""
+
+    name = "kakao"
+
+    def __init__(self, client: KakaoDirectionsClient, max_concurrency: int = 10):
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+    async def distance_km(self, start: Point, end: Point) -> float:
+        return await self.client.get_distance_km(start, end)
+
+    async def distance_matrix(self, origins: Sequence[Point], destinations: Sequence[Point]) -> np.ndarray:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(start: Point, end: Point) -> float:
+            async with semaphore:
+                return await self.client.get_distance_km(start, end)
+
+        distances = await asyncio.gather(*(
+            fetch(start, end) for start in origins for end in destinations
+        ))
+        return np.array(distances, dtype=np.float64).reshape(len(origins), len(destinations))
+
+class HaversineDistanceProvider(DistanceProvider):
+    """대원 거리에 도로 보정 계수를 곱한 로컬 거리 (외부 호출 없음)
+
+    실제 도로 거리 관측값이 min_samples개 이상 쌓이면 보정 계수로
+    관측 비율(도로 거리 / 대원 거리)의 중앙값을 사용합니다.
+    """
+
+    name = "haversine"
+
+    def __init__(self, road_factor: float = 1.3, max_samples: int = 1000, min_samples: int = 20):
+        self.default_road_factor = road_factor
+        self.min_samples = min_samples
+        self._ratios: deque = deque(maxlen=max_samples)
+        self._calibrated_factor: Optional[float] = None
+
+    @property
+    def road_factor(self) -> float:
+        return self._calibrated_factor or self.default_road_factor
+
+    def observe(self, start: Point, end: Point, road_km: float) -> None:
+        """실제 도로 거리로 보정 계수 갱신"""
+        straight_km = haversine_km(float(start['y']), float(start['x']), float(end['y']), float(end['x']))
+        # 너무 가까운 구간은 비율이 불안정하므로 제외
+        if straight_km < 1.0 or road_km <= 0:
+            return
+        self._ratios.append(road_km / straight_km)
+        if len(self._ratios) >= self.min_samples:
+            self._calibrated_factor = float(np.median(self._ratios))
+
+    async def distance_km(self, start: Point, end: Point) -> float:
+        return float(np.round(self.matrix_km([start], [end])[0, 0], 1))
+
+    async def distance_matrix(self, origins: Sequence[Point], destinations: Sequence[Point]) -> np.ndarray:
+        return self.matrix_km(origins, destinations)
+
+    def matrix_km(self, origins: Sequence[Point], destinations: Sequence[Point]) -> np.ndarray:
+        origin_lon, origin_lat = _coordinates(origins)
+        dest_lon, dest_lat = _coordinates(destinations)
+        return haversine_matrix(origin_lon, origin_lat, dest_lon, dest_lat) * self.road_factor
+
+# 기본 백엔드 장애로 보고 cooldown 동안 호출을 멈추는 오류 (경로 없음/4xx 응답 등은 해당 요청만 로컬 계산)
+PRIMARY_OUTAGE_ERRORS = (asyncio.TimeoutError, httpx.TransportError)
+
+class FallbackDistanceProvider(DistanceProvider):
+    """기본 백엔드가 지연 예산을 넘기거나 실패하면 로컬 백엔드로 전환
+
+    시간 초과/전송 오류가 나면 cooldown 동안 기본 백엔드를 호출하지 않고 바로
+    로컬 계산을 사용합니다. 거리 행렬은 N×M번의 API 호출이 필요하므로 항상
+    로컬에서 계산합니다.
+    """
+
+    name = "fallback"
+
+    def __init__(
+        self,
+        primary: DistanceProvider,
+        fallback: HaversineDistanceProvider,
+        latency_budget: float = 1.5,
+        cooldown: float = 30.0
+    ):
+        self.primary = primary
+        self.fallback = fallback
+        self.latency_budget = latency_budget
+        self.cooldown = cooldown
+        self.fallback_count = 0
+        self._primary_disabled_until = 0.0
+
+    async def distance_km(self, start: Point, end: Point) -> float:
+        if self._primary_available():
+            try:
+                distance = await asyncio.wait_for(self.primary.distance_km(start, end), self.latency_budget)
+                self.fallback.observe(start, end, distance)
+                return distance
+            except PRIMARY_OUTAGE_ERRORS as e:
+                self._disable_primary(e)
+            except Exception as e:
+                logger.info(f"{self.primary.name} 거리 계산 실패 ({e!r}), 이번 요청만 로컬 계산 사용")
+        self.fallback_count += 1
+        return await self.fallback.distance_km(start, end)
+
+    async def distance_matrix(self, origins: Sequence[Point], destinations: Sequence[Point]) -> np.ndarray:
+        return await self.fallback.distance_matrix(origins, destinations)
+
+    def _primary_available(self) -> bool:
+        return time.monotonic() >= self._primary_disabled_until
+
+    def _disable_primary(self, error: Exception) -> None:
+        reason = "지연 예산 초과" if isinstance(error, asyncio.TimeoutError) else repr(error)
+        logger.warning(f"{self.primary.name} 거리 계산 실패 ({reason}), {self.cooldown}초간 로컬 계산 사용")
+        self._primary_disabled_until = time.monotonic() + self.cooldown
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "fallback_count": self.fallback_count,
+            "road_factor": self.fallback.road_factor,
+            "primary_available": self._primary_available()
+        }
+
+@lru_cache()
+def get_distance_provider() -> FallbackDistanceProvider:
+    return FallbackDistanceProvider(
+        KakaoDistanceProvider(get_kakao_directions_client()),
+        HaversineDistanceProvider(road_factor=settings.DISTANCE_ROAD_FACTOR),
+        latency_budget=settings.DISTANCE_LATENCY_BUDGET_SECONDS,
+        cooldown=settings.DISTANCE_FALLBACK_COOLDOWN_SECONDS
+    )
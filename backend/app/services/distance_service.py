@@ -1,36 +1,27 @@
-import aiohttp
-from typing import Dict
+from typing import Dict, Optional, Sequence
 import logging
+import numpy as np
+from .distance_providers import DistanceProvider, get_distance_provider
 
 logger = logging.getLogger(__name__)
 
 class DistanceService:
-    def __init__(self, api_key: str):
-        self.api_key = api_key
-        self.base_url = "https://apis-navi.kakaomobility.com/v1/directions"
+    def __init__(self, provider: Optional[DistanceProvider] = None):
+        # 기본값: 카카오 길찾기, 지연/장애 시 로컬 대원 거리 계산으로 전환
+        self.provider = provider or get_distance_provider()
     
     async def calculate_distance(self, start: Dict, end: Dict) -> float:
-        """카카오 모빌리티 API를 사용하여 실제 도로 기준 거리 계산"""
+        """실제 도로 기준 거리 계산 (km)"""
         try:
-            headers = {"Authorization": f"KakaoAK {self.api_key}"}
-            params = {
-                "origin": f"{start['x']},{start['y']}",
-                "destination": f"{end['x']},{end['y']}"
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    self.base_url,
-                    headers=headers,
-                    params=params
-                ) as response:
-                    if response.status != 200:
-                        raise ValueError("카카오 API 호출 실패")
-                    
-                    data = await response.json()
-                    # 미터 단위를 킬로미터로 변환
-                    return round(data['routes'][0]['summary']['distance'] / 1000, 1)
-                    
+            return await self.provider.distance_km(start, end)
         except Exception as e:
             logger.error(f"거리 계산 중 오류 발생: {str(e)}")
-            raise 
\ No newline at end of file
+            raise
+
+    async def calculate_distance_matrix(self, origins: Sequence[Dict], destinations: Sequence[Dict]) -> np.ndarray:
+        """출발지 N개 × 도착지 M개 도로 거리 행렬 (km, 기본 provider는 로컬 보정 대원 거리로 계산)"""
+        try:
+            return await self.provider.distance_matrix(origins, destinations)
+        except Exception as e:
+            logger.error(f"거리 행렬 계산 중 오류 발생: {str(e)}")
+            raise
@@ -0,0 +1,160 @@
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import logging
+import os
+import threading
+import time
+import pandas as pd
+from ..utils.http_cache import PrecomputedJSON
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CSV_PATH = Path(__file__).parent.parent.parent / 'data' / 'furniture_data.csv'
+
+EMPTY_LISTING = PrecomputedJSON([])
+
+
+class CatalogSnapshot:
+    """특정 시점의 가구 카탈로그 (읽기 전용 인덱스)"""
+
+    def __init__(self, records: List[Dict[str, Any]], mtime: float):
+        self.mtime = mtime
+        items = tuple(MappingProxyType(record) for record in records)
+
+        by_id: Dict[str, Mapping[str, Any]] = {}
+        by_subcategory: Dict[Tuple[str, str], List[Mapping[str, Any]]] = {}
+        by_category: Dict[str, List[Mapping[str, Any]]] = {}
+        for item in items:
+            # 중복 id는 CSV 상의 첫 번째 행을 사용
+            by_id.setdefault(item['id'], item)
+            by_subcategory.setdefault((item['category'], item['subcategory']), []).append(item)
+            by_category.setdefault(item['category'], []).append(item)
+
+        self.items = items
+        self.by_id = MappingProxyType(by_id)
+        self.by_subcategory = MappingProxyType(
+            {key: tuple(value) for key, value in by_subcategory.items()}
+        )
+        self.by_category = MappingProxyType(
+            {key: tuple(value) for key, value in by_category.items()}
+        )
+
+        # 카테고리별 대표 상품: 서브카테고리별 첫 번째 상품 (서브카테고리 이름순)
+        representatives: Dict[str, Tuple[Mapping[str, Any], ...]] = {}
+        for category, category_items in self.by_category.items():
+            first_by_subcategory: Dict[str, Mapping[str, Any]] = {}
+            for item in category_items:
+                if item['subcategory'] is not None:
+                    first_by_subcategory.setdefault(item['subcategory'], item)
+            representatives[category] = tuple(
+                MappingProxyType({
+                    'id': item['id'],
+                    'name': subcategory,
+                    'description': item['description'],
+                    'base_price': item['base_price']
+                })
+                for subcategory, item in sorted(first_by_subcategory.items())
+            )
+        self.representatives = MappingProxyType(representatives)
+
+        # 카테고리별 목록 응답은 스냅샷마다 한 번만 직렬화
+        self.listings = MappingProxyType({
+            category: PrecomputedJSON([dict(item) for item in category_items])
+            for category, category_items in representatives.items()
+        })
+
+    @classmethod
+    def from_csv(cls, csv_path: Path) -> 'CatalogSnapshot':
+        mtime = os.stat(csv_path).st_mtime
+        df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype={'id': str})
+        df = df.dropna(subset=['id'])
+        df['base_price'] = pd.to_numeric(df['base_price'], errors='coerce').fillna(0).astype(float)
+
+        columns = ['id', 'category', 'subcategory', 'name', 'description', 'base_price']
+        df = df[columns].astype(object).where(pd.notna(df[columns]), None)
+        return cls(df.to_dict('records'), mtime)
+
+
+class FurnitureCatalog:
+    """furniture_data.csv를 한 번만 읽어 메모리 인덱스로 제공하는 카탈로그
+
+    파일 수정 시각(mtime)이 바뀌면 새 스냅샷을 만든 뒤 참조만 교체하므로
+    요청 처리 중에는 항상 완전한 스냅샷 하나만 보게 됩니다.
+    """
+
+    def __init__(self, csv_path: Path = CATALOG_CSV_PATH, check_interval: float = 1.0):
+        self.csv_path = Path(csv_path)
+        self.check_interval = check_interval
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._last_checked = 0.0
+        self._lock = threading.Lock()
+
+    def load(self) -> CatalogSnapshot:
+        """CSV를 다시 읽어 스냅샷을 교체"""
+        with self._lock:
+            return self._reload()
+
+    def _reload(self) -> CatalogSnapshot:
+        snapshot = CatalogSnapshot.from_csv(self.csv_path)
+        self._snapshot = snapshot
+        self._last_checked = time.monotonic()
+        logger.info(f"가구 카탈로그 로드 완료: {len(snapshot.items)}개 상품")
+        return snapshot
+
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.load()
+
+        now = time.monotonic()
+        if now - self._last_checked < self.check_interval:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is not snapshot:
+                return self._snapshot
+            self._last_checked = now
+            try:
+                if os.stat(self.csv_path).st_mtime != snapshot.mtime:
+                    return self._reload()
+            except Exception as e:
+                # 파일 교체 중 오류가 나면 기존 스냅샷을 계속 사용
+                logger.error(f"가구 카탈로그 재로드 중 오류 발생: {str(e)}")
+            return snapshot
+
+    def get_item(self, item_id: str) -> Optional[Mapping[str, Any]]:
+        return self.snapshot.by_id.get(item_id)
+
+    def get_category_items(self, category_id: str) -> List[Dict[str, Any]]:
+        """카테고리별 대표 상품 (서브카테고리 단위)"""
+        return [dict(item) for item in self.snapshot.representatives.get(category_id, ())]
+
+    def get_category_listing(self, category_id: str) -> PrecomputedJSON:
+        """카테고리별 대표 상품 목록의 직렬화된 응답"""
+        return self.snapshot.listings.get(category_id, EMPTY_LISTING)
+
+    def get_related_items(self, category_id: str, item_id: str) -> Optional[List[Dict[str, Any]]]:
+        """선택한 상품과 같은 서브카테고리의 모든 옵션 (상품이 없으면 None)"""
+        snapshot = self.snapshot
+        selected_item = snapshot.by_id.get(item_id)
+        if selected_item is None:
+            return None
+
+        related_items = snapshot.by_subcategory.get((category_id, selected_item['subcategory']), ())
+        return [
+            {
+                'id': item['id'],
+                'name': item['name'],
+                'description': item['description'],
+                'base_price': item['base_price']
+            }
+            for item in related_items
+        ]
+
+
+@lru_cache()
+def get_furniture_catalog() -> FurnitureCatalog:
+    return FurnitureCatalog()
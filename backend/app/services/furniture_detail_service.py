@@ -1,4 +1,3 @@
-from sqlalchemy.orm import Session
 from typing import List
 import pandas as pd
 import os
@@ -10,8 +9,11 @@ from ..services.furniture_service import FurnitureService
 logger = logging.getLogger(__name__)
 
 class FurnitureDetailService:
-    def get_item_details(self, db: Session, category_id: str, item_name: str) -> List[FurnitureDetailResponse]:
-        """상품 상세 옵션 조회"""
+    def __init__(self):
+        self.furniture_service = FurnitureService()
+
+    def get_item_details(self, category_id: str, item_name: str) -> List[FurnitureDetailResponse]:
+        """상품 상세 옵션 조회 (카테고리 대표 상품 기준, DB 조회 없음)"""
         try:
             logger.info(f"상세 정보 조회 요청 - 카테고리: {category_id}, 아이템: {item_name}")
             
@@ -20,8 +22,7 @@ class FurnitureDetailService:
             logger.info(f"추출된 인덱스: {index}")
             
             # furniture_service에서 카테고리 아이템 목록 가져오기
-            furniture_service = FurnitureService()
-            items = furniture_service.get_items_by_category(db, category_id)
+            items = self.furniture_service.get_items_by_category(category_id)
             logger.info(f"조회된 아이템 수: {len(items)}")
             
             if not items or index > len(items):
@@ -29,8 +30,8 @@ class FurnitureDetailService:
                 return []
             
             selected_item = items[index - 1]
-            subcategory = selected_item['name']
-            base_price = selected_item['basePrice']
+            subcategory = selected_item.name
+            base_price = selected_item.basePrice
             logger.info(f"선택된 아이템 - 서브카테고리: {subcategory}, 기본가격: {base_price}")
             
             # 상세 옵션 생성
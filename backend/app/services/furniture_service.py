@@ -1,65 +1,102 @@
 from fastapi import HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy import insert
 import pandas as pd
-from typing import List, Dict, Any
+import numpy as np
+from typing import List, Dict, Any, Optional
 from ..models.furniture import Furniture
 import logging
 import os
+import time
 import chardet
 from ..schemas.furniture import FurnitureDetailResponse
 from ..schemas.item import ItemResponse
+from ..utils.http_cache import PrecomputedJSON
+from .furniture_catalog import FurnitureCatalog, get_furniture_catalog
 
 logger = logging.getLogger(__name__)
 
+CATEGORY_IDS = (
+    "bedroom-living", "kitchen", "study", "etc",
+    "digital-appliances", "exercise-transport"
+)
+
 class FurnitureService:
-    def import_csv_data(self, db: Session):
-        """CSV 파일에서 가구 데이터를 임포트"""
+    def __init__(self, catalog: Optional[FurnitureCatalog] = None):
+        self._catalog = catalog
+        self._all_categories_listing: Optional[PrecomputedJSON] = None
+
+    @property
+    def catalog(self) -> FurnitureCatalog:
+        return self._catalog or get_furniture_catalog()
+
+    def import_csv_data(
+        self,
+        db: Session,
+        csv_path: Optional[str] = None,
+        batch_size: int = 10000
+    ) -> Dict[str, Any]:
+        """CSV 파일에서 가구 데이터를 임포트
+
+        기존 데이터 삭제와 일괄 삽입을 하나의 트랜잭션에서 수행하므로
+        임포트 도중에도 다른 연결에서는 이전 카탈로그가 그대로 보입니다.
+        """
         try:
-            current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            csv_path = os.path.join(current_dir, 'data', 'furniture_data.csv')
+            if csv_path is None:
+                current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                csv_path = os.path.join(current_dir, 'data', 'furniture_data.csv')
             
-            print(f"현재 디렉토리: {current_dir}")
-            print(f"CSV 파일 경로: {csv_path}")
+            logger.info(f"CSV 파일 경로: {csv_path}")
             
             if not os.path.exists(csv_path):
                 raise FileNotFoundError(f"CSV 파일을 찾을 수 없습니다: {csv_path}")
             
-            df = pd.read_csv(csv_path, encoding='utf-8-sig')
-            
-            # 중복 ID 체크 및 제거
-            df = df.drop_duplicates(subset=['id'], keep='first')
-            
-            # 기존 데이터 삭제
-            db.query(Furniture).delete()
-            db.commit()  # 삭제 후 즉시 커밋
-            
-            # 데이터 검증 및 삽입
-            for _, row in df.iterrows():
-                if pd.isna(row['id']) or pd.isna(row['name']):
-                    continue
-                    
-                price_type = 'contact' if float(row['base_price']) == 0 else 'fixed'
-                furniture = Furniture(
-                    id=str(row['id']).strip(),  # 공백 제거
-                    category=str(row['category']).strip() if not pd.isna(row['category']) else None,
-                    subcategory=str(row['subcategory']).strip() if not pd.isna(row['subcategory']) else None,
-                    name=str(row['name']).strip(),
-                    description=str(row['description']).strip() if not pd.isna(row['description']) else None,
-                    base_price=float(row['base_price']),
-                    price_type=price_type
-                )
-                db.add(furniture)
+            started_at = time.perf_counter()
+            df = pd.read_csv(csv_path, encoding='utf-8-sig', dtype=str)
+            records = self._prepare_furniture_records(df)
             
+            # 기존 데이터 삭제 후 일괄 삽입 (커밋은 마지막에 한 번만)
+            db.query(Furniture).delete(synchronize_session=False)
+            for start in range(0, len(records), batch_size):
+                db.execute(insert(Furniture.__table__), records[start:start + batch_size])
             db.commit()
-            logger.info("가구 데이터 임포트 완료")
-            return True
+            # 이 프로세스의 카탈로그 응답 무효화 (다른 워커는 CSV 수정 시각이 바뀌면 다시 읽음)
+            self._all_categories_listing = None
+            self.catalog.load()
+            
+            elapsed = time.perf_counter() - started_at
+            rows_per_second = len(records) / elapsed if elapsed > 0 else float(len(records))
+            logger.info(
+                f"가구 데이터 임포트 완료: {len(records)}건, "
+                f"{elapsed:.2f}초 ({rows_per_second:,.0f} rows/s)"
+            )
+            return {
+                "rows": len(records),
+                "elapsed_seconds": elapsed,
+                "rows_per_second": rows_per_second
+            }
             
         except Exception as e:
             db.rollback()
             logger.error(f"가구 데이터 임포트 중 오류 발생: {str(e)}")
             raise HTTPException(status_code=500, detail="데이터 임포트 중 오류가 발생했습니다")
 
-    def get_items_by_category(self, category_id: str, db: Session):
+    def _prepare_furniture_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """임포트할 가구 데이터를 컬럼 단위로 정제"""
+        df = df.dropna(subset=['id', 'name'])
+        
+        # 공백 제거
+        text_columns = ['id', 'category', 'subcategory', 'name', 'description']
+        cleaned = pd.DataFrame({column: df[column].str.strip() for column in text_columns})
+        cleaned['base_price'] = df['base_price'].astype(float)
+        
+        # 중복 ID 체크 및 제거 (공백을 제거한 ID 기준)
+        cleaned = cleaned.drop_duplicates(subset=['id'], keep='first')
+        cleaned['price_type'] = np.where(cleaned['base_price'] == 0, 'contact', 'fixed')
+        
+        return cleaned.astype(object).where(cleaned.notna(), None).to_dict('records')
+
+    def get_items_by_category(self, category_id: str, db: Optional[Session] = None):
         """카테고리별 대표 상품 조회"""
         category_mapping = {
             'bedroom-living': ['침대', '쇼파', '옷장', '행거', '수납장', '식탁', '화장대', '커튼', '거울'],
@@ -100,4 +137,16 @@ class FurnitureService:
             raise HTTPException(
                 status_code=500,
                 detail=f"아이템 조회 중 오류가 발생했습니다: {str(e)}"
-            )
\ No newline at end of file
+            )
+
+    def get_all_categories_listing(self) -> PrecomputedJSON:
+        """전체 카테고리 대표 상품 목록 (직렬화된 응답 본문을 한 번만 생성)"""
+        if self._all_categories_listing is None:
+            result = {}
+            for category in CATEGORY_IDS:
+                try:
+                    result[category] = self.get_items_by_category(category, None)
+                except Exception:
+                    result[category] = []
+            self._all_categories_listing = PrecomputedJSON(result)
+        return self._all_categories_listing
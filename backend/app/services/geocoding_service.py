@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import re
+import unicodedata
+import httpx
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..database import SessionLocal
+from ..models.geocode_cache import GeocodeCache
+from ..utils.cache_manager import LRUCache
+from ..utils.http_client import get_http_client
+from ..utils.single_flight import SingleFlight, get_single_flight
+
+logger = logging.getLogger(__name__)
+
+KAKAO_ADDRESS_SEARCH_URL = "https://dapi.kakao.com/v2/local/search/address"
+
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (유니코드 NFC, 공백 정리, 소문자)"""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", query)).strip().lower()
+
+class GeocodingService:
+    """비동기 주소 검색 (카카오 로컬 API) + 2단계 캐시
+
+    1단계는 프로세스 내 LRU, 2단계는 geocode_cache 테이블이며 재시작 후에도
+    유지됩니다. 두 계층 모두 처음 조회한 시점부터 store_ttl이 지나면 만료됩니다.
+    같은 검색어(정규화 기준)에 대한 동시 요청은 외부 API를 한 번만 호출합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_size: int = 10000,
+        store_ttl: timedelta = timedelta(days=30),
+        session_factory: Callable[[], Session] = SessionLocal,
+        http_client: Optional[httpx.AsyncClient] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
+        self.api_key = api_key
+        self.store_ttl = store_ttl
+        self.session_factory = session_factory
+        self.memory_cache = LRUCache(maxsize=cache_size, ttl=store_ttl.total_seconds())
+        self.upstream_calls = 0
+        self.single_flight = single_flight or SingleFlight("geocode")
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client or get_http_client()
+
+    async def search(self, query: str) -> List[Dict[str, Any]]:
+        key = normalize_query(query)
+        if not key:
+            return []
+
+        documents = self.memory_cache.get(key)
+        if documents is not None:
+            return documents
+
+        # 같은 검색어를 처리 중인 요청이 있으면 그 결과를 함께 사용
+        return await self.single_flight.do(key, lambda: self._load(key, query))
+
+    async def _load(self, key: str, query: str) -> List[Dict[str, Any]]:
+        stored = await asyncio.to_thread(self._read_store, key)
+        if stored is None:
+            # 정규화는 캐시 키에만 사용하고 외부 API에는 사용자가 입력한 검색어를 보냄
+            documents = await self._fetch(query)
+            await asyncio.to_thread(self._write_store, key, documents)
+            self.memory_cache.set(key, documents)
+        else:
+            documents, updated_at = stored
+            self.memory_cache.set(key, documents, ttl=self._remaining_ttl(updated_at))
+        return documents
+
+    def _remaining_ttl(self, updated_at: datetime) -> float:
+        """저장소 항목이 만료될 때까지 남은 시간 (초)"""
+        return (updated_at + self.store_ttl - datetime.utcnow()).total_seconds()
+
+    async def _fetch(self, query: str) -> List[Dict[str, Any]]:
+        self.upstream_calls += 1
+        response = await self.http_client.get(
+            KAKAO_ADDRESS_SEARCH_URL,
+            params={"query": query},
+            headers={"Authorization": f"KakaoAK {self.api_key}"}
+        )
+        response.raise_for_status()
+        return response.json()["documents"]
+
+    def _read_store(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], datetime]]:
+        try:
+            with self.session_factory() as db:
+                entry = db.get(GeocodeCache, key)
+                if entry is None or entry.updated_at < datetime.utcnow() - self.store_ttl:
+                    return None
+                db.execute(
+                    update(GeocodeCache)
+                    .where(GeocodeCache.query == key)
+                    .values(hit_count=GeocodeCache.hit_count + 1, updated_at=entry.updated_at)
+                )
+                db.commit()
+                return entry.documents, entry.updated_at
+        except Exception as e:
+            # 저장소 장애 시에도 검색은 외부 API로 계속 동작
+            logger.error(f"주소 검색 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+
+    def _write_store(self, key: str, documents: List[Dict[str, Any]]) -> None:
+        try:
+            with self.session_factory() as db:
+                entry = db.get(GeocodeCache, key)
+                if entry is None:
+                    db.add(GeocodeCache(query=key, documents=documents, hit_count=1))
+                else:
+                    entry.documents = documents
+                    entry.hit_count = (entry.hit_count or 0) + 1
+                    entry.updated_at = datetime.utcnow()
+                db.commit()
+        except Exception as e:
+            logger.error(f"주소 검색 캐시 저장 중 오류 발생: {str(e)}")
+
+    def prewarm(self, limit: int = 500) -> int:
+        """조회가 많은 검색어를 메모리 캐시에 미리 적재"""
+        expires_after = datetime.utcnow() - self.store_ttl
+        try:
+            with self.session_factory() as db:
+                entries = (
+                    db.query(GeocodeCache.query, GeocodeCache.documents, GeocodeCache.updated_at)
+                    .filter(GeocodeCache.updated_at >= expires_after)
+                    .order_by(GeocodeCache.hit_count.desc())
+                    .limit(limit)
+                    .all()
+                )
+        except Exception as e:
+            logger.error(f"주소 검색 캐시 사전 적재 중 오류 발생: {str(e)}")
+            return 0
+
+        # 조회 수가 적은 항목부터 넣어 LRU 순서상 인기 검색어가 가장 늦게 제거되도록 함
+        for query, documents, updated_at in reversed(entries):
+            self.memory_cache.set(query, documents, ttl=self._remaining_ttl(updated_at))
+        logger.info(f"주소 검색 캐시 사전 적재: {len(entries)}건")
+        return len(entries)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.memory_cache.stats(), "upstream_calls": self.upstream_calls}
+
+@lru_cache()
+def get_geocoding_service() -> GeocodingService:
+    return GeocodingService(
+        settings.KAKAO_API_KEY,
+        cache_size=settings.GEOCODE_CACHE_SIZE,
+        store_ttl=timedelta(days=settings.GEOCODE_STORE_TTL_DAYS),
+        single_flight=get_single_flight("geocode")
+    )
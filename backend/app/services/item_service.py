@@ -1,40 +1,22 @@
 from sqlalchemy.orm import Session
-import pandas as pd
-from pathlib import Path
+from .furniture_catalog import get_furniture_catalog
+import logging
+
+logger = logging.getLogger(__name__)
 
 class ItemService:
     def __init__(self, db: Session):
         self.db = db
-        self.csv_path = Path(__file__).parent.parent.parent / 'data' / 'furniture_data.csv'
-        self.df = pd.read_csv(self.csv_path)
+        self.catalog = get_furniture_catalog()
 
     def get_item_details(self, category_id: str, item_id: str):
-        print(f"Looking for item details in CSV. category_id: {category_id}, item_id: {item_id}")
-        print(f"Available IDs in CSV: {self.df['id'].tolist()}")
+        logger.debug(f"Looking for item details in catalog. category_id: {category_id}, item_id: {item_id}")
         
         # 선택된 아이템의 subcategory 찾기
-        try:
-            selected_item = self.df[self.df['id'] == item_id].iloc[0]
-        except IndexError:
-            print(f"No item found with id: {item_id}")
+        selected_item = self.catalog.get_item(item_id)
+        if selected_item is None:
+            logger.debug(f"No item found with id: {item_id}")
             return []
         
-        subcategory = selected_item['subcategory']
-        
         # 같은 subcategory의 모든 옵션 가져오기
-        related_items = self.df[
-            (self.df['category'] == selected_item['category']) & 
-            (self.df['subcategory'] == subcategory)
-        ]
-        
-        # 상세 정보 리스트 구성
-        details = []
-        for _, item in related_items.iterrows():
-            details.append({
-                'id': item['id'],
-                'name': item['name'],
-                'description': item['description'],
-                'base_price': item['base_price']
-            })
-        
-        return details 
\ No newline at end of file
+        return self.catalog.get_related_items(selected_item['category'], item_id)
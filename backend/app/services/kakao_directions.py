@@ -0,0 +1,127 @@
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Optional
+import logging
+import httpx
+from ..core.config import settings
+from ..utils.tiered_cache import TieredCache, get_tiered_cache
+from ..utils.http_client import get_http_client
+from ..utils.single_flight import SingleFlight, get_single_flight
+
+logger = logging.getLogger(__name__)
+
+KAKAO_DIRECTIONS_URL = "https://apis-navi.kakaomobility.com/v1/directions"
+
+# 좌표 반올림 자릿수 (소수점 4자리 ≈ 10m)
+COORDINATE_PRECISION = 4
+
+def route_cache_key(origin: str, destination: str, priority: str) -> Hashable:
+    """출발지/도착지 좌표를 반올림한 캐시 키"""
+    return (_round_coordinates(origin), _round_coordinates(destination), priority)
+
+def has_route(data: Dict[str, Any]) -> bool:
+    """카카오 길찾기 응답에 경로가 있는지 (result_code 0 = 길찾기 성공)"""
+    routes = data.get("routes") or []
+    return bool(routes) and routes[0].get("result_code") == 0 and "summary" in routes[0]
+
+def _round_coordinates(point: str) -> Hashable:
+    # "x,y" 또는 "x,y,name=..." 형식, 좌표가 아니면 원문을 그대로 키로 사용
+    try:
+        x, y = point.split(",")[:2]
+        return (round(float(x), COORDINATE_PRECISION), round(float(y), COORDINATE_PRECISION))
+    except ValueError:
+        return point
+
+class KakaoDirectionsClient:
+    """카카오 모빌리티 길찾기 API 클라이언트
+
+    공유 HTTP 클라이언트의 연결 풀을 사용하고, 같은 경로(반올림 좌표 기준)의
+    응답은 경로 캐시(로컬 LRU + Redis)에서 반환하므로 반복 견적은 외부 API를
+    호출하지 않습니다. Redis 계층은 모든 워커가 공유합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        cache_size: int = 10000,
+        cache_ttl: float = 86400,
+        http_client: Optional[httpx.AsyncClient] = None,
+        single_flight: Optional[SingleFlight] = None,
+        route_cache: Optional[TieredCache] = None
+    ):
+        self.api_key = api_key
+        self.route_cache = route_cache or TieredCache(
+            "directions", ttl=cache_ttl, local_ttl=cache_ttl, local_maxsize=cache_size
+        )
+        self.upstream_calls = 0
+        self.single_flight = single_flight or SingleFlight("kakao_directions")
+        self._http_client = http_client
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        return self._http_client or get_http_client()
+
+    async def get_directions(
+        self,
+        origin: str,
+        destination: str,
+        priority: str = "RECOMMEND"
+    ) -> Dict[str, Any]:
+        """경로 조회 (httpx.HTTPError는 호출자에게 전달)"""
+        key = route_cache_key(origin, destination, priority)
+        cached = await self.route_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # 같은 경로를 동시에 조회하면 외부 API는 한 번만 호출
+        return await self.single_flight.do(
+            key, lambda: self._fetch_directions(key, origin, destination, priority)
+        )
+
+    async def _fetch_directions(
+        self,
+        key: Hashable,
+        origin: str,
+        destination: str,
+        priority: str
+    ) -> Dict[str, Any]:
+        self.upstream_calls += 1
+        response = await self.http_client.get(
+            KAKAO_DIRECTIONS_URL,
+            params={
+                "origin": origin,
+                "destination": destination,
+                "priority": priority
+            },
+            headers={"Authorization": f"KakaoAK {self.api_key}"}
+        )
+        response.raise_for_status()
+        data = response.json()
+        # 길찾기 실패(result_code != 0)도 200으로 오므로 경로가 있는 응답만 캐시
+        if has_route(data):
+            await self.route_cache.set(key, data)
+        return data
+
+    async def get_distance_km(self, start: Dict, end: Dict) -> float:
+        """도로 기준 거리 (km, 소수점 1자리)"""
+        data = await self.get_directions(
+            f"{start['x']},{start['y']}",
+            f"{end['x']},{end['y']}"
+        )
+        # 미터 단위를 킬로미터로 변환
+        return round(data['routes'][0]['summary']['distance'] / 1000, 1)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.route_cache.stats(), "upstream_calls": self.upstream_calls}
+
+@lru_cache()
+def get_kakao_directions_client() -> KakaoDirectionsClient:
+    return KakaoDirectionsClient(
+        settings.KAKAO_REST_API_KEY,
+        single_flight=get_single_flight("kakao_directions"),
+        route_cache=get_tiered_cache(
+            "directions",
+            ttl=settings.DIRECTIONS_CACHE_TTL_SECONDS,
+            local_ttl=settings.DIRECTIONS_CACHE_TTL_SECONDS,
+            local_maxsize=settings.DIRECTIONS_CACHE_SIZE
+        )
+    )
@@ -1,4 +1,6 @@
 from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -71,24 +73,38 @@ class NotificationService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"알림 처리 중 오류가 발생했습니다: {str(e)}")
 
-    def get_user_notifications(self, db: Session, user_id: int, skip: int = 0, limit: int = 20) -> List[Notification]:
-        return db.query(Notification)\
-            .filter(Notification.user_id == user_id)\
-            .order_by(Notification.created_at.desc())\
-            .offset(skip)\
-            .limit(limit)\
-            .all()
+    async def get_user_notifications(
+        self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 20
+    ) -> List[Notification]:
+        result = await db.execute(
+            select(Notification)
+            .where(Notification.user_id == user_id)
+            .order_by(Notification.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars())
+
+    async def _get_user_notification(self, db: AsyncSession, notification_id: int, user_id: int) -> Notification:
+        notification = (await db.execute(
+            select(Notification)
+            .where(Notification.id == notification_id, Notification.user_id == user_id)
+        )).scalar_one_or_none()
 
-    def mark_as_read(self, db: Session, notification_id: int, user_id: int) -> Notification:
-        notification = db.query(Notification)\
-            .filter(Notification.id == notification_id, Notification.user_id == user_id)\
-            .first()
-        
         if not notification:
             raise HTTPException(status_code=404, detail="알림을 찾을 수 없습니다")
-            
+        return notification
+
+    async def mark_as_read(self, db: AsyncSession, notification_id: int, user_id: int) -> Notification:
+        notification = await self._get_user_notification(db, notification_id, user_id)
+
         notification.is_read = True
         notification.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(notification)
-        return notification
\ No newline at end of file
+        await db.commit()
+        await db.refresh(notification)
+        return notification
+
+    async def delete_notification(self, db: AsyncSession, notification_id: int, user_id: int) -> None:
+        notification = await self._get_user_notification(db, notification_id, user_id)
+        await db.delete(notification)
+        await db.commit()
\ No newline at end of file
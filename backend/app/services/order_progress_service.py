@@ -1,68 +1,423 @@
 from fastapi import HTTPException
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from redis.exceptions import WatchError
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from ..core.config import settings
+from ..core.redis import AsyncRedis, get_redis
+from ..database import SessionLocal
 from ..models.order_progress import OrderProgress
 from .validators.order_validator import OrderValidator
-from .price_calculator import PriceCalculator
+from .price_calculator import STEP_PRICE_COMPONENTS, get_price_calculator
+from .distance_service import DistanceService
+import asyncio
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 단계 이름 -> order_progress 컬럼 (주소 단계만 이름이 다름)
+STEP_COLUMNS = {
+    'product_selection': 'product_selection',
+    'date_selection': 'date_selection',
+    'address_input': 'address_info',
+    'additional_options': 'additional_options'
+}
+
+CURRENT_STEP_FIELD = 'current_step'
+TOTAL_PRICE_FIELD = 'total_price'
+PRICE_FIELD_PREFIX = 'price:'
+
 class OrderProgressService:
-    def __init__(self):
-        self.STEPS = ['product_selection', 'date_selection', 'address_input', 'additional_options']
+    """단계별 주문 작성 내용(드래프트) 저장소
+
+    최신 내용은 Redis 해시(단계마다 필드 하나)에 두고 단계 저장 시 해당 필드만
+    갱신합니다. order_progress 테이블에는 백그라운드 작업이 변경된 단계 컬럼만
+    모아서 한 트랜잭션으로 기록합니다 (write-behind). Redis에 없는 드래프트는
+    조회 시 테이블에서 읽어 다시 적재합니다.
+
+    요금은 단계별 구성 요소(price:* 필드)와 합계(total_price)를 함께 저장해
+    단계가 바뀌면 그 단계의 구성 요소와 합계만 다시 계산합니다.
+
+    변경 목록은 프로세스별로 관리하므로 워커가 비정상 종료되면 마지막
+    flush 이후 변경은 Redis에만 남습니다 (Redis TTL 동안은 조회 가능).
+    """
+
+    def __init__(
+        self,
+        redis: Optional[AsyncRedis] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        ttl: int = 7 * 24 * 3600,
+        flush_interval: float = 1.0,
+        flush_batch_size: int = 500,
+        key_prefix: str = "bigmove"
+    ):
+        self.STEPS = list(STEP_COLUMNS)
         self.validator = OrderValidator()
+        self.price_calculator = get_price_calculator()
+        self.distance_service = DistanceService()
+        self.session_factory = session_factory
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.key_prefix = key_prefix
+        self._redis = redis
+        self.max_retries = 5
+        # user_id -> 아직 테이블에 기록되지 않은 단계
+        self._dirty: Dict[int, Set[str]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flushed_rows = 0
+        self.flush_errors = 0
+
+    @property
+    def redis(self) -> AsyncRedis:
+        return self._redis or get_redis()
+
+    def progress_key(self, user_id: int) -> str:
+        return f"{self.key_prefix}:order_progress:{user_id}"
 
     async def save_step_data(
         self,
+        db: AsyncSession,
         user_id: int,
         step: str,
         data: Dict[str, Any]
     ) -> Dict[str, Any]:
         try:
+            if step not in STEP_COLUMNS:
+                raise HTTPException(status_code=400, detail=f"알 수 없는 단계: {step}")
+
             # 데이터 검증
             validation_method = getattr(self.validator, f'validate_{step}')
             validation_method(data)
 
-            # 이전 단계 완료 여부 확인
-            current_progress = await self.get_progress(user_id) or {}
+            # 이전 단계 완료 여부 확인 (Redis에 없으면 테이블에서 다시 적재)
             step_index = self.STEPS.index(step)
-            if step_index > 0:
-                previous_step = self.STEPS[step_index - 1]
-                if previous_step not in current_progress:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"이전 단계 ({previous_step}) 완료 필요"
-                    )
+            previous_step = self.STEPS[step_index - 1] if step_index > 0 else None
+            current_step, previous_data = await self.redis.hmget(
+                self.progress_key(user_id), CURRENT_STEP_FIELD, previous_step or CURRENT_STEP_FIELD
+            )
+            if current_step is None:
+                current_progress = await self.get_progress(db, user_id) or {}
+                previous_data = previous_step in current_progress or None
+            if previous_step and previous_data is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"이전 단계 ({previous_step}) 완료 필요"
+                )
+
+            if step == 'address_input':
+                await self._fill_distance(data)
 
+            # 바뀐 단계의 요금 구성 요소만 다시 계산
+            component = self.price_calculator.calculate_step_component(step, data)
+            await self._write_step(user_id, step, data, component)
+
+            self._mark_dirty(user_id, step, CURRENT_STEP_FIELD, TOTAL_PRICE_FIELD)
             return data
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"단계 데이터 저장 중 오류 발생: {str(e)}")
             raise HTTPException(status_code=500, detail=f"데이터 저장 실패: {str(e)}")
 
+    async def _write_step(self, user_id: int, step: str, data: Dict[str, Any], component: float) -> float:
+        """단계 필드와 요금 구성 요소/합계를 함께 갱신 (WATCH/MULTI로 동시 수정 시 재시도)"""
+        key = self.progress_key(user_id)
+        component_name = STEP_PRICE_COMPONENTS[step]
+        price_fields = [PRICE_FIELD_PREFIX + name for name in STEP_PRICE_COMPONENTS.values()]
+        for _ in range(self.max_retries):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    stored = dict(zip(price_fields, await pipe.hmget(key, price_fields)))
+                    components = self._price_components(stored)
+                    components[component_name] = component
+                    total_price = self.price_calculator.combine_components(components)
+
+                    pipe.multi()
+                    pipe.hset(key, mapping={
+                        step: json.dumps(data, default=str),
+                        CURRENT_STEP_FIELD: step,
+                        PRICE_FIELD_PREFIX + component_name: repr(float(component)),
+                        TOTAL_PRICE_FIELD: repr(float(total_price))
+                    })
+                    pipe.expire(key, self.ttl)
+                    await pipe.execute()
+                    return total_price
+                except WatchError:
+                    # 같은 사용자의 다른 단계가 먼저 저장되었으면 다시 읽어서 계산
+                    continue
+        logger.error(f"주문 진행상황 갱신 재시도 초과: {user_id}")
+        raise RuntimeError("주문 진행상황이 동시에 수정되어 저장하지 못했습니다")
+
+    def _price_components(self, stored: Dict[str, Any]) -> Dict[str, float]:
+        # 저장되지 않은 구성 요소는 빈 단계 기준 값 (전체 계산과 같은 기본값)
+        components = {}
+        for step, name in STEP_PRICE_COMPONENTS.items():
+            value = stored.get(PRICE_FIELD_PREFIX + name)
+            components[name] = (
+                float(value) if value is not None
+                else self.price_calculator.calculate_step_component(step, {})
+            )
+        return components
+
+    async def _fill_distance(self, data: Dict[str, Any]) -> None:
+        """좌표가 있고 거리가 없으면 도로 거리(distance_km) 계산"""
+        if 'distance_km' in data:
+            return
+        start, end = data['loading_address'], data['unloading_address']
+        if not all(key in point for point in (start, end) for key in ('x', 'y')):
+            return
+        # 길찾기 API가 느리거나 장애면 로컬 거리 계산 결과가 사용됨
+        data['distance_km'] = await self.distance_service.calculate_distance(start, end)
+
     async def get_progress(
         self,
+        db: AsyncSession,
         user_id: int
     ) -> Optional[Dict[str, Any]]:
+        progress, _ = await self.get_progress_and_price(db, user_id)
+        return progress
+
+    async def get_progress_and_price(
+        self,
+        db: AsyncSession,
+        user_id: int
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, float]]:
+        """드래프트와 저장된 요금 상세를 한 번에 조회 (재계산 없음)"""
         try:
-            return None
+            fields = await self.redis.hgetall(self.progress_key(user_id))
+            if fields:
+                values = self._decode(fields)
+            else:
+                # Redis에 없으면 테이블에서 읽어 다시 적재
+                progress = await self._read_row(db, user_id)
+                values = await self._warm(user_id, progress) if progress else {}
+
+            progress = {
+                name: value for name, value in values.items()
+                if name in STEP_COLUMNS or name == CURRENT_STEP_FIELD
+            }
+            return progress or None, self._price_details(values, progress)
         except Exception as e:
             logger.error(f"진행상황 조회 중 오류 발생: {str(e)}")
             raise HTTPException(status_code=500, detail=f"진행상황 조회 실패: {str(e)}")
 
     async def calculate_current_price(
         self,
+        db: AsyncSession,
         user_id: int
     ) -> float:
         try:
-            current_progress = await self.get_progress(user_id)
+            current_progress, price = await self.get_progress_and_price(db, user_id)
             if not current_progress:
                 return 0.0
-                
-            calculator = PriceCalculator()
-            total_price = calculator.calculate_total_price(current_progress)
-            return total_price
-            
+            return price[TOTAL_PRICE_FIELD]
+
         except Exception as e:
             logger.error(f"가격 계산 중 오류 발생: {str(e)}")
-            return 0.0 
\ No newline at end of file
+            return 0.0
+
+    def _price_details(self, values: Dict[str, Any], progress: Dict[str, Any]) -> Dict[str, float]:
+        if TOTAL_PRICE_FIELD not in values:
+            # 요금 필드가 없는 이전 형식의 드래프트는 전체 계산
+            components = self.price_calculator.calculate_components(progress)
+            total_price = self.price_calculator.combine_components(components)
+        else:
+            components = self._price_components(values)
+            total_price = values[TOTAL_PRICE_FIELD]
+        return {**components, TOTAL_PRICE_FIELD: total_price}
+
+    async def clear_progress(self, user_id: int, db: Optional[AsyncSession] = None) -> None:
+        """주문 확정 후 드래프트 삭제 (Redis와 테이블 모두)"""
+        # 진행 중인 flush가 삭제 후 행을 다시 만들지 않도록 잠금 안에서 처리
+        async with self._flush_lock:
+            self._dirty.pop(user_id, None)
+            await self.redis.delete(self.progress_key(user_id))
+            if db is not None:
+                await self._delete_row(db, user_id)
+            else:
+                await asyncio.to_thread(self._delete_rows_in_session, user_id)
+
+    # Redis 해시 <-> 드래프트 변환
+    def _decode(self, fields: Dict[bytes, bytes]) -> Dict[str, Any]:
+        values: Dict[str, Any] = {}
+        for name, value in fields.items():
+            name = name.decode()
+            if name == CURRENT_STEP_FIELD:
+                values[name] = value.decode()
+            elif name in STEP_COLUMNS:
+                values[name] = json.loads(value)
+            elif name == TOTAL_PRICE_FIELD or name.startswith(PRICE_FIELD_PREFIX):
+                values[name] = float(value)
+        return values
+
+    async def _warm(self, user_id: int, progress: Dict[str, Any]) -> Dict[str, Any]:
+        """테이블에서 읽은 드래프트를 요금 구성 요소와 함께 Redis에 적재
+
+        테이블을 읽는 사이 다른 요청이 먼저 저장했으면 덮어쓰지 않고 Redis 값을 사용합니다.
+        """
+        components = self.price_calculator.calculate_components(progress)
+        values = {
+            **progress,
+            **{PRICE_FIELD_PREFIX + name: value for name, value in components.items()},
+            TOTAL_PRICE_FIELD: self.price_calculator.combine_components(components)
+        }
+        mapping = {
+            name: json.dumps(value, default=str) if name in STEP_COLUMNS
+            else value if name == CURRENT_STEP_FIELD
+            else repr(float(value))
+            for name, value in values.items()
+        }
+        key = self.progress_key(user_id)
+        for _ in range(self.max_retries):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    if await pipe.exists(key):
+                        return self._decode(await pipe.hgetall(key))
+
+                    pipe.multi()
+                    pipe.hset(key, mapping=mapping)
+                    pipe.expire(key, self.ttl)
+                    await pipe.execute()
+                    return values
+                except WatchError:
+                    # 적재 직전에 단계가 저장되었으면 다시 확인
+                    continue
+        logger.error(f"주문 진행상황 적재 재시도 초과: {user_id}")
+        raise RuntimeError("주문 진행상황이 동시에 수정되어 적재하지 못했습니다")
+
+    # order_progress 테이블
+    async def _read_row(self, db: AsyncSession, user_id: int) -> Optional[Dict[str, Any]]:
+        row = (await db.execute(
+            select(OrderProgress)
+            .where(OrderProgress.user_id == user_id)
+            .order_by(OrderProgress.id.desc())
+            .limit(1)
+        )).scalar_one_or_none()
+        if row is None:
+            return None
+        progress = {
+            step: getattr(row, column)
+            for step, column in STEP_COLUMNS.items()
+            if getattr(row, column) is not None
+        }
+        if progress and row.current_step:
+            progress[CURRENT_STEP_FIELD] = row.current_step
+        return progress or None
+
+    async def _delete_row(self, db: AsyncSession, user_id: int) -> None:
+        await db.execute(delete(OrderProgress).where(OrderProgress.user_id == user_id))
+        await db.commit()
+
+    def _delete_rows_in_session(self, user_id: int) -> None:
+        with self.session_factory() as db:
+            db.query(OrderProgress).filter(OrderProgress.user_id == user_id).delete(synchronize_session=False)
+            db.commit()
+
+    # write-behind
+    def _mark_dirty(self, user_id: int, *fields: str) -> None:
+        self._dirty.setdefault(user_id, set()).update(fields)
+        self.start_flusher()
+
+    def start_flusher(self) -> None:
+        """주기적으로 변경분을 테이블에 기록하는 작업 시작 (이미 실행 중이면 무시)"""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def stop_flusher(self) -> None:
+        """작업을 멈추고 남은 변경분을 모두 기록 (앱 종료 시)"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        while self._dirty:
+            if not await self.flush():
+                break
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            if self._dirty:
+                await self.flush()
+
+    async def flush(self) -> int:
+        """변경된 드래프트를 최대 flush_batch_size건씩 한 트랜잭션으로 기록"""
+        async with self._flush_lock:
+            user_ids = list(self._dirty)[:self.flush_batch_size]
+            batch = {user_id: self._dirty.pop(user_id) for user_id in user_ids}
+            if not batch:
+                return 0
+
+            try:
+                # 배치의 드래프트를 파이프라인 한 번으로 조회
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    for user_id in batch:
+                        pipe.hgetall(self.progress_key(user_id))
+                    results = await pipe.execute()
+
+                updates = {}
+                for (user_id, fields), values in zip(batch.items(), results):
+                    # 만료되었거나 삭제된 드래프트는 기록하지 않음
+                    if values:
+                        decoded = self._decode(values)
+                        updates[user_id] = {name: decoded[name] for name in fields if name in decoded}
+                await asyncio.to_thread(self._write_rows, updates)
+            except Exception as e:
+                # 다음 주기에 다시 시도
+                self.flush_errors += 1
+                for user_id, fields in batch.items():
+                    self._dirty.setdefault(user_id, set()).update(fields)
+                logger.error(f"주문 진행상황 기록 중 오류 발생: {str(e)}")
+                return 0
+
+            self.flushed_rows += len(updates)
+            return len(updates)
+
+    def _write_rows(self, updates: Dict[int, Dict[str, Any]]) -> None:
+        if not updates:
+            return
+        with self.session_factory() as db:
+            # 사용자별로 _read_row와 같은 행(id가 가장 큰 행)을 갱신
+            rows = {}
+            query = (
+                db.query(OrderProgress)
+                .filter(OrderProgress.user_id.in_(list(updates)))
+                .order_by(OrderProgress.id.desc())
+            )
+            for row in query:
+                rows.setdefault(row.user_id, row)
+            for user_id, values in updates.items():
+                row = rows.get(user_id)
+                if row is None:
+                    row = OrderProgress(user_id=user_id)
+                    db.add(row)
+                # 변경된 컬럼만 갱신 (current_step, total_price는 이름이 같음)
+                for name, value in values.items():
+                    setattr(row, STEP_COLUMNS.get(name, name), value)
+            db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._dirty),
+            "flushed_rows": self.flushed_rows,
+            "flush_errors": self.flush_errors
+        }
+
+@lru_cache()
+def get_order_progress_service() -> OrderProgressService:
+    return OrderProgressService(
+        ttl=settings.ORDER_PROGRESS_TTL_SECONDS,
+        flush_interval=settings.ORDER_PROGRESS_FLUSH_INTERVAL_SECONDS,
+        flush_batch_size=settings.ORDER_PROGRESS_FLUSH_BATCH_SIZE,
+        key_prefix=settings.CACHE_KEY_PREFIX
+    )
@@ -1,3 +1,5 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -37,36 +39,26 @@ class OrderService:
             db.rollback()
             raise HTTPException(status_code=500, detail=f"주문 생성 실패: {str(e)}")
 
-    def get_order_by_id(self, db: Session, order_id: int) -> Optional[Order]:
-        order = db.query(Order).filter(Order.id == order_id).first()
+    async def get_order_by_id(self, db: AsyncSession, order_id: int) -> Optional[Order]:
+        order = await db.get(Order, order_id)
         if not order:
             raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
         return order
 
-    def get_orders_by_user_id(self, db: Session, user_id: int) -> List[Order]:
-        return db.query(Order).filter(Order.user_id == user_id).all()
+    async def get_orders_by_user_id(self, db: AsyncSession, user_id: int) -> List[Order]:
+        result = await db.execute(select(Order).where(Order.user_id == user_id))
+        return list(result.scalars())
 
-    def update_order_status(self, db: Session, order_id: int, new_status: str) -> Order:
-        order = self.get_order_by_id(db, order_id)
-        try:
-            order.status = new_status
-            db.commit()
-            db.refresh(order)
-            return order
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=500, detail=f"주문 상태 업데이트 중 오류가 발생했습니다: {str(e)}")
-
-    def assign_shipping_company(self, db: Session, order_id: int, company_id: int) -> Order:
-        order = self.get_order_by_id(db, order_id)
+    async def assign_shipping_company(self, db: AsyncSession, order_id: int, company_id: int) -> Order:
+        order = await self.get_order_by_id(db, order_id)
         try:
             order.shipping_company_id = company_id
             order.status = 'shipping_assigned'
-            db.commit()
-            db.refresh(order)
+            await db.commit()
+            await db.refresh(order)
             return order
         except Exception as e:
-            db.rollback()
+            await db.rollback()
             raise HTTPException(status_code=500, detail=f"배송사 할당 중 오류가 발생했습니다: {str(e)}")
 
     def get_orders_in_date_range(self, db: Session, start_date: datetime, end_date: datetime) -> List[Order]:
@@ -154,38 +146,44 @@ class OrderService:
             logger.error(f"주소 저장 중 오류 발생: {str(e)}")
             raise HTTPException(status_code=500, detail="주소 저장 중 오류가 발생했습니다")
 
-    async def get_user_orders(self, db: Session, user_id: int, skip: int = 0, limit: int = 10):
+    async def get_user_orders(self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 10):
         """사용자의 주문 내역 조회"""
-        return db.query(Order).filter(Order.user_id == user_id)\
-            .order_by(Order.created_at.desc())\
-            .offset(skip).limit(limit).all()
+        result = await db.execute(
+            select(Order).where(Order.user_id == user_id)
+            .order_by(Order.created_at.desc())
+            .offset(skip).limit(limit)
+        )
+        return list(result.scalars())
 
-    async def get_order_details(self, db: Session, order_id: str):
+    async def get_order_details(self, db: AsyncSession, order_id: int):
         """주문 상세 정보 조회"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if not order:
-            raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
-        
+        order = await self.get_order_by_id(db, order_id)
+
         # 결제 정보 조회
-        payment = db.query(Payment).filter(Payment.order_id == order_id).first()
-        
+        payment = (await db.execute(
+            select(Payment).where(Payment.order_id == order_id).limit(1)
+        )).scalar_one_or_none()
+
         # 배송 정보 조회
-        shipping = db.query(ShippingOrder).filter(ShippingOrder.order_id == order_id).first()
-        
+        shipping = (await db.execute(
+            select(ShippingOrder).where(ShippingOrder.order_id == order_id).limit(1)
+        )).scalar_one_or_none()
+
         return {
             "order": order,
             "payment": payment,
             "shipping": shipping
         }
 
-    async def update_order_status(self, db: Session, order_id: str, status: str):
+    async def update_order_status(self, db: AsyncSession, order_id: int, status: str):
         """주문 상태 업데이트"""
-        order = db.query(Order).filter(Order.id == order_id).first()
-        if not order:
-            raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
-        
-        order.status = status
-        order.updated_at = datetime.utcnow()
-        db.commit()
-        db.refresh(order)
-        return order
\ No newline at end of file
+        order = await self.get_order_by_id(db, order_id)
+        try:
+            order.status = status
+            order.updated_at = datetime.utcnow()
+            await db.commit()
+            await db.refresh(order)
+            return order
+        except Exception as e:
+            await db.rollback()
+            raise HTTPException(status_code=500, detail=f"주문 상태 업데이트 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
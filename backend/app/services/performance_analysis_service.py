@@ -1,11 +1,24 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc, and_
+from sqlalchemy import func, desc, and_, case
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from fastapi import HTTPException
 from ..models import ShippingOrder, Review, Order, User, ShippingCompany
+from ..models.rollup import (
+    DELIVERY_TIME_BUCKETS, DailyDeliverySketch, DailyDriverRollup, DailyReviewRollup, DailyShipmentRollup
+)
 from ..services.shipping_order_service import ShippingOrderService
 from ..services.review_service import ReviewService
+from ..services.rollup_service import delivery_time_sketch
+from ..utils.sql_functions import hours_between, percentiles
+
+# 배송 시간 분위수 (응답 키: p50, p90, p95, p99)
+DELIVERY_TIME_PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+DRIVER_ROLLUP_MEASURES = [
+    'shipment_count', 'delivered_count', 'delayed_count', 'shipping_fee', 'delivered_fee',
+    'timed_count', 'delivery_hours'
+] + [column for _, _, column in DELIVERY_TIME_BUCKETS]
 
 class PerformanceAnalysisService:
     def __init__(self, shipping_order_service: ShippingOrderService, review_service: ReviewService):
@@ -20,11 +33,14 @@ class PerformanceAnalysisService:
         end_date: datetime
     ) -> Dict[str, Any]:
         try:
-            shipping_orders = self._get_company_orders(db, company_id, start_date, end_date)
-            delivery_stats = self._analyze_delivery_performance(shipping_orders)
-            review_stats = self._analyze_review_performance(db, shipping_orders)
-            financial_stats = self._analyze_financial_performance(shipping_orders)
-            driver_stats = self._analyze_driver_performance(db, company_id, start_date, end_date)
+            # 일별 집계 테이블 기준 (조회 비용은 기간 일수 × 기사 수에 비례)
+            start_day, end_day = start_date.date(), end_date.date()
+            totals = self._get_company_shipments(db, company_id, start_day, end_day)
+            delivery_stats = self._analyze_delivery_performance(totals)
+            delivery_stats['delivery_time_percentiles'] = self._sketch_percentiles(db, start_day, end_day, company_id)
+            review_stats = self._analyze_review_performance(db, company_id, start_day, end_day)
+            financial_stats = self._analyze_financial_performance(totals)
+            driver_stats = self._analyze_driver_performance(db, company_id, start_day, end_day)
 
             return {
                 'summary': {
@@ -50,30 +66,33 @@ class PerformanceAnalysisService:
                 detail=f"성능 분석 중 오류가 발생했습니다: {str(e)}"
             )
 
-    def _get_company_orders(
+    def _get_company_shipments(
         self, 
         db: Session, 
         company_id: int, 
-        start_date: datetime, 
-        end_date: datetime
-    ) -> List[ShippingOrder]:
-        return db.query(ShippingOrder).filter(
-            and_(
-                ShippingOrder.company_id == company_id,
-                ShippingOrder.created_at.between(start_date, end_date)
-            )
-        ).all()
-
-    def _analyze_delivery_performance(self, orders: List[ShippingOrder]) -> Dict[str, Any]:
-        total_orders = len(orders)
-        completed_orders = len([o for o in orders if o.status == 'delivered'])
-        delayed_orders = len([o for o in orders if o.status == 'delayed'])
-        
-        delivery_times = []
-        for order in orders:
-            if order.delivered_at and order.created_at:
-                delivery_time = (order.delivered_at - order.created_at).total_seconds() / 3600
-                delivery_times.append(delivery_time)
+        start_day: date, 
+        end_day: date
+    ) -> Any:
+        """배송사의 기간 내 배송 건수/배송비/소요 시간 합계와 구간별 건수"""
+        return self._sum_driver_rollups(db, start_day, end_day, DailyDriverRollup.company_id == company_id)
+
+    def _sum_driver_rollups(self, db: Session, start_day: date, end_day: date, *filters) -> Any:
+        rollup = DailyDriverRollup
+        return db.query(
+            *[func.coalesce(func.sum(getattr(rollup, column)), 0).label(column) for column in DRIVER_ROLLUP_MEASURES]
+        ).filter(
+            rollup.day.between(start_day, end_day),
+            *filters
+        ).one()
+
+    def _analyze_delivery_performance(self, totals: Any) -> Dict[str, Any]:
+        total_orders = totals.shipment_count
+        completed_orders = totals.delivered_count
+        delayed_orders = totals.delayed_count
+
+        distribution = {}
+        if totals.timed_count:
+            distribution = {label: getattr(totals, column) for _, label, column in DELIVERY_TIME_BUCKETS}
 
         return {
             'total_orders': total_orders,
@@ -81,17 +100,33 @@ class PerformanceAnalysisService:
             'completion_rate': (completed_orders / total_orders * 100) if total_orders > 0 else 0,
             'delayed_orders': delayed_orders,
             'delay_rate': (delayed_orders / total_orders * 100) if total_orders > 0 else 0,
-            'avg_delivery_time': sum(delivery_times) / len(delivery_times) if delivery_times else 0,
-            'delivery_time_distribution': self._calculate_time_distribution(delivery_times)
+            'avg_delivery_time': totals.delivery_hours / totals.timed_count if totals.timed_count else 0,
+            'delivery_time_distribution': distribution
         }
 
-    def _analyze_review_performance(self, db: Session, orders: List[ShippingOrder]) -> Dict[str, Any]:
-        reviews = []
-        for order in orders:
-            order_reviews = self.review_service.get_reviews_by_order_id(db, order.order_id)
-            reviews.extend(order_reviews)
+    def _analyze_review_performance(
+        self, 
+        db: Session, 
+        company_id: int, 
+        start_day: date, 
+        end_day: date
+    ) -> Dict[str, Any]:
+        rollup = DailyReviewRollup
+        row = db.query(
+            func.sum(rollup.review_count).label('count'),
+            func.sum(rollup.rating_sum).label('rating_sum'),
+            func.sum(rollup.service_rating_sum).label('service_rating_sum'),
+            func.sum(rollup.driver_rating_sum).label('driver_rating_sum'),
+            *[func.sum(getattr(rollup, f'rating_{i}')).label(f'rating_{i}') for i in range(1, 6)]
+        ).filter(
+            and_(
+                rollup.company_id == company_id,
+                rollup.day.between(start_day, end_day)
+            )
+        ).one()
 
-        if not reviews:
+        total_reviews = row.count or 0
+        if not total_reviews:
             return {
                 'avg_rating': 0,
                 'avg_service_rating': 0,
@@ -101,30 +136,24 @@ class PerformanceAnalysisService:
                 'satisfaction_rate': 0
             }
 
-        rating_dist = {str(i): 0 for i in range(1, 6)}
-        for review in reviews:
-            rating_dist[str(int(review.rating))] += 1
-
+        rating_dist = {str(i): getattr(row, f'rating_{i}') or 0 for i in range(1, 6)}
         return {
-            'avg_rating': sum(r.rating for r in reviews) / len(reviews),
-            'avg_service_rating': sum(r.service_rating for r in reviews) / len(reviews),
-            'avg_driver_rating': sum(r.driver_rating for r in reviews) / len(reviews),
-            'total_reviews': len(reviews),
+            'avg_rating': row.rating_sum / total_reviews,
+            'avg_service_rating': row.service_rating_sum / total_reviews,
+            'avg_driver_rating': row.driver_rating_sum / total_reviews,
+            'total_reviews': total_reviews,
             'rating_distribution': rating_dist,
-            'satisfaction_rate': len([r for r in reviews if r.rating >= 4]) / len(reviews) * 100
+            'satisfaction_rate': (rating_dist['4'] + rating_dist['5']) / total_reviews * 100
         }
 
-    def _analyze_financial_performance(self, orders: List[ShippingOrder]) -> Dict[str, Any]:
-        total_revenue = sum(order.shipping_fee for order in orders if order.shipping_fee)
-        completed_revenue = sum(
-            order.shipping_fee for order in orders 
-            if order.shipping_fee and order.status == 'delivered'
-        )
+    def _analyze_financial_performance(self, totals: Any) -> Dict[str, Any]:
+        total_revenue = totals.shipping_fee
+        completed_revenue = totals.delivered_fee
 
         return {
             'total_revenue': total_revenue,
             'completed_revenue': completed_revenue,
-            'avg_order_value': total_revenue / len(orders) if orders else 0,
+            'avg_order_value': total_revenue / totals.shipment_count if totals.shipment_count else 0,
             'revenue_completion_rate': (completed_revenue / total_revenue * 100) if total_revenue > 0 else 0
         }
 
@@ -132,57 +161,253 @@ class PerformanceAnalysisService:
         self, 
         db: Session, 
         company_id: int,
+        start_day: date,
+        end_day: date
+    ) -> List[Dict[str, Any]]:
+        deliveries = dict(
+            db.query(
+                DailyDriverRollup.driver_id,
+                func.sum(DailyDriverRollup.shipment_count)
+            ).filter(
+                and_(
+                    DailyDriverRollup.company_id == company_id,
+                    DailyDriverRollup.driver_id != 0,
+                    DailyDriverRollup.day.between(start_day, end_day)
+                )
+            ).group_by(DailyDriverRollup.driver_id).all()
+        )
+        ratings = {
+            row.driver_id: row
+            for row in db.query(
+                DailyReviewRollup.driver_id,
+                func.sum(DailyReviewRollup.review_count).label('count'),
+                func.sum(DailyReviewRollup.driver_rating_sum).label('rating_sum')
+            ).filter(
+                and_(
+                    DailyReviewRollup.company_id == company_id,
+                    DailyReviewRollup.driver_id != 0,
+                    DailyReviewRollup.day.between(start_day, end_day)
+                )
+            ).group_by(DailyReviewRollup.driver_id).all()
+        }
+
+        driver_stats = []
+        for driver_id, total_deliveries in deliveries.items():
+            if not total_deliveries:
+                continue
+            rating = ratings.get(driver_id)
+            driver_stats.append({
+                'driver_id': driver_id,
+                'total_deliveries': total_deliveries,
+                'avg_rating': rating.rating_sum / rating.count if rating and rating.count else 0
+            })
+        return sorted(driver_stats, key=lambda stat: stat['avg_rating'], reverse=True)
+
+    def get_driver_performance_ranking(
+        self,
+        db: Session,
         start_date: datetime,
-        end_date: datetime
+        end_date: datetime,
+        limit: int = 10
     ) -> List[Dict[str, Any]]:
-        driver_stats = db.query(
-            ShippingOrder.driver_id,
-            func.count(ShippingOrder.id).label('total_deliveries'),
-            func.avg(Review.driver_rating).label('avg_rating')
-        ).join(
-            Review, ShippingOrder.order_id == Review.order_id
-        ).filter(
-            and_(
-                ShippingOrder.company_id == company_id,
-                ShippingOrder.created_at.between(start_date, end_date)
+        """기사별 성능 랭킹 (기사 평점 → 완료 건수 순)"""
+        try:
+            start_day, end_day = start_date.date(), end_date.date()
+            drivers = db.query(
+                DailyDriverRollup.driver_id,
+                func.sum(DailyDriverRollup.shipment_count).label('shipment_count'),
+                func.sum(DailyDriverRollup.delivered_count).label('delivered_count'),
+                func.sum(DailyDriverRollup.delayed_count).label('delayed_count'),
+                func.sum(DailyDriverRollup.timed_count).label('timed_count'),
+                func.sum(DailyDriverRollup.delivery_hours).label('delivery_hours')
+            ).filter(
+                DailyDriverRollup.driver_id != 0,
+                DailyDriverRollup.day.between(start_day, end_day)
+            ).group_by(DailyDriverRollup.driver_id).subquery()
+            reviews = db.query(
+                DailyReviewRollup.driver_id,
+                func.sum(DailyReviewRollup.review_count).label('review_count'),
+                func.sum(DailyReviewRollup.driver_rating_sum).label('rating_sum')
+            ).filter(
+                DailyReviewRollup.driver_id != 0,
+                DailyReviewRollup.day.between(start_day, end_day)
+            ).group_by(DailyReviewRollup.driver_id).subquery()
+
+            avg_rating = func.coalesce(reviews.c.rating_sum / func.nullif(reviews.c.review_count, 0), 0)
+            rows = db.query(
+                drivers,
+                avg_rating.label('avg_rating'),
+                func.coalesce(reviews.c.review_count, 0).label('review_count')
+            ).outerjoin(
+                reviews, reviews.c.driver_id == drivers.c.driver_id
+            ).filter(
+                drivers.c.shipment_count > 0
+            ).order_by(
+                desc('avg_rating'), desc(drivers.c.delivered_count), drivers.c.driver_id
+            ).limit(limit).all()
+
+            # 상위 기사만 (driver_id, created_at) 인덱스로 분위수 계산
+            driver_percentiles = {}
+            if rows:
+                driver_percentiles = self._delivery_time_percentiles(
+                    db, start_day, end_day,
+                    ShippingOrder.driver_id.in_([row.driver_id for row in rows]),
+                    partition_by=ShippingOrder.driver_id
+                )
+
+            return [
+                {
+                    'rank': rank,
+                    'driver_id': row.driver_id,
+                    'total_deliveries': row.shipment_count,
+                    'completed_deliveries': row.delivered_count,
+                    'completion_rate': row.delivered_count / row.shipment_count * 100,
+                    'delayed_deliveries': row.delayed_count,
+                    'avg_rating': row.avg_rating,
+                    'review_count': row.review_count,
+                    'avg_delivery_time': row.delivery_hours / row.timed_count if row.timed_count else 0,
+                    'delivery_time_percentiles': driver_percentiles.get(row.driver_id, self._empty_percentiles())
+                }
+                for rank, row in enumerate(rows, start=1)
+            ]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"기사 랭킹 조회 중 오류가 발생했습니다: {str(e)}"
             )
-        ).group_by(
-            ShippingOrder.driver_id
-        ).order_by(
-            desc('avg_rating')
-        ).all()
-
-        return [
-            {
-                'driver_id': stat.driver_id,
-                'total_deliveries': stat.total_deliveries,
-                'avg_rating': float(stat.avg_rating) if stat.avg_rating else 0
+
+    def analyze_delivery_times(
+        self,
+        db: Session,
+        start_date: datetime,
+        end_date: datetime,
+        company_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """기간 내 배송 시간 분석 (평균, 구간별 건수, 분위수)"""
+        try:
+            start_day, end_day = start_date.date(), end_date.date()
+            rollup_filters = []
+            if company_id is not None:
+                rollup_filters.append(DailyDriverRollup.company_id == company_id)
+
+            totals = self._sum_driver_rollups(db, start_day, end_day, *rollup_filters)
+            delivery_stats = self._analyze_delivery_performance(totals)
+            delivery_stats['delivery_time_percentiles'] = self._sketch_percentiles(db, start_day, end_day, company_id)
+
+            return {
+                'company_id': company_id,
+                **delivery_stats,
+                'period': {
+                    'start_date': start_date.isoformat(),
+                    'end_date': end_date.isoformat()
+                }
             }
-            for stat in driver_stats
-        ]
-
-    def _calculate_time_distribution(self, delivery_times: List[float]) -> Dict[str, int]:
-        if not delivery_times:
-            return {}
-
-        ranges = {
-            '0-2h': 0,
-            '2-4h': 0,
-            '4-8h': 0,
-            '8-24h': 0,
-            '24h+': 0
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"배송 시간 분석 중 오류가 발생했습니다: {str(e)}"
+            )
+
+    def analyze_regional_performance(
+        self,
+        db: Session,
+        start_date: datetime,
+        end_date: datetime,
+        region: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """지역별 배송 건수/완료율/지연율/배송 시간 (배송 건수 많은 순)"""
+        try:
+            start_day, end_day = start_date.date(), end_date.date()
+            rollup = DailyShipmentRollup
+            rollup_filters, shipment_filters = [rollup.day.between(start_day, end_day)], []
+            if region is not None:
+                rollup_filters.append(rollup.region == region)
+                shipment_filters.append(ShippingOrder.region == region)
+
+            rows = db.query(
+                rollup.region,
+                func.sum(rollup.shipment_count).label('shipment_count'),
+                func.sum(case((rollup.status == 'delivered', rollup.shipment_count), else_=0)).label('delivered_count'),
+                func.sum(case((rollup.status == 'delayed', rollup.shipment_count), else_=0)).label('delayed_count'),
+                func.sum(rollup.shipping_fee).label('shipping_fee'),
+                func.sum(rollup.timed_count).label('timed_count'),
+                func.sum(rollup.delivery_hours).label('delivery_hours')
+            ).filter(
+                *rollup_filters
+            ).group_by(rollup.region).having(
+                func.sum(rollup.shipment_count) > 0
+            ).order_by(desc('shipment_count')).all()
+
+            region_percentiles = self._delivery_time_percentiles(
+                db, start_day, end_day, *shipment_filters, partition_by=ShippingOrder.region
+            )
+
+            return [
+                {
+                    'region': row.region or '미지정',
+                    'total_shipments': row.shipment_count,
+                    'completed_deliveries': row.delivered_count,
+                    'success_rate': row.delivered_count / row.shipment_count * 100,
+                    'delayed_deliveries': row.delayed_count,
+                    'delay_rate': row.delayed_count / row.shipment_count * 100,
+                    'total_shipping_fee': row.shipping_fee,
+                    'avg_delivery_time': row.delivery_hours / row.timed_count if row.timed_count else 0,
+                    # 집계 테이블은 지역 미지정을 빈 문자열로 저장
+                    'delivery_time_percentiles': region_percentiles.get(row.region or None, self._empty_percentiles())
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"지역별 성능 분석 중 오류가 발생했습니다: {str(e)}"
+            )
+
+    def _sketch_percentiles(
+        self,
+        db: Session,
+        start_day: date,
+        end_day: date,
+        company_id: Optional[int] = None
+    ) -> Dict[str, float]:
+        """일별 배송 시간 스케치를 버킷별로 합쳐 분위수 추정 (원본 행 조회 없음, 오차는 DELIVERY_TIME_SKETCH_ACCURACY 이내)"""
+        query = db.query(
+            DailyDeliverySketch.bucket,
+            func.sum(DailyDeliverySketch.delivery_count)
+        ).filter(DailyDeliverySketch.day.between(start_day, end_day))
+        if company_id is not None:
+            query = query.filter(DailyDeliverySketch.company_id == company_id)
+
+        sketch = delivery_time_sketch()
+        sketch.add_bins(query.group_by(DailyDeliverySketch.bucket).all())
+        if sketch.count <= 0:
+            return self._empty_percentiles()
+        return {f'p{round(q * 100)}': sketch.quantile(q) for q in DELIVERY_TIME_PERCENTILES}
+
+    def _delivery_time_percentiles(
+        self,
+        db: Session,
+        start_day: date,
+        end_day: date,
+        *filters,
+        partition_by: Optional[Any] = None
+    ) -> Dict[Any, Dict[str, float]]:
+        """배송 완료 건의 소요 시간 분위수를 DB에서 계산 (행을 불러오지 않음)"""
+        hours = hours_between(db, ShippingOrder.created_at, ShippingOrder.delivered_at)
+        values = percentiles(
+            db, hours, DELIVERY_TIME_PERCENTILES,
+            where=[
+                ShippingOrder.created_at >= datetime.combine(start_day, time.min),
+                ShippingOrder.created_at < datetime.combine(end_day + timedelta(days=1), time.min),
+                ShippingOrder.delivered_at.isnot(None),
+                *filters
+            ],
+            partition_by=partition_by
+        )
+        return {
+            key: {f'p{round(q * 100)}': value for q, value in zip(DELIVERY_TIME_PERCENTILES, row)}
+            for key, row in values.items()
         }
 
-        for time in delivery_times:
-            if time <= 2:
-                ranges['0-2h'] += 1
-            elif time <= 4:
-                ranges['2-4h'] += 1
-            elif time <= 8:
-                ranges['4-8h'] += 1
-            elif time <= 24:
-                ranges['8-24h'] += 1
-            else:
-                ranges['24h+'] += 1
-
-        return ranges 
\ No newline at end of file
+    def _empty_percentiles(self) -> Dict[str, float]:
+        return {f'p{round(q * 100)}': 0 for q in DELIVERY_TIME_PERCENTILES}
@@ -1,97 +1,307 @@
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
+# 요금 규칙 테이블 (프로세스당 한 번 평가 계획으로 컴파일됨)
+PRICING_RULES: Dict[str, Any] = {
+    # 기본 요금 설정
+    "base_prices": {
+        "small": 50000,    # 소형 이사
+        "medium": 100000,  # 중형 이사
+        "large": 150000    # 대형 이사
+    },
+    "default_category": "small",
+
+    # 거리별 추가 요금
+    "distance_fees": {
+        "base": 20000,       # 기본 요금
+        "included_km": 20,   # 기본 요금에 포함된 거리
+        "per_km": 1000       # km당 추가 요금
+    },
+
+    # 날짜/시간대별 할증 (적용 순서대로)
+    "time_surcharges": {
+        "weekend": 1.2,     # 주말 20% 할증
+        "holiday": 1.3,     # 공휴일 30% 할증
+        "night": 1.2        # 야간 20% 할증
+    }
+}
+
+# 주문 단계 -> 그 단계 데이터로 결정되는 요금 구성 요소
+STEP_PRICE_COMPONENTS: Mapping[str, str] = MappingProxyType({
+    'product_selection': 'base_price',
+    'address_input': 'distance_fee',
+    'date_selection': 'surcharge',
+    'additional_options': 'options_fee'
+})
+
+class PricingPlan(NamedTuple):
+    """규칙 테이블을 평탄화한 평가 계획"""
+    base_prices: Mapping[str, float]
+    default_base_price: float
+    distance_base_fee: float
+    included_km: float
+    per_km_fee: float
+    surcharge_flags: Tuple[str, ...]
+    # 할증 플래그 비트마스크 -> 누적 배율 (2^n개 항목)
+    surcharge_table: Tuple[float, ...]
+
+def compile_pricing_rules(rules: Mapping[str, Any]) -> PricingPlan:
+    base_prices = MappingProxyType(dict(rules["base_prices"]))
+    distance_fees = rules["distance_fees"]
+    surcharges = list(rules["time_surcharges"].items())
+
+    surcharge_table: List[float] = []
+    for mask in range(1 << len(surcharges)):
+        multiplier = 1.0
+        for bit, (_, rate) in enumerate(surcharges):
+            if mask & (1 << bit):
+                multiplier *= rate
+        surcharge_table.append(multiplier)
+
+    return PricingPlan(
+        base_prices=base_prices,
+        default_base_price=base_prices[rules["default_category"]],
+        distance_base_fee=distance_fees["base"],
+        included_km=distance_fees["included_km"],
+        per_km_fee=distance_fees["per_km"],
+        surcharge_flags=tuple(f"is_{name}" for name, _ in surcharges),
+        surcharge_table=tuple(surcharge_table)
+    )
+
+class PriceColumns(NamedTuple):
+    """배치 계산용 컬럼 데이터 (주문 N건)"""
+    base_price: np.ndarray      # float64
+    distance_km: np.ndarray     # float64
+    surcharge_mask: np.ndarray  # int64, 할증 플래그 비트마스크
+    options_fee: np.ndarray     # float64
+
+_NUMERIC_TYPES = (int, float, bool)
+
 class PriceCalculator:
-    def __init__(self):
-        # 기본 요금 설정
-        self.BASE_PRICES = {
-            "small": 50000,    # 소형 이사
-            "medium": 100000,  # 중형 이사
-            "large": 150000    # 대형 이사
-        }
-        
-        # 거리별 추가 요금
-        self.DISTANCE_FEES = {
-            "base": 20000,      # 기본 20km 이내
-            "per_km": 1000      # km당 추가 요금
-        }
-        
-        # 날짜/시간대별 할증
-        self.TIME_SURCHARGES = {
-            "weekend": 1.2,     # 주말 20% 할증
-            "holiday": 1.3,     # 공휴일 30% 할증
-            "night": 1.2        # 야간 20% 할증
-        }
+    """이사 요금 계산 엔진
+
+    주문 진행 단계(OrderProgressService)와 견적(QuoteService)이 같은
+    인스턴스를 공유합니다. 규칙 테이블은 생성 시 한 번만 컴파일되고,
+    계산 중에는 테이블을 새로 만들지 않습니다.
+    """
+
+    def __init__(self, rules: Mapping[str, Any] = PRICING_RULES):
+        self.plan = compile_pricing_rules(rules)
 
     def calculate_total_price(self, order_data: Dict[str, Any]) -> float:
         try:
-            total_price = 0.0
-            
-            # 1. 기본 요금 계산 (상품 선택 기반)
-            product_data = order_data.get('product_selection', {})
-            category = product_data.get('category', 'small')
-            total_price += self.BASE_PRICES.get(category, self.BASE_PRICES['small'])
-            
-            # 2. 거리 추가 요금
-            address_data = order_data.get('address_input', {})
-            distance_fee = self._calculate_distance_fee(address_data)
-            total_price += distance_fee
-            
-            # 3. 날짜/시간 할증
-            date_data = order_data.get('date_selection', {})
-            surcharge = self._calculate_time_surcharge(date_data)
-            total_price *= surcharge
-            
-            # 4. 추가 옵션 요금
-            options_data = order_data.get('additional_options', {})
-            options_fee = self._calculate_options_fee(options_data)
-            total_price += options_fee
-            
-            return round(total_price)  # 원 단위로 반올림
-            
+            return self.combine_components(self.calculate_components(order_data))
         except Exception as e:
             logger.error(f"가격 계산 중 오류 발생: {str(e)}")
             return 0.0
 
-    def _calculate_distance_fee(self, address_data: Dict[str, Any]) -> float:
+    def calculate_components(self, order_data: Dict[str, Any]) -> Dict[str, float]:
+        """단계별 요금 구성 요소 (기본 요금, 거리 요금, 시간 할증 배율, 옵션 요금)"""
+        return {
+            component: self.calculate_step_component(step, order_data.get(step, {}))
+            for step, component in STEP_PRICE_COMPONENTS.items()
+        }
+
+    def calculate_step_component(self, step: str, data: Dict[str, Any]) -> float:
+        """한 단계의 데이터만으로 해당 요금 구성 요소 계산"""
+        if step == 'product_selection':
+            return self.calculate_base_price(data)
+        if step == 'address_input':
+            return self.calculate_distance_fee(data)
+        if step == 'date_selection':
+            return self.calculate_time_surcharge(data)
+        if step == 'additional_options':
+            return self.calculate_options_fee(data)
+        raise ValueError(f"요금과 관련 없는 단계: {step}")
+
+    def combine_components(self, components: Mapping[str, float]) -> float:
+        return self.combine(
+            components['base_price'],
+            components['distance_fee'],
+            components['surcharge'],
+            components['options_fee']
+        )
+
+    def combine(self, base_price: float, distance_fee: float, surcharge: float, options_fee: float) -> float:
+        """구성 요소를 합쳐 최종 요금 계산 (원 단위로 반올림)"""
+        return round((0.0 + base_price + distance_fee) * surcharge + options_fee)
+
+    def calculate_base_price(self, product_data: Dict[str, Any]) -> float:
+        category = product_data.get('category', 'small')
+        return self.plan.base_prices.get(category, self.plan.default_base_price)
+
+    def calculate_distance_fee(self, address_data: Dict[str, Any]) -> float:
         try:
+            plan = self.plan
             distance = address_data.get('distance_km', 0)
-            if distance <= 20:  # 기본 20km 이내
-                return self.DISTANCE_FEES['base']
+            if distance <= plan.included_km:  # 기본 거리 이내
+                return plan.distance_base_fee
             else:
-                extra_distance = distance - 20
-                return self.DISTANCE_FEES['base'] + (extra_distance * self.DISTANCE_FEES['per_km'])
+                extra_distance = distance - plan.included_km
+                return plan.distance_base_fee + (extra_distance * plan.per_km_fee)
         except Exception as e:
             logger.error(f"거리 요금 계산 중 오류: {str(e)}")
             return 0.0
 
-    def _calculate_time_surcharge(self, date_data: Dict[str, Any]) -> float:
+    def calculate_time_surcharge(self, date_data: Dict[str, Any]) -> float:
         try:
-            surcharge = 1.0
-            if date_data.get('is_weekend'):
-                surcharge *= self.TIME_SURCHARGES['weekend']
-            if date_data.get('is_holiday'):
-                surcharge *= self.TIME_SURCHARGES['holiday']
-            if date_data.get('is_night'):
-                surcharge *= self.TIME_SURCHARGES['night']
-            return surcharge
+            mask = 0
+            for bit, flag in enumerate(self.plan.surcharge_flags):
+                if date_data.get(flag):
+                    mask |= 1 << bit
+            return self.plan.surcharge_table[mask]
         except Exception as e:
             logger.error(f"시간 할증 계산 중 오류: {str(e)}")
             return 1.0
 
-    def _calculate_options_fee(self, options_data: Dict[str, Any]) -> float:
+    def calculate_options_fee(self, options_data: Dict[str, Any]) -> float:
         try:
             total_options_fee = 0.0
-            selected_options = options_data.get('selected_options', [])
-            
-            for option in selected_options:
-                option_price = option.get('price', 0)
-                quantity = option.get('quantity', 1)
-                total_options_fee += option_price * quantity
-                
+            for option in options_data.get('selected_options', []):
+                total_options_fee += option.get('price', 0) * option.get('quantity', 1)
             return total_options_fee
         except Exception as e:
             logger.error(f"옵션 요금 계산 중 오류: {str(e)}")
-            return 0.0 
\ No newline at end of file
+            return 0.0
+
+    def calculate_total_prices(self, orders: Sequence[Dict[str, Any]]) -> np.ndarray:
+        """주문 N건의 요금을 컬럼 단위로 한 번에 계산
+
+        결과는 calculate_total_price를 건별로 호출한 값과 같습니다.
+        컬럼으로 옮길 수 없는 주문(잘못된 타입 등)은 건별 계산 결과를 사용합니다.
+        """
+        columns, fallback_rows = self.extract_price_columns(orders)
+        totals = self.calculate_price_columns(columns)
+        for row in fallback_rows:
+            totals[row] = self.calculate_total_price(orders[row])
+        return totals
+
+    def extract_price_columns(self, orders: Sequence[Dict[str, Any]]) -> Tuple[PriceColumns, List[int]]:
+        """주문 데이터에서 가격 계산에 필요한 컬럼 추출"""
+        count = len(orders)
+        base_price = [0.0] * count
+        distance_km = [0.0] * count
+        surcharge_mask = [0] * count
+        options_fee = [0.0] * count
+        fallback_rows: List[int] = []
+
+        plan = self.plan
+        get_base_price = plan.base_prices.get
+        default_base_price = plan.default_base_price
+        flag_bits = [(flag, 1 << bit) for bit, flag in enumerate(plan.surcharge_flags)]
+
+        for row, order in enumerate(orders):
+            try:
+                distance = order.get('address_input', {}).get('distance_km', 0)
+                if type(distance) not in _NUMERIC_TYPES:
+                    raise TypeError("distance_km")
+
+                fee = 0.0
+                for option in order.get('additional_options', {}).get('selected_options', []):
+                    fee += option.get('price', 0) * option.get('quantity', 1)
+                if type(fee) not in _NUMERIC_TYPES:
+                    raise TypeError("options_fee")
+
+                date_data = order.get('date_selection', {})
+                mask = 0
+                for flag, bit in flag_bits:
+                    if date_data.get(flag):
+                        mask |= bit
+
+                base_price[row] = get_base_price(
+                    order.get('product_selection', {}).get('category', 'small'),
+                    default_base_price
+                )
+                distance_km[row] = distance
+                surcharge_mask[row] = mask
+                options_fee[row] = fee
+            except Exception:
+                # 오류 처리(0원, 기본값 등)는 건별 계산에 맡김
+                fallback_rows.append(row)
+
+        columns = PriceColumns(
+            np.array(base_price, dtype=np.float64),
+            np.array(distance_km, dtype=np.float64),
+            np.array(surcharge_mask, dtype=np.int64),
+            np.array(options_fee, dtype=np.float64)
+        )
+        return columns, fallback_rows
+
+    def build_price_columns(
+        self,
+        category: Sequence[str],
+        distance_km: Sequence[float],
+        surcharge_flags: Mapping[str, Sequence[bool]] = MappingProxyType({}),
+        options_fee: Optional[Sequence[float]] = None
+    ) -> PriceColumns:
+        """컬럼 배열(같은 길이, i번째 값이 i번째 주문)을 PriceColumns로 변환
+
+        주문 dict를 건별로 훑지 않으므로 대량 재견적은 이 경로가 가장 빠릅니다.
+        surcharge_flags는 할증 플래그 이름(is_weekend 등) -> 주문별 값이며 없는 플래그는 False입니다.
+        """
+        plan = self.plan
+        count = len(category)
+        base_prices = {
+            name: plan.base_prices.get(name, plan.default_base_price) for name in set(category)
+        }
+        surcharge_mask = np.zeros(count, dtype=np.int64)
+        for bit, flag in enumerate(plan.surcharge_flags):
+            values = surcharge_flags.get(flag)
+            if values is not None:
+                surcharge_mask |= np.asarray(values, dtype=bool).astype(np.int64) << bit
+        return PriceColumns(
+            np.fromiter((base_prices[name] for name in category), dtype=np.float64, count=count),
+            np.asarray(distance_km, dtype=np.float64),
+            surcharge_mask,
+            np.zeros(count) if options_fee is None else np.asarray(options_fee, dtype=np.float64)
+        )
+
+    def calculate_price_columns(self, columns: PriceColumns) -> np.ndarray:
+        """컬럼 데이터로 요금 계산 (NumPy 벡터 연산)"""
+        plan = self.plan
+        distance = columns.distance_km
+        distance_fee = np.where(
+            distance <= plan.included_km,
+            plan.distance_base_fee,
+            plan.distance_base_fee + (distance - plan.included_km) * plan.per_km_fee
+        )
+        surcharge = np.asarray(plan.surcharge_table, dtype=np.float64)[columns.surcharge_mask]
+
+        # round()와 같은 은행가 반올림(half-to-even)
+        totals = np.rint((0.0 + columns.base_price + distance_fee) * surcharge + columns.options_fee)
+        # 건별 계산에서 오류(NaN/무한대)로 0원이 되는 경우와 동일하게 처리
+        totals[~np.isfinite(totals)] = 0.0
+        return totals
+
+    def calculate_quote_price(self, data: Dict[str, Any]) -> Dict[str, float]:
+        """견적용 요금 상세 계산"""
+        try:
+            # 기본 가격 계산
+            base_price = sum(item.get('price', 0) for item in data['items'])
+
+            # 거리/층수/특수 요구사항 요금 및 할인은 아직 규칙이 없음
+            distance_fee = 0.0
+            floor_fee = 0.0
+            special_fee = 0.0
+            discount_amount = 0.0
+
+            return {
+                'base_price': base_price,
+                'distance_fee': distance_fee,
+                'floor_fee': floor_fee,
+                'special_fee': special_fee,
+                'discount_amount': discount_amount,
+                'final_price': base_price + distance_fee + floor_fee + special_fee - discount_amount
+            }
+
+        except Exception as e:
+            raise ValueError(f"가격 계산 중 오류 발생: {str(e)}")
+
+@lru_cache()
+def get_price_calculator() -> PriceCalculator:
+    return PriceCalculator()
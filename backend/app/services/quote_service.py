@@ -2,12 +2,13 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from ..models import Quote
-from ..utils.price_calculator import PriceCalculator
+from ..schemas.quote import BatchPriceColumns
+from .price_calculator import get_price_calculator
 from fastapi import HTTPException
 
 class QuoteService:
     def __init__(self):
-        self.price_calculator = PriceCalculator()
+        self.price_calculator = get_price_calculator()
 
     async def create_quote(
         self,
@@ -20,7 +21,7 @@ class QuoteService:
         special_requirements: Optional[Dict[str, Any]] = None
     ) -> Quote:
         try:
-            price_details = self.price_calculator.calculate_total_price({
+            price_details = self.price_calculator.calculate_quote_price({
                 'items': items,
                 'from_address_id': from_address_id,
                 'to_address_id': to_address_id,
@@ -44,4 +45,25 @@ class QuoteService:
 
         except Exception as e:
             db.rollback()
-            raise HTTPException(status_code=500, detail=f"견적 생성 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+            raise HTTPException(status_code=500, detail=f"견적 생성 중 오류가 발생했습니다: {str(e)}")
+
+    def calculate_batch_prices(self, orders: List[Dict[str, Any]]) -> List[float]:
+        """주문 N건의 요금 일괄 계산 (재견적용)"""
+        try:
+            return self.price_calculator.calculate_total_prices(orders).tolist()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"일괄 요금 계산 중 오류가 발생했습니다: {str(e)}")
+
+    def calculate_batch_price_columns(self, columns: BatchPriceColumns) -> List[float]:
+        """컬럼 형식 주문 N건의 요금 일괄 계산 (재견적용)"""
+        try:
+            calculator = self.price_calculator
+            price_columns = calculator.build_price_columns(
+                columns.category,
+                columns.distance_km,
+                {flag: getattr(columns, flag, None) for flag in calculator.plan.surcharge_flags},
+                columns.options_fee
+            )
+            return calculator.calculate_price_columns(price_columns).tolist()
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"일괄 요금 계산 중 오류가 발생했습니다: {str(e)}")
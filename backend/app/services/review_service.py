@@ -1,12 +1,14 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable
 from datetime import datetime, timedelta
 from fastapi import HTTPException
 from ..models import Review, Order, ShippingOrder
 from ..schemas.review import ReviewCreate, ReviewUpdate
 
 class ReviewService:
+    IN_QUERY_CHUNK_SIZE = 1000
+
     def create_review(
         self,
         db: Session,
@@ -130,6 +132,17 @@ class ReviewService:
     def get_reviews_by_order_id(self, db: Session, order_id: int) -> List[Review]:
         return db.query(Review).filter(Review.order_id == order_id).all()
 
+    def get_reviews_by_order_ids(self, db: Session, order_ids: Iterable[int]) -> Dict[int, List[Review]]:
+        """여러 주문의 리뷰를 IN 조회로 한 번에 가져와 주문 id별로 묶음 (주문마다 조회하지 않도록)"""
+        order_ids = list(dict.fromkeys(order_ids))
+        reviews: Dict[int, List[Review]] = {order_id: [] for order_id in order_ids}
+        # DB 바인드 파라미터 수 제한을 넘지 않도록 나눠서 조회
+        for offset in range(0, len(order_ids), self.IN_QUERY_CHUNK_SIZE):
+            chunk = order_ids[offset:offset + self.IN_QUERY_CHUNK_SIZE]
+            for review in db.query(Review).filter(Review.order_id.in_(chunk)).order_by(Review.id):
+                reviews[review.order_id].append(review)
+        return reviews
+
     def get_reviews_by_user_id(self, db: Session, user_id: int) -> List[Review]:
         return db.query(Review).filter(Review.user_id == user_id).all()
 
@@ -0,0 +1,301 @@
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+from sqlalchemy import and_, delete, event, exc, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from ..models.address import Address
+from ..models.order import Order
+from ..models.review import Review
+from ..models.shipping_order import ShippingOrder
+from ..models.rollup import (
+    DELIVERY_TIME_BUCKETS,
+    DELIVERY_TIME_SKETCH_ACCURACY,
+    DELIVERY_TIME_SKETCH_MIN_HOURS,
+    DailyDeliverySketch,
+    DailyDriverRollup,
+    DailyItemRollup,
+    DailyOrderRollup,
+    DailyReviewRollup,
+    DailyShipmentRollup
+)
+from ..utils.quantile_sketch import DDSketch
+from ..utils.sql_functions import increment_rows
+from .shipping_order_service import region_from_address
+import logging
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_MODELS = (
+    DailyOrderRollup, DailyItemRollup, DailyShipmentRollup, DailyDriverRollup, DailyReviewRollup, DailyDeliverySketch
+)
+
+# 원본 테이블별 집계에 영향을 주는 컬럼 (이 컬럼이 바뀔 때만 집계를 다시 반영)
+TRACKED_FIELDS = {
+    Order: ('created_at', 'status', 'total_price', 'items', 'to_address_id'),
+    ShippingOrder: ('created_at', 'company_id', 'driver_id', 'region', 'status', 'shipping_fee', 'delivered_at'),
+    Review: ('created_at', 'shipping_order_id', 'rating', 'service_rating', 'driver_rating')
+}
+
+# 다른 원본의 집계 키에 쓰이는 컬럼 (바뀌거나 삭제되면 이 행을 참조하는 원본의 기여분도 다시 반영)
+# 모델 -> (컬럼, 참조하는 원본 모델, 참조 외래 키)
+DEPENDENT_SOURCES = {
+    ShippingOrder: (('company_id', 'driver_id'), Review, Review.shipping_order_id),
+    Address: (('address',), Order, Order.to_address_id)
+}
+
+# 집계 계산에 쓰는 원본 조회 (증분 갱신과 백필이 같은 쿼리/계산을 사용)
+def _order_source():
+    return (
+        select(Order.id, Order.created_at, Order.status, Order.total_price, Order.items,
+               Address.address.label('to_address'))
+        .outerjoin(Address, Address.id == Order.to_address_id)
+    )
+
+def _shipment_source():
+    return select(
+        ShippingOrder.id, ShippingOrder.created_at, ShippingOrder.company_id, ShippingOrder.driver_id,
+        ShippingOrder.region, ShippingOrder.status, ShippingOrder.shipping_fee, ShippingOrder.delivered_at
+    )
+
+def _review_source():
+    return (
+        select(Review.id, Review.created_at, Review.rating, Review.service_rating, Review.driver_rating,
+               ShippingOrder.company_id, ShippingOrder.driver_id)
+        .outerjoin(ShippingOrder, ShippingOrder.id == Review.shipping_order_id)
+    )
+
+Contribution = Tuple[Type, Tuple, Dict[str, Any]]
+
+def order_contributions(row) -> List[Contribution]:
+    if row.created_at is None:
+        return []
+    day = row.created_at.date()
+    revenue = row.total_price or 0
+    result = [(
+        DailyOrderRollup,
+        (day, region_from_address(row.to_address) or '', row.status or ''),
+        {'order_count': 1, 'revenue': revenue}
+    )]
+    for item in row.items or []:
+        if isinstance(item, dict) and item.get('id') is not None:
+            result.append((DailyItemRollup, (day, str(item['id'])), {'order_count': 1, 'revenue': revenue}))
+    return result
+
+def delivery_time_column(hours: float) -> str:
+    for limit, _, column in DELIVERY_TIME_BUCKETS:
+        if limit is None or hours <= limit:
+            return column
+
+def delivery_time_sketch() -> DDSketch:
+    """daily_delivery_sketches 버킷과 같은 설정의 빈 스케치"""
+    return DDSketch(DELIVERY_TIME_SKETCH_ACCURACY, DELIVERY_TIME_SKETCH_MIN_HOURS)
+
+_delivery_time_sketch = delivery_time_sketch()
+
+def shipment_contributions(row) -> List[Contribution]:
+    if row.created_at is None:
+        return []
+    day = row.created_at.date()
+    fee = row.shipping_fee or 0
+    timing = {}
+    if row.delivered_at is not None:
+        hours = (row.delivered_at - row.created_at).total_seconds() / 3600
+        timing = {'timed_count': 1, 'delivery_hours': hours, delivery_time_column(hours): 1}
+    delivered = row.status == 'delivered'
+    result = [
+        (DailyShipmentRollup, (day, row.region or '', row.status or ''),
+         {'shipment_count': 1, 'shipping_fee': fee, **timing}),
+        (DailyDriverRollup, (day, row.company_id or 0, row.driver_id or 0), {
+            'shipment_count': 1,
+            'delivered_count': int(delivered),
+            'delayed_count': int(row.status == 'delayed'),
+            'shipping_fee': fee,
+            'delivered_fee': fee if delivered else 0,
+            **timing
+        })
+    ]
+    if timing:
+        result.append((
+            DailyDeliverySketch,
+            (day, row.company_id or 0, _delivery_time_sketch.key(timing['delivery_hours'])),
+            {'delivery_count': 1}
+        ))
+    return result
+
+def review_contributions(row) -> List[Contribution]:
+    if row.created_at is None or row.rating is None:
+        return []
+    values = {
+        'review_count': 1,
+        'rating_sum': row.rating,
+        'service_rating_sum': row.service_rating or 0,
+        'driver_rating_sum': row.driver_rating or 0
+    }
+    bucket = min(max(int(row.rating), 1), 5)
+    values[f'rating_{bucket}'] = 1
+    return [(DailyReviewRollup, (row.created_at.date(), row.company_id or 0, row.driver_id or 0), values)]
+
+SOURCES = {
+    Order: (_order_source, order_contributions),
+    ShippingOrder: (_shipment_source, shipment_contributions),
+    Review: (_review_source, review_contributions)
+}
+
+class RollupAccumulator:
+    """집계 키별 증감량 누적"""
+
+    def __init__(self):
+        self.deltas: Dict[Type, Dict[Tuple, Dict[str, Any]]] = defaultdict(dict)
+
+    def add(self, contributions: Iterable[Contribution], sign: int = 1) -> None:
+        for model, key, values in contributions:
+            current = self.deltas[model].setdefault(key, {})
+            for column, value in values.items():
+                current[column] = current.get(column, 0) + sign * value
+
+    def add_rows(self, model: Type, rows, sign: int = 1) -> None:
+        contributions = SOURCES[model][1]
+        for row in rows:
+            self.add(contributions(row), sign)
+
+    def rows(self, rollup: Type) -> List[Dict[str, Any]]:
+        # 기본 키 + 모든 집계 컬럼 (없는 컬럼은 0)
+        table = rollup.__table__
+        keys = [column.name for column in table.primary_key.columns]
+        measures = [column.name for column in table.columns if column.name not in keys]
+        return [
+            {**dict(zip(keys, key)), **{column: values.get(column, 0) for column in measures}}
+            for key, values in self.deltas.get(rollup, {}).items()
+        ]
+
+    def apply(self, connection: Connection) -> None:
+        """누적한 증감을 집계 테이블에 반영 (원본 변경과 같은 트랜잭션)
+
+        반영된 집계 행은 커밋까지 잠기므로 같은 (일자, 지역, 상태) 행을 갱신하는
+        트랜잭션은 순서대로 대기합니다. 테이블은 ROLLUP_MODELS 순서, 행은 기본 키
+        순서로 잠가 교착은 피하지만, 대량 적재처럼 한 행에 쓰기가 몰리는 작업은
+        track_rollups 하지 않은 엔진이나 벌크 SQL로 적재한 뒤 RollupService.rebuild 로
+        다시 계산하는 편이 낫습니다.
+        """
+        for rollup in ROLLUP_MODELS:
+            increment_rows(connection, rollup.__table__, self.rows(rollup))
+
+def _load_rows(connection: Connection, model: Type, ids: List[int]):
+    if not ids:
+        return []
+    source = SOURCES[model][0]()
+    return connection.execute(source.where(model.id.in_(ids))).all()
+
+def _changed(obj, fields: Iterable[str]) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+def _dependent_ids(connection: Connection, parents: Dict[Type, List[int]]) -> Dict[Type, Set[int]]:
+    """변경/삭제되는 행을 참조하는 원본 행 id (flush 전 DB 기준)"""
+    result: Dict[Type, Set[int]] = defaultdict(set)
+    for parent, ids in parents.items():
+        _, child, foreign_key = DEPENDENT_SOURCES[parent]
+        result[child].update(connection.execute(select(child.id).where(foreign_key.in_(ids))).scalars())
+    return result
+
+_tracked_engines = set()
+
+def track_rollups(engine) -> None:
+    """engine에 연결된 세션의 주문/배송/리뷰 변경을 flush 시점에 집계 테이블에 반영
+
+    ORM 객체 변경만 반영합니다. 벌크 UPDATE/DELETE나 직접 실행한 SQL은 백필로 재계산하세요.
+    """
+    _tracked_engines.add(getattr(engine, "sync_engine", engine))
+    if not event.contains(Session, "before_flush", _before_flush):
+        event.listen(Session, "before_flush", _before_flush)
+        event.listen(Session, "after_flush", _after_flush)
+
+def _is_tracked(session: Session) -> bool:
+    try:
+        return session.get_bind() in _tracked_engines
+    except exc.UnboundExecutionError:
+        return False
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+    if not _is_tracked(session):
+        return
+    # 수정/삭제 전 DB 값으로 기존 기여분을 빼고, 수정된 행은 flush 후 새 값으로 다시 더함
+    # (배송 기사/배송사나 주소가 바뀌면 이를 참조하는 리뷰/주문도 함께 다시 반영)
+    accumulator = RollupAccumulator()
+    old_ids: Dict[Type, Set[int]] = defaultdict(set)
+    reapply_ids: Dict[Type, Set[int]] = defaultdict(set)
+    parents: Dict[Type, List[int]] = defaultdict(list)
+    for obj in session.dirty:
+        model = type(obj)
+        if model in TRACKED_FIELDS and _changed(obj, TRACKED_FIELDS[model]):
+            old_ids[model].add(obj.id)
+            reapply_ids[model].add(obj.id)
+        if model in DEPENDENT_SOURCES and _changed(obj, DEPENDENT_SOURCES[model][0]):
+            parents[model].append(obj.id)
+    for obj in session.deleted:
+        model = type(obj)
+        if model in TRACKED_FIELDS:
+            old_ids[model].add(obj.id)
+        if model in DEPENDENT_SOURCES:
+            parents[model].append(obj.id)
+
+    connection = session.connection()
+    for model, ids in _dependent_ids(connection, parents).items():
+        old_ids[model].update(ids)
+        reapply_ids[model].update(ids)
+    for model, ids in old_ids.items():
+        accumulator.add_rows(model, _load_rows(connection, model, list(ids)), sign=-1)
+    session.info['rollup_pending'] = (accumulator, reapply_ids)
+
+def _after_flush(session: Session, flush_context) -> None:
+    pending = session.info.pop('rollup_pending', None)
+    if pending is None:
+        return
+    accumulator, new_ids = pending
+    for obj in session.new:
+        if type(obj) in TRACKED_FIELDS:
+            new_ids[type(obj)].add(obj.id)
+
+    connection = session.connection()
+    for model, ids in new_ids.items():
+        accumulator.add_rows(model, _load_rows(connection, model, list(ids)))
+    accumulator.apply(connection)
+
+class RollupService:
+    """일별 집계 테이블 백필 (원본 테이블에서 기간 단위로 재계산)"""
+
+    def __init__(self, batch_size: int = 10000):
+        self.batch_size = batch_size
+
+    def rebuild(self, db: Session, start_day: Optional[date] = None, end_day: Optional[date] = None) -> Dict[str, int]:
+        accumulator = RollupAccumulator()
+        for model in SOURCES:
+            query = SOURCES[model][0]()
+            conditions = []
+            if start_day:
+                conditions.append(model.created_at >= datetime.combine(start_day, time.min))
+            if end_day:
+                conditions.append(model.created_at < datetime.combine(end_day + timedelta(days=1), time.min))
+            if conditions:
+                query = query.where(and_(*conditions))
+            # 원본 행을 스트리밍으로 읽어 메모리는 집계 키 수에만 비례
+            result = db.execute(query.execution_options(yield_per=self.batch_size))
+            for rows in result.partitions():
+                accumulator.add_rows(model, rows)
+
+        written = {}
+        for rollup in ROLLUP_MODELS:
+            statement = delete(rollup)
+            if start_day:
+                statement = statement.where(rollup.day >= start_day)
+            if end_day:
+                statement = statement.where(rollup.day <= end_day)
+            db.execute(statement)
+            rows = accumulator.rows(rollup)
+            for offset in range(0, len(rows), self.batch_size):
+                increment_rows(db.connection(), rollup.__table__, rows[offset:offset + self.batch_size])
+            written[rollup.__tablename__] = len(rows)
+        db.commit()
+        logger.info(f"집계 테이블 재계산 완료: {written}")
+        return written
@@ -1,58 +1,100 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Tuple
 from ..schemas.service_options import ServiceOption, ServiceOptionsResponse
+from ..utils.http_cache import PrecomputedJSON
+
+def build_service_options() -> ServiceOptionsResponse:
+    floor_options = [
+        ServiceOption(
+            id=f"floor-{i}",
+            type="floor",
+            label=f"{i}층",
+            description=f"{i}층 배송",
+            fee=i * 10000 if i > 1 else 0,
+            available=True
+        ) for i in range(1, 6)
+    ]
+
+    ladder_options = [
+        ServiceOption(
+            id="ladder-normal",
+            type="ladder",
+            label="사다리차 (1~6층)",
+            description="1층~6층 사다리차 서비스",
+            fee=70000,
+            available=True
+        ),
+        ServiceOption(
+            id="ladder-high",
+            type="ladder",
+            label="고층 사다리차 (7층 이상)",
+            description="7층 이상 고층 사다리차 서비스 (가격 협의 필요)",
+            fee=None,
+            available=True
+        )
+    ]
+
+    special_vehicle_options = [
+        ServiceOption(
+            id="special-sky",
+            type="special",
+            label="스카이차량",
+            description="사다리차 이용이 어려운 경우 (실비청구)",
+            fee=None,
+            available=True
+        ),
+        ServiceOption(
+            id="special-crane",
+            type="special",
+            label="크레인",
+            description="대형 화물 또는 특수 상황 (실비청구)",
+            fee=None,
+            available=True
+        )
+    ]
+
+    return ServiceOptionsResponse(
+        floor_options=floor_options,
+        ladder_options=ladder_options,
+        special_vehicle_options=special_vehicle_options
+    )
 
 class ServiceOptionsService:
+    """서비스 옵션 카탈로그
+
+    옵션 목록, (옵션 종류, id)별 요금 인덱스, 직렬화된 목록 응답을 생성 시 한 번만 만듭니다.
+    """
+
+    def __init__(self):
+        self._options = build_service_options()
+        all_options = (
+            self._options.floor_options
+            + self._options.ladder_options
+            + self._options.special_vehicle_options
+        )
+        # 가격 협의/실비청구 옵션(fee=None)은 0원으로 계산
+        # 다른 종류의 옵션 id(예: 사다리차 자리에 보낸 층수 옵션)는 과금하지 않도록 종류별로 구분
+        self._fees: Mapping[Tuple[str, str], int] = MappingProxyType(
+            {(option.type, option.id): option.fee or 0 for option in all_options}
+        )
+        self._listing = PrecomputedJSON(self._options)
+
     def get_all_options(self) -> ServiceOptionsResponse:
-        floor_options = [
-            ServiceOption(
-                id=f"floor-{i}",
-                type="floor",
-                label=f"{i}층",
-                description=f"{i}층 배송",
-                fee=i * 10000 if i > 1 else 0,
-                available=True
-            ) for i in range(1, 6)
-        ]
-
-        ladder_options = [
-            ServiceOption(
-                id="ladder-normal",
-                type="ladder",
-                label="사다리차 (1~6층)",
-                description="1층~6층 사다리차 서비스",
-                fee=70000,
-                available=True
-            ),
-            ServiceOption(
-                id="ladder-high",
-                type="ladder",
-                label="고층 사다리차 (7층 이상)",
-                description="7층 이상 고층 사다리차 서비스 (가격 협의 필요)",
-                fee=None,
-                available=True
-            )
-        ]
-
-        special_vehicle_options = [
-            ServiceOption(
-                id="special-sky",
-                type="special",
-                label="스카이차량",
-                description="사다리차 이용이 어려운 경우 (실비청구)",
-                fee=None,
-                available=True
-            ),
-            ServiceOption(
-                id="special-crane",
-                type="special",
-                label="크레인",
-                description="대형 화물 또는 특수 상황 (실비청구)",
-                fee=None,
-                available=True
-            )
-        ]
-
-        return ServiceOptionsResponse(
-            floor_options=floor_options,
-            ladder_options=ladder_options,
-            special_vehicle_options=special_vehicle_options
-        ) 
\ No newline at end of file
+        return self._options
+
+    def get_options_listing(self) -> PrecomputedJSON:
+        """옵션 목록의 직렬화된 응답"""
+        return self._listing
+
+    def get_option_fee(self, option_type: str, option_id: str) -> Optional[int]:
+        return self._fees.get((option_type, option_id))
+
+    def calculate_total_fee(self, selections: Iterable[Tuple[str, Optional[str]]]) -> int:
+        """선택된 (옵션 종류, id) 조합의 총 요금 (없는 id나 종류가 다른 id는 무시)"""
+        fees = self._fees
+        return sum(fees.get(selection, 0) for selection in selections if selection[1])
+
+@lru_cache()
+def get_service_options_service() -> ServiceOptionsService:
+    return ServiceOptionsService()
@@ -1,34 +1,53 @@
 from fastapi import Depends
-from redis import Redis
+from redis.exceptions import WatchError
 import json
 from typing import Optional, Dict
 import uuid
-from ..core.redis import get_redis
+import logging
+from ..core.redis import AsyncRedis, get_redis
+
+logger = logging.getLogger(__name__)
 
 class SessionService:
-    def __init__(self, redis: Redis = Depends(get_redis)):
+    def __init__(self, redis: AsyncRedis = Depends(get_redis)):
         self.redis = redis
         self.expire_time = 60 * 60 * 24  # 24시간
+        self.max_retries = 5
+
+    def _key(self, session_id: str) -> str:
+        return f"session:{session_id}"
 
     async def create_session(self) -> str:
         session_id = str(uuid.uuid4())
-        self.redis.setex(f"session:{session_id}", self.expire_time, "{}")
+        await self.redis.setex(self._key(session_id), self.expire_time, "{}")
         return session_id
 
     async def get_session_data(self, session_id: str) -> Dict:
-        data = self.redis.get(f"session:{session_id}")
+        data = await self.redis.get(self._key(session_id))
         if not data:
             return {}
         return json.loads(data)
 
-    async def update_session_data(self, session_id: str, data: Dict):
-        self.redis.setex(
-            f"session:{session_id}",
-            self.expire_time,
-            json.dumps(data)
-        )
+    async def update_session_data(self, session_id: str, data: Dict) -> Dict:
+        """기존 세션 데이터에 data를 병합해 저장 (WATCH/MULTI로 동시 수정 시 재시도)"""
+        key = self._key(session_id)
+        for _ in range(self.max_retries):
+            async with self.redis.pipeline(transaction=True) as pipe:
+                try:
+                    await pipe.watch(key)
+                    current = await pipe.get(key)
+                    merged = {**(json.loads(current) if current else {}), **data}
+                    pipe.multi()
+                    pipe.setex(key, self.expire_time, json.dumps(merged))
+                    await pipe.execute()
+                    return merged
+                except WatchError:
+                    # 다른 요청이 먼저 수정했으면 다시 읽어서 병합
+                    continue
+        logger.error(f"세션 데이터 갱신 재시도 초과: {session_id}")
+        raise RuntimeError("세션 데이터가 동시에 수정되어 저장하지 못했습니다")
 
     async def migrate_to_user(self, session_id: str, user_id: int):
         session_data = await self.get_session_data(session_id)
         # 여기서 사용자 DB에 데이터 저장
-        self.redis.delete(f"session:{session_id}") 
\ No newline at end of file
+        await self.redis.delete(self._key(session_id))
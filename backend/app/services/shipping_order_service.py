@@ -3,9 +3,16 @@ from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from datetime import datetime
 from ..models.shipping_order import ShippingOrder
+from ..models.address import Address
 from ..services.notification_service import NotificationService
 from ..utils.email import conf as email_config
 
+def region_from_address(address: Optional[str]) -> Optional[str]:
+    """주소 문자열의 첫 토큰(시/도)을 지역으로 사용"""
+    if not address or not address.strip():
+        return None
+    return address.split()[0]
+
 class ShippingOrderService:
     def __init__(self):
         self.notification_service = NotificationService({
@@ -25,12 +32,14 @@ class ShippingOrderService:
         to_address_id: int
     ) -> ShippingOrder:
         try:
+            to_address = db.get(Address, to_address_id)
             new_shipping_order = ShippingOrder(
                 order_id=order_id,
                 company_id=company_id,
                 status='pending',
                 from_address_id=from_address_id,
                 to_address_id=to_address_id,
+                region=region_from_address(to_address.address if to_address else None),
                 created_at=datetime.utcnow()
             )
             db.add(new_shipping_order)
@@ -57,6 +66,8 @@ class ShippingOrderService:
         try:
             shipping_order = self.get_shipping_order(db, shipping_order_id)
             shipping_order.status = new_status
+            if new_status == 'delivered' and shipping_order.delivered_at is None:
+                shipping_order.delivered_at = datetime.utcnow()
             if location:
                 shipping_order.current_location = location
             
@@ -11,8 +11,10 @@ from ....models import User
 from ....database import get_db
 from ....core.config import settings, Settings
 from ....utils.state import encode_state, decode_state
+from ....utils.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
+user_info_flight = get_single_flight("google_oauth")
 
 class TokenError(Exception):
     pass
@@ -133,6 +135,10 @@ class GoogleAuthService:
             raise HTTPException(status_code=500, detail=f"Google 로그인 처리 중 오류: {str(e)}")
 
     async def _get_user_info(self, code: str):
+        # 같은 인가 코드로 콜백이 동시에 들어오면 토큰 교환은 한 번만 수행
+        return await user_info_flight.do(code, lambda: self._fetch_user_info(code))
+
+    async def _fetch_user_info(self, code: str):
         try:
             # 1. 액세스 토큰 받기
             token_url = "https://oauth2.googleapis.com/token"
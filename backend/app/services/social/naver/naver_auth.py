@@ -12,8 +12,10 @@ from .naver_utils import NAVER_TOKEN_URL, NAVER_USERINFO_URL  # 상수 import 
 from httpx import Client, HTTPError, ConnectError
 import ssl
 import asyncio
+from ....utils.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
+user_info_flight = get_single_flight("naver_oauth")
 
 class TokenError(Exception):
     pass
@@ -160,6 +162,10 @@ class NaverAuthService:
             raise HTTPException(status_code=500, detail=str(e))
 
     async def _get_user_info(self, code: str):
+        # 같은 인가 코드로 콜백이 동시에 들어오면 토큰 교환은 한 번만 수행
+        return await user_info_flight.do(code, lambda: self._fetch_user_info(code))
+
+    async def _fetch_user_info(self, code: str):
         try:
             token_data = {
                 "grant_type": "authorization_code",
@@ -3,13 +3,14 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
-from ..database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
 from ..models import User
 import logging
 from ..models.coupon import Coupon
 import os
 from ..core.config import get_settings
+from ..services.user_service import UserService
 import bcrypt
 
 # 로깅 설정
@@ -48,7 +49,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """현재 로그인한 사용자 정보 조회"""
     credentials_exception = HTTPException(
@@ -70,7 +71,7 @@ async def get_current_user(
             raise credentials_exception
             
         # 사용자 조회
-        user = db.query(User).filter(User.email == email).first()
+        user = await UserService(db).get_user_by_email(email)
         if user is None:
             logger.error(f"User not found for email: {email}")
             raise credentials_exception
@@ -1,24 +1,232 @@
+from collections import OrderedDict
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+import asyncio
+import inspect
+import logging
+import sys
+import threading
 import time
+from sqlalchemy.orm import Session
+from .single_flight import SingleFlight
 
-def cache(ttl: int = 3600):
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+class LRUCache:
+    """최대 항목 수/바이트와 TTL을 가진 LRU 캐시
+
+    가장 오래 사용되지 않은 항목부터 제거합니다. stale_ttl을 주면 만료된
+    항목도 그 시간 동안은 lookup()으로 꺼낼 수 있어 stale-while-revalidate에
+    사용할 수 있습니다. 적중/미스/제거 카운터로 동작을 확인할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1024,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+        stale_ttl: float = 0.0
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or estimate_size
+        self.stale_ttl = stale_ttl
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.total_bytes = 0
+        # key -> (값, 만료 시각, 크기)
+        self._data: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """만료되지 않은 값만 반환"""
+        value, fresh = self.lookup(key)
+        return value if fresh else default
+
+    def lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """(값, 신선 여부) 반환. 없으면 (_MISSING, False), 만료 후 stale 구간이면 (값, False)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at > now:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value, True
+                if expires_at + self.stale_ttl > now:
+                    self.stale_hits += 1
+                    return value, False
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            return _MISSING, False
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl을 주면 이 항목만 기본 TTL 대신 사용)"""
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        size = self.sizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # 한 항목이 전체 한도보다 크면 캐시하지 않음
+            self.delete(key)
+            return
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, expires_at, size)
+            self.total_bytes += size
+            while self._over_limit():
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def _over_limit(self) -> bool:
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._data.pop(key)
+        self.total_bytes -= size
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.stale_hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": (self.hits + self.stale_hits) / requests if requests else 0.0
+        }
+
+def estimate_size(value: Any, _seen: Optional[set] = None) -> int:
+    """컨테이너를 따라가며 대략적인 메모리 크기(바이트) 추정"""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, (str, bytes, bytearray, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, _seen) + estimate_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, _seen) for item in value)
+    elif hasattr(value, "__dict__"):
+        size += estimate_size(vars(value), _seen)
+    return size
+
+def _freeze(value: Any) -> Hashable:
+    # 리스트/딕셔너리 인자도 키로 사용할 수 있도록 변환
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+def make_key_builder(func: Callable, ignore: Iterable[str] = ("db",)) -> Callable[..., Hashable]:
+    """함수 인자로 캐시 키를 만드는 함수 생성
+
+    ignore에 포함된 인자와 SQLAlchemy Session 인자는 키에서 제외합니다.
+    """
+    signature = inspect.signature(func)
+    ignored = frozenset(ignore)
+
+    def build_key(*args, **kwargs) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return tuple(
+            (name, _freeze(value))
+            for name, value in bound.arguments.items()
+            if name not in ignored and not isinstance(value, Session)
+        )
+
+    return build_key
+
+def cache(
+    ttl: Optional[float] = 3600,
+    maxsize: Optional[int] = 1024,
+    max_bytes: Optional[int] = None,
+    key: Optional[Callable[..., Hashable]] = None,
+    ignore: Iterable[str] = ("db",),
+    stale_ttl: float = 0.0
+):
+    """비동기 함수 결과 캐시 데코레이터
+
+    - ttl/maxsize/max_bytes: 만료 시간과 항목 수/바이트 한도 (LRU 제거)
+    - key: 캐시 키 함수 (기본값은 ignore 인자와 db 세션을 제외한 인자)
+    - stale_ttl: 만료 후 이 시간 동안은 이전 값을 바로 반환하고 백그라운드에서 갱신
+      (갱신 시 원래 인자를 재사용하므로 요청 범위의 db 세션을 받는 함수에는 쓰지 않음)
+    - 동시에 같은 키로 미스가 나면 원본 함수는 한 번만 호출
+
+    wrapper.cache_stats(), wrapper.cache_clear(), wrapper.cache_invalidate(*args)를 제공합니다.
+    """
     def decorator(func: Callable) -> Callable:
-        cache_data = {}
-        
-        @wraps(func)
-        async def wrapper(*args, **kwargs) -> Any:
-            cache_key = str(args) + str(kwargs)
-            current_time = time.time()
-            
-            if cache_key in cache_data:
-                result, timestamp = cache_data[cache_key]
-                if current_time - timestamp < ttl:
-                    return result
-            
+        store = LRUCache(maxsize=maxsize, ttl=ttl, max_bytes=max_bytes, stale_ttl=stale_ttl)
+        build_key = key or make_key_builder(func, ignore)
+        flight = SingleFlight(func.__qualname__)
+
+        async def load(cache_key: Hashable, args, kwargs) -> Any:
             result = await func(*args, **kwargs)
-            cache_data[cache_key] = (result, current_time)
+            store.set(cache_key, result)
             return result
-            
+
+        async def revalidate(cache_key: Hashable, args, kwargs) -> None:
+            try:
+                await flight.do(cache_key, lambda: load(cache_key, args, kwargs))
+            except Exception as e:
+                # 갱신에 실패하면 stale 값이 stale_ttl 동안 계속 사용됨
+                logger.error(f"{func.__qualname__} 캐시 갱신 중 오류 발생: {str(e)}")
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            cache_key = build_key(*args, **kwargs)
+            value, fresh = store.lookup(cache_key)
+            if fresh:
+                return value
+            if value is not _MISSING:
+                asyncio.ensure_future(revalidate(cache_key, args, kwargs))
+                return value
+            return await flight.do(cache_key, lambda: load(cache_key, args, kwargs))
+
+        wrapper.cache = store
+        wrapper.cache_stats = store.stats
+        wrapper.cache_clear = store.clear
+        wrapper.cache_invalidate = lambda *args, **kwargs: store.delete(build_key(*args, **kwargs))
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator
@@ -0,0 +1,36 @@
+from typing import Any, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+import hashlib
+import json
+
+class PrecomputedJSON:
+    """미리 직렬화한 JSON 응답 본문과 강한(strong) ETag"""
+
+    media_type = "application/json"
+
+    def __init__(self, content: Any):
+        self.body = json.dumps(
+            jsonable_encoder(content),
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()[:32]}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 주어진 ETag와 일치하는지 확인"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두어는 무시
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def cached_json_response(request: Request, payload: PrecomputedJSON) -> Response:
+    """ETag가 일치하면 304, 아니면 미리 직렬화된 본문을 그대로 반환"""
+    headers = {"ETag": payload.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload.body, media_type=payload.media_type, headers=headers)
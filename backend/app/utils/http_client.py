@@ -0,0 +1,46 @@
+from importlib.util import find_spec
+from typing import Optional
+import logging
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# h2 패키지가 설치된 경우에만 HTTP/2 사용
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+
+_client: Optional[httpx.AsyncClient] = None
+
+def create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=HTTP_LIMITS,
+        timeout=HTTP_TIMEOUT
+    )
+
+def get_http_client() -> httpx.AsyncClient:
+    """외부 API 호출용 공유 클라이언트 (연결 풀/keep-alive 재사용)
+
+    앱 시작 시 start_http_client()로 생성되며, 그 전에 호출되면 바로 생성합니다.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+async def start_http_client() -> httpx.AsyncClient:
+    client = get_http_client()
+    logger.info(f"공유 HTTP 클라이언트 생성 (HTTP/2: {HTTP2_AVAILABLE})")
+    return client
+
+async def close_http_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,63 +0,0 @@
-from typing import Dict, Any
-from ..schemas.order_dto import OrderDTO
-
-class PriceCalculator:
-    def calculate_total_price(self, data: Dict[str, Any]) -> Dict[str, float]:
-        try:
-            # 기본 가격 계산
-            base_price = self._calculate_base_price(data['items'])
-            
-            # 거리 요금 계산
-            distance_fee = self._calculate_distance_fee(
-                data['from_address_id'],
-                data['to_address_id']
-            )
-            
-            # 층수 요금 계산
-            floor_fee = self._calculate_floor_fee(data['floor_info'])
-            
-            # 특수 요구사항 요금 계산
-            special_fee = self._calculate_special_fee(data.get('special_requirements', {}))
-            
-            # 할인 계산
-            discount_amount = self._calculate_discount(base_price)
-            
-            # 최종 가격 계산
-            final_price = (
-                base_price + 
-                distance_fee + 
-                floor_fee + 
-                special_fee - 
-                discount_amount
-            )
-            
-            return {
-                'base_price': base_price,
-                'distance_fee': distance_fee,
-                'floor_fee': floor_fee,
-                'special_fee': special_fee,
-                'discount_amount': discount_amount,
-                'final_price': final_price
-            }
-            
-        except Exception as e:
-            raise ValueError(f"가격 계산 중 오류 발생: {str(e)}")
-
-    def _calculate_base_price(self, items: list) -> float:
-        return sum(item.get('price', 0) for item in items)
-
-    def _calculate_distance_fee(self, from_id: int, to_id: int) -> float:
-        # 거리 기반 요금 계산 로직
-        return 0.0  # 임시 반환값
-
-    def _calculate_floor_fee(self, floor_info: Dict) -> float:
-        # 층수 기반 요금 계산 로직
-        return 0.0  # 임시 반환값
-
-    def _calculate_special_fee(self, special_requirements: Dict) -> float:
-        # 특수 요구사항 요금 계산 로직
-        return 0.0  # 임시 반환값
-
-    def _calculate_discount(self, base_price: float) -> float:
-        # 할인 계산 로직
-        return 0.0  # 임시 반환값
\ No newline at end of file
@@ -0,0 +1,61 @@
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+class DDSketch:
+    """상대 오차가 보장되는 분위수 스케치 (DDSketch)
+
+    양수 값을 로그 간격 버킷(γ = (1 + α) / (1 - α))의 건수로만 기록하므로,
+    같은 설정의 스케치는 버킷별 건수를 더하는 것만으로 합칠 수 있고 건수를
+    빼면 값을 제거할 수도 있습니다. 분위수 추정값은 실제 값 대비 상대 오차
+    α 이내입니다. min_value 이하의 값은 min_value 버킷에 기록합니다.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, min_value: float = 1e-3):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.bins: Dict[int, int] = {}
+
+    def key(self, value: float) -> int:
+        """값이 들어갈 버킷 번호 (γ^(k-1) < value <= γ^k)"""
+        return math.ceil(math.log(max(value, self.min_value)) / self._log_gamma)
+
+    def value(self, key: int) -> float:
+        """버킷의 대표값 (버킷 범위 안의 모든 값에 대해 상대 오차 α 이내)"""
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    @property
+    def count(self) -> int:
+        return sum(self.bins.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        key = self.key(value)
+        self.bins[key] = self.bins.get(key, 0) + count
+
+    def add_bins(self, bins: Iterable[Tuple[int, int]]) -> None:
+        """(버킷 번호, 건수) 목록을 더함 (DB에 저장된 버킷 합산용)"""
+        for key, count in bins:
+            total = self.bins.get(key, 0) + count
+            if total:
+                self.bins[key] = total
+            else:
+                self.bins.pop(key, None)
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("상대 오차 설정이 다른 스케치는 합칠 수 없습니다")
+        self.add_bins(other.bins.items())
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 추정값 (nearest-rank: 누적 건수가 q × 전체 건수 이상이 되는 버킷, 비어 있으면 None)"""
+        total = self.count
+        if total <= 0:
+            return None
+        rank = q * total
+        cumulative = 0
+        for key in sorted(self.bins):
+            cumulative += self.bins[key]
+            if cumulative >= rank:
+                return self.value(key)
+        return self.value(max(self.bins))
@@ -0,0 +1,56 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+import asyncio
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """동시에 진행 중인 같은 키의 호출을 하나로 합침
+
+    첫 호출만 실제로 실행되고, 완료 전에 들어온 같은 키의 호출은 그 결과
+    (또는 예외)를 함께 받습니다. 완료된 결과는 보관하지 않으므로 캐시가
+    아니라 중복 호출 제거 용도입니다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.coalesced = 0
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._inflight.get(key)
+        if future is None:
+            self.calls += 1
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._forget(key, future))
+        else:
+            self.coalesced += 1
+        # 기다리던 요청 하나가 취소되어도 공유 중인 호출은 계속 진행
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 예외가 로그에 경고로 남지 않도록 조회
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight)
+        }
+
+_groups: Dict[str, SingleFlight] = {}
+
+def get_single_flight(name: str) -> SingleFlight:
+    """이름별 공유 SingleFlight (지표 집계용 레지스트리)"""
+    group = _groups.get(name)
+    if group is None:
+        group = _groups[name] = SingleFlight(name)
+    return group
+
+def single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: group.stats() for name, group in _groups.items()}
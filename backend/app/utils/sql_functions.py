@@ -0,0 +1,77 @@
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import Table, and_, case, func, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+# 집계 쿼리에서 쓰는 DB별 표현식 (SQLite / PostgreSQL)
+
+def dialect_name(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+def hours_between(db: Session, start: Any, end: Any):
+    """두 DateTime 컬럼 사이의 시간(시 단위)"""
+    if dialect_name(db) == "postgresql":
+        return func.extract("epoch", end - start) / 3600.0
+    return (func.julianday(end) - func.julianday(start)) * 24.0
+
+def percentiles(
+    db: Session,
+    value: Any,
+    quantiles: Sequence[float],
+    where: Sequence[Any] = (),
+    partition_by: Optional[Any] = None
+) -> Dict[Any, List[Optional[float]]]:
+    """value 컬럼의 분위수(nearest-rank)를 DB에서 계산해 그룹 키별 [q1 값, q2 값, ...]로 반환
+
+    PostgreSQL은 percentile_disc, SQLite는 윈도 함수 순위로 같은 값을 계산합니다.
+    partition_by가 없으면 None 키 하나만 반환합니다.
+    """
+    key = partition_by if partition_by is not None else literal(None)
+    if dialect_name(db) == "postgresql":
+        statement = select(
+            key.label("key"),
+            *[func.percentile_disc(q).within_group(value) for q in quantiles]
+        ).where(*where)
+    else:
+        ranked = select(
+            key.label("key"),
+            value.label("value"),
+            func.row_number().over(partition_by=partition_by, order_by=value).label("rank"),
+            func.count().over(partition_by=partition_by).label("total")
+        ).where(*where).subquery()
+        # 순위가 ceil(q × 전체 건수)인 값
+        statement = select(
+            ranked.c.key,
+            *[
+                func.max(case(
+                    (and_(ranked.c.rank >= q * ranked.c.total, ranked.c.rank - 1 < q * ranked.c.total), ranked.c.value)
+                ))
+                for q in quantiles
+            ]
+        ).select_from(ranked)
+        key = ranked.c.key
+    if partition_by is not None:
+        statement = statement.group_by(key)
+    return {row[0]: list(row[1:]) for row in db.execute(statement) if row[1] is not None}
+
+def increment_rows(connection: Connection, table: Table, rows: List[Dict[str, Any]]) -> None:
+    """기본 키가 같은 행이 있으면 나머지 컬럼 값을 더하고 없으면 삽입 (INSERT ... ON CONFLICT)
+
+    갱신된 행은 커밋까지 행 잠금이 유지되므로, 동시 트랜잭션끼리 교착하지 않도록
+    모든 호출이 같은 순서(기본 키 오름차순)로 행을 잠그게 정렬해서 실행합니다.
+    """
+    if not rows:
+        return
+    dialect = postgresql if connection.dialect.name == "postgresql" else sqlite
+    keys = [column.name for column in table.primary_key.columns]
+    rows = sorted(rows, key=lambda row: tuple(row[key] for key in keys))
+    statement = dialect.insert(table)
+    statement = statement.on_conflict_do_update(
+        index_elements=keys,
+        set_={
+            column.name: table.c[column.name] + statement.excluded[column.name]
+            for column in table.columns if column.name not in keys
+        }
+    )
+    connection.execute(statement, rows)
@@ -0,0 +1,292 @@
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+import msgpack
+from pydantic import BaseModel
+from ..core.config import settings
+from ..core.redis import get_cache_redis, get_sync_cache_redis
+from .cache_manager import LRUCache, _MISSING
+from .single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# msgpack 확장 타입 코드
+_EXT_DATETIME = 1
+_EXT_DATE = 2
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode())
+    if isinstance(value, date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode())
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"캐시에 저장할 수 없는 타입: {type(value).__name__}")
+
+def _decode_ext(code: int, data: bytes) -> Any:
+    if code == _EXT_DATETIME:
+        return datetime.fromisoformat(data.decode())
+    if code == _EXT_DATE:
+        return date.fromisoformat(data.decode())
+    return msgpack.ExtType(code, data)
+
+def pack(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True, default=_encode_default)
+
+def unpack(data: bytes) -> Any:
+    return msgpack.unpackb(data, raw=False, ext_hook=_decode_ext, strict_map_key=False)
+
+def encode_key(key: Hashable) -> str:
+    """프로세스와 무관하게 같은 문자열이 되는 캐시 키"""
+    if isinstance(key, str) and len(key) <= 128:
+        return key
+    return hashlib.sha1(repr(key).encode()).hexdigest()
+
+class TieredCache:
+    """로컬 LRU(1단계) + Redis(2단계) 캐시
+
+    여러 uvicorn 워커가 Redis 계층을 공유하므로 get_or_set()으로 만든 값은
+    클러스터에서 한 번만 계산됩니다 (Redis 잠금으로 다른 워커는 결과를 기다림).
+    값은 msgpack으로 직렬화하고, 키는 "{prefix}:{namespace}:{key}" 형식입니다.
+    태그로 묶인 키는 invalidate_tags()로 한 번에 삭제할 수 있습니다.
+
+    Redis가 설정되지 않았거나 장애가 나면 로컬 계층만으로 동작합니다.
+    다른 워커의 로컬 계층은 무효화 후 최대 local_ttl 동안 이전 값을 볼 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis: Any = None,
+        ttl: float = 300,
+        local_ttl: float = 5,
+        local_maxsize: int = 1024,
+        prefix: str = "bigmove",
+        lock_timeout: float = 10.0
+    ):
+        self.namespace = namespace
+        self.redis = redis
+        self.ttl = ttl
+        self.prefix = prefix
+        self.lock_timeout = lock_timeout
+        self.local = LRUCache(maxsize=local_maxsize, ttl=local_ttl)
+        self.single_flight = SingleFlight(f"cache:{namespace}")
+        self.remote_hits = 0
+        self.remote_misses = 0
+        self.remote_errors = 0
+        self.computed = 0
+        # 태그 -> 로컬 계층 키 (이 프로세스에서 태그 무효화 시 사용)
+        self._local_tags: Dict[str, set] = {}
+
+    def redis_key(self, key: Hashable) -> str:
+        return f"{self.prefix}:{self.namespace}:{encode_key(key)}"
+
+    def tag_key(self, tag: str) -> str:
+        return tag_key(self.prefix, tag)
+
+    async def get(self, key: Hashable, default: Any = None) -> Any:
+        full_key = self.redis_key(key)
+        value = self.local.get(full_key, _MISSING)
+        if value is _MISSING:
+            value = await self._remote_get(full_key)
+            if value is not _MISSING:
+                self.local.set(full_key, value)
+        return default if value is _MISSING else value
+
+    async def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = ()
+    ) -> None:
+        full_key = self.redis_key(key)
+        self.local.set(full_key, value)
+        for tag in tags:
+            self._local_tags.setdefault(tag, set()).add(full_key)
+        if self.redis is None:
+            return
+
+        ttl = ttl or self.ttl
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(full_key, pack(value), px=int(ttl * 1000))
+                for tag in tags:
+                    pipe.sadd(self.tag_key(tag), full_key)
+                    # 태그 집합은 항목보다 조금 더 오래 유지
+                    pipe.expire(self.tag_key(tag), int(ttl) + 60)
+                await pipe.execute()
+        except Exception as e:
+            self._remote_error("저장", e)
+
+    async def delete(self, key: Hashable) -> None:
+        full_key = self.redis_key(key)
+        self.local.delete(full_key)
+        if self.redis is not None:
+            try:
+                await self.redis.delete(full_key)
+            except Exception as e:
+                self._remote_error("삭제", e)
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = ()
+    ) -> Any:
+        """캐시에 없으면 loader로 계산해 저장 (워커 내/워커 간 중복 계산 방지)"""
+        value = await self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        full_key = self.redis_key(key)
+        return await self.single_flight.do(full_key, lambda: self._load(key, loader, ttl, tuple(tags)))
+
+    async def _load(self, key: Hashable, loader, ttl, tags) -> Any:
+        full_key = self.redis_key(key)
+        lock_key = f"{full_key}:lock"
+        token = uuid.uuid4().hex
+        locked = await self._acquire_lock(lock_key, token)
+
+        if not locked and self.redis is not None:
+            # 다른 워커가 계산 중이면 결과가 저장될 때까지 대기
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                value = await self._remote_get(full_key)
+                if value is not _MISSING:
+                    self.local.set(full_key, value)
+                    return value
+
+        try:
+            self.computed += 1
+            value = await loader()
+            await self.set(key, value, ttl=ttl, tags=tags)
+            return value
+        finally:
+            if locked:
+                await self._release_lock(lock_key, token)
+
+    async def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        if self.redis is None:
+            return False
+        try:
+            return bool(await self.redis.set(lock_key, token, nx=True, px=int(self.lock_timeout * 1000)))
+        except Exception as e:
+            self._remote_error("잠금", e)
+            return False
+
+    async def _release_lock(self, lock_key: str, token: str) -> None:
+        try:
+            # 잠금 시간이 지나 다른 워커가 가져간 잠금은 지우지 않음
+            if await self.redis.get(lock_key) == token.encode():
+                await self.redis.delete(lock_key)
+        except Exception as e:
+            self._remote_error("잠금 해제", e)
+
+    async def _remote_get(self, full_key: str) -> Any:
+        if self.redis is None:
+            return _MISSING
+        try:
+            data = await self.redis.get(full_key)
+        except Exception as e:
+            self._remote_error("조회", e)
+            return _MISSING
+        if data is None:
+            self.remote_misses += 1
+            return _MISSING
+        self.remote_hits += 1
+        return unpack(data)
+
+    def invalidate_local(self, tags: Iterable[str], keys: Iterable[str] = ()) -> None:
+        for tag in tags:
+            for full_key in self._local_tags.pop(tag, ()):
+                self.local.delete(full_key)
+        for full_key in keys:
+            self.local.delete(full_key)
+
+    def _remote_error(self, action: str, error: Exception) -> None:
+        self.remote_errors += 1
+        logger.error(f"Redis 캐시 {action} 중 오류 발생 ({self.namespace}): {str(error)}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "local": self.local.stats(),
+            "remote_enabled": self.redis is not None,
+            "remote_hits": self.remote_hits,
+            "remote_misses": self.remote_misses,
+            "remote_errors": self.remote_errors,
+            "computed": self.computed
+        }
+
+def tag_key(prefix: str, tag: str) -> str:
+    return f"{prefix}:tag:{tag}"
+
+_caches: Dict[str, TieredCache] = {}
+
+def get_tiered_cache(
+    namespace: str,
+    ttl: float = 300,
+    local_ttl: Optional[float] = None,
+    local_maxsize: int = 1024
+) -> TieredCache:
+    """네임스페이스별 공유 TieredCache (처음 호출할 때의 설정으로 생성)"""
+    cache = _caches.get(namespace)
+    if cache is None:
+        cache = _caches[namespace] = TieredCache(
+            namespace,
+            redis=get_cache_redis(),
+            ttl=ttl,
+            local_ttl=local_ttl or settings.CACHE_LOCAL_TTL_SECONDS,
+            local_maxsize=local_maxsize,
+            prefix=settings.CACHE_KEY_PREFIX
+        )
+    return cache
+
+def tiered_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
+
+def _clear_local(tags: Iterable[str], keys: Iterable[Any] = ()) -> None:
+    # 이 프로세스의 로컬 계층에서도 해당 키 제거
+    decoded = [key.decode() if isinstance(key, bytes) else key for key in keys]
+    for cache in _caches.values():
+        cache.invalidate_local(tags, decoded)
+
+async def invalidate_tags(*tags: str) -> int:
+    """태그에 속한 모든 캐시 키 삭제 (Redis에서 삭제한 키 수 반환)"""
+    redis = get_cache_redis()
+    keys = set()
+    if redis is not None:
+        prefix = settings.CACHE_KEY_PREFIX
+        try:
+            for tag in tags:
+                keys.update(await redis.smembers(tag_key(prefix, tag)))
+            await redis.delete(*keys, *(tag_key(prefix, tag) for tag in tags))
+        except Exception as e:
+            logger.error(f"Redis 캐시 태그 무효화 중 오류 발생 ({tags}): {str(e)}")
+    _clear_local(tags, keys)
+    return len(keys)
+
+def invalidate_tags_sync(*tags: str) -> int:
+    """동기 코드(스크립트, 임포트 작업)용 태그 무효화"""
+    redis = get_sync_cache_redis()
+    keys = set()
+    if redis is not None:
+        prefix = settings.CACHE_KEY_PREFIX
+        try:
+            for tag in tags:
+                keys.update(redis.smembers(tag_key(prefix, tag)))
+            redis.delete(*keys, *(tag_key(prefix, tag) for tag in tags))
+        except Exception as e:
+            logger.error(f"Redis 캐시 태그 무효화 중 오류 발생 ({tags}): {str(e)}")
+    _clear_local(tags, keys)
+    return len(keys)
@@ -0,0 +1,36 @@
+"""create geocode cache table
+
+Revision ID: 5b2e7c1d9a40
+Revises: 9088013f6004
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e7c1d9a40'
+down_revision: Union[str, None] = '9088013f6004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'geocode_cache',
+        sa.Column('query', sa.String(), nullable=False, comment='정규화된 검색어'),
+        sa.Column('documents', sa.JSON(), nullable=False, comment='주소 검색 결과 목록'),
+        sa.Column('hit_count', sa.Integer(), nullable=True, comment='조회 횟수 (사전 적재 우선순위)'),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('query')
+    )
+    op.create_index(op.f('ix_geocode_cache_hit_count'), 'geocode_cache', ['hit_count'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_geocode_cache_hit_count'), table_name='geocode_cache')
+    op.drop_table('geocode_cache')
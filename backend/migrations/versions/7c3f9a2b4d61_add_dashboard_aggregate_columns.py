@@ -0,0 +1,42 @@
+"""add dashboard aggregate columns
+
+Revision ID: 7c3f9a2b4d61
+Revises: 5b2e7c1d9a40
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f9a2b4d61'
+down_revision: Union[str, None] = '5b2e7c1d9a40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('orders', sa.Column('total_price', sa.Integer(), nullable=True, comment='확정 주문 금액'))
+    op.add_column('shipping_orders', sa.Column('delivered_at', sa.DateTime(), nullable=True, comment='배송 완료 시각'))
+    op.add_column('shipping_orders', sa.Column('region', sa.String(), nullable=True, comment='도착지 시/도'))
+
+    # 대시보드 기간 집계 (created_at >= 시작일)를 인덱스만으로 처리하는 커버링 인덱스
+    op.create_index('ix_orders_created_at_total_price', 'orders', ['created_at', 'total_price'], unique=False)
+    op.create_index(
+        'ix_shipping_orders_dashboard', 'shipping_orders',
+        ['created_at', 'status', 'region', 'delivered_at'], unique=False
+    )
+    op.create_index('ix_reviews_created_at_rating', 'reviews', ['created_at', 'rating'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_created_at_rating', table_name='reviews')
+    op.drop_index('ix_shipping_orders_dashboard', table_name='shipping_orders')
+    op.drop_index('ix_orders_created_at_total_price', table_name='orders')
+
+    op.drop_column('shipping_orders', 'region')
+    op.drop_column('shipping_orders', 'delivered_at')
+    op.drop_column('orders', 'total_price')
@@ -0,0 +1,100 @@
+"""create daily rollup tables
+
+Revision ID: a4d8e6f1c2b3
+Revises: 7c3f9a2b4d61
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d8e6f1c2b3'
+down_revision: Union[str, None] = '7c3f9a2b4d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('shipping_orders', sa.Column('shipping_fee', sa.Integer(), nullable=True, comment='배송비'))
+
+    op.create_table(
+        'daily_order_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('region', sa.String(), nullable=False, comment='도착지 시/도 (미지정은 빈 문자열)'),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'region', 'status')
+    )
+    op.create_table(
+        'daily_item_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('furniture_id', sa.String(), nullable=False),
+        sa.Column('order_count', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'furniture_id')
+    )
+    op.create_table(
+        'daily_shipment_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('region', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('shipment_count', sa.Integer(), nullable=False),
+        sa.Column('shipping_fee', sa.BigInteger(), nullable=False),
+        sa.Column('timed_count', sa.Integer(), nullable=False, comment='배송 완료 시각이 있는 건수'),
+        sa.Column('delivery_hours', sa.Float(), nullable=False, comment='배송 소요 시간 합계'),
+        sa.Column('hours_0_2', sa.Integer(), nullable=False),
+        sa.Column('hours_2_4', sa.Integer(), nullable=False),
+        sa.Column('hours_4_8', sa.Integer(), nullable=False),
+        sa.Column('hours_8_24', sa.Integer(), nullable=False),
+        sa.Column('hours_24_plus', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'region', 'status')
+    )
+    op.create_table(
+        'daily_driver_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False, comment='미지정은 0'),
+        sa.Column('driver_id', sa.Integer(), nullable=False, comment='미배정은 0'),
+        sa.Column('shipment_count', sa.Integer(), nullable=False),
+        sa.Column('delivered_count', sa.Integer(), nullable=False),
+        sa.Column('delayed_count', sa.Integer(), nullable=False),
+        sa.Column('shipping_fee', sa.BigInteger(), nullable=False),
+        sa.Column('delivered_fee', sa.BigInteger(), nullable=False),
+        sa.Column('timed_count', sa.Integer(), nullable=False),
+        sa.Column('delivery_hours', sa.Float(), nullable=False),
+        sa.Column('hours_0_2', sa.Integer(), nullable=False),
+        sa.Column('hours_2_4', sa.Integer(), nullable=False),
+        sa.Column('hours_4_8', sa.Integer(), nullable=False),
+        sa.Column('hours_8_24', sa.Integer(), nullable=False),
+        sa.Column('hours_24_plus', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'company_id', 'driver_id')
+    )
+    op.create_table(
+        'daily_review_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('driver_id', sa.Integer(), nullable=False),
+        sa.Column('review_count', sa.Integer(), nullable=False),
+        sa.Column('rating_sum', sa.Float(), nullable=False),
+        sa.Column('service_rating_sum', sa.Float(), nullable=False),
+        sa.Column('driver_rating_sum', sa.Float(), nullable=False),
+        sa.Column('rating_1', sa.Integer(), nullable=False),
+        sa.Column('rating_2', sa.Integer(), nullable=False),
+        sa.Column('rating_3', sa.Integer(), nullable=False),
+        sa.Column('rating_4', sa.Integer(), nullable=False),
+        sa.Column('rating_5', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'company_id', 'driver_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_review_rollups')
+    op.drop_table('daily_driver_rollups')
+    op.drop_table('daily_shipment_rollups')
+    op.drop_table('daily_item_rollups')
+    op.drop_table('daily_order_rollups')
+    op.drop_column('shipping_orders', 'shipping_fee')
@@ -0,0 +1,40 @@
+"""add shipping order performance indexes
+
+Revision ID: c5e1f7a3b9d2
+Revises: a4d8e6f1c2b3
+Create Date: 2026-10-18 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1f7a3b9d2'
+down_revision: Union[str, None] = 'a4d8e6f1c2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 배송사/기사/지역별 기간 조회와 배송 시간 분위수 계산용
+    op.create_index(
+        'ix_shipping_orders_company_created_at', 'shipping_orders',
+        ['company_id', 'created_at', 'delivered_at'], unique=False
+    )
+    op.create_index(
+        'ix_shipping_orders_driver_created_at', 'shipping_orders',
+        ['driver_id', 'created_at', 'delivered_at'], unique=False
+    )
+    op.create_index(
+        'ix_shipping_orders_region_created_at', 'shipping_orders',
+        ['region', 'created_at', 'delivered_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_shipping_orders_region_created_at', table_name='shipping_orders')
+    op.drop_index('ix_shipping_orders_driver_created_at', table_name='shipping_orders')
+    op.drop_index('ix_shipping_orders_company_created_at', table_name='shipping_orders')
@@ -0,0 +1,34 @@
+"""create daily delivery sketches
+
+Revision ID: d7a2c4e8f1b6
+Revises: c5e1f7a3b9d2
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7a2c4e8f1b6'
+down_revision: Union[str, None] = 'c5e1f7a3b9d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 배송사/일별 배송 소요 시간 DDSketch 버킷 (생성 후 scripts/backfill_rollups.py로 채움)
+    op.create_table(
+        'daily_delivery_sketches',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False, comment='미지정은 0'),
+        sa.Column('bucket', sa.Integer(), nullable=False, comment='DDSketch 버킷 번호'),
+        sa.Column('delivery_count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'company_id', 'bucket')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('daily_delivery_sketches')
@@ -0,0 +1,30 @@
+import sys
+import os
+import argparse
+import time
+from datetime import date
+
+# 백엔드 앱 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.database import SessionLocal
+from app.services.rollup_service import RollupService
+
+def backfill_rollups(start_day: date = None, end_day: date = None, batch_size: int = 10000):
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        written = RollupService(batch_size=batch_size).rebuild(db, start_day, end_day)
+        for table, rows in written.items():
+            print(f"{table}: {rows:,}행")
+        print(f"집계 테이블 재계산 완료 ({time.perf_counter() - started:.1f}초)")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주문/배송/리뷰 원본에서 일별 집계 테이블 재계산")
+    parser.add_argument("--start", type=date.fromisoformat, help="시작일 YYYY-MM-DD (기본값: 전체)")
+    parser.add_argument("--end", type=date.fromisoformat, help="종료일 YYYY-MM-DD (포함, 기본값: 전체)")
+    parser.add_argument("--batch-size", type=int, default=10000, help="원본 조회/기록 배치 크기")
+    args = parser.parse_args()
+    backfill_rollups(args.start, args.end, args.batch_size)
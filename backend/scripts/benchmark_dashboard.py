@@ -0,0 +1,144 @@
+import sys
+import os
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# 백엔드 앱 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Address, Furniture, Order, Review, ShippingOrder
+from app.services.dashboard_service import DashboardService
+from app.services.order_service import OrderService
+from app.services.performance_analysis_service import PerformanceAnalysisService
+from app.services.review_service import ReviewService
+from app.services.rollup_service import ROLLUP_MODELS, RollupService
+from app.services.shipping_order_service import ShippingOrderService
+
+REGIONS = ["서울특별시", "부산광역시", "대구광역시", "인천광역시", "경기도", "강원도", "제주특별자치도"]
+STATUSES = ["delivered"] * 7 + ["pending", "in_transit", "cancelled"]
+FURNITURE_IDS = [f"item-{i}" for i in range(50)]
+
+def seed(engine, orders: int, span_days: int, batch: int = 50000) -> None:
+    """주문 orders건과 주문당 배송 1건, 주문 5건당 리뷰 1건 생성 (원본만 기록, 집계는 백필)"""
+    for model in (Address, Furniture, Order, ShippingOrder, Review) + ROLLUP_MODELS:
+        model.__table__.create(engine)
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    connection = engine.raw_connection()
+    cursor = connection.cursor()
+    cursor.executemany(
+        "INSERT INTO furniture (id, name) VALUES (?, ?)",
+        [(item_id, f"가구 {item_id}") for item_id in FURNITURE_IDS]
+    )
+
+    for offset in range(0, orders, batch):
+        order_rows, shipping_rows, review_rows = [], [], []
+        for order_id in range(offset + 1, min(offset + batch, orders) + 1):
+            created_at = now - timedelta(seconds=rng.randrange(span_days * 86400))
+            items = ",".join(f'{{"id": "{rng.choice(FURNITURE_IDS)}"}}' for _ in range(rng.randint(1, 3)))
+            order_rows.append((order_id, "completed", f"[{items}]", rng.randrange(50000, 2000000, 1000), created_at))
+
+            status = rng.choice(STATUSES)
+            delivered_at = created_at + timedelta(hours=rng.uniform(2, 72)) if status == "delivered" else None
+            # 배송사 20곳, 배송사마다 기사 10명
+            company_id = rng.randint(1, 20)
+            shipping_rows.append((
+                order_id, order_id, company_id, company_id * 100 + rng.randrange(10), status, rng.choice(REGIONS),
+                rng.randrange(30000, 200000, 1000), f"T{order_id}", created_at, delivered_at
+            ))
+            if order_id % 5 == 0:
+                review_rows.append((order_id, order_id, rng.randint(1, 5), created_at))
+
+        cursor.executemany(
+            "INSERT INTO orders (id, status, items, total_price, created_at) VALUES (?, ?, ?, ?, ?)",
+            order_rows
+        )
+        cursor.executemany(
+            "INSERT INTO shipping_orders (id, order_id, company_id, driver_id, status, region, shipping_fee,"
+            " tracking_number, created_at, delivered_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            shipping_rows
+        )
+        cursor.executemany(
+            "INSERT INTO reviews (order_id, shipping_order_id, rating, created_at) VALUES (?, ?, ?, ?)",
+            review_rows
+        )
+        connection.commit()
+    cursor.execute("ANALYZE")
+    connection.close()
+
+def measure(function, *args) -> dict:
+    tracemalloc.start()
+    started = time.perf_counter()
+    function(*args)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"elapsed_ms": elapsed * 1000, "peak_mb": peak / 1024 / 1024}
+
+def company_performance(db, days: int) -> None:
+    end_date = datetime.utcnow()
+    PerformanceAnalysisService(None, None).analyze_company_performance(db, 1, end_date - timedelta(days=days), end_date)
+
+def performance_reports(db, days: int) -> None:
+    # 기사 랭킹/배송 시간/지역별 분석 (분위수 포함)
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
+    service = PerformanceAnalysisService(None, None)
+    service.get_driver_performance_ranking(db, start_date, end_date, 10)
+    service.analyze_delivery_times(db, start_date, end_date)
+    service.analyze_regional_performance(db, start_date, end_date)
+
+def load_rows(db, days: int) -> None:
+    # 비교용: 기간 내 주문/배송/리뷰 행을 모두 메모리로 불러오는 기존 방식
+    start_date = datetime.utcnow() - timedelta(days=days)
+    db.query(Order).filter(Order.created_at >= start_date).all()
+    db.query(ShippingOrder).filter(ShippingOrder.created_at >= start_date).all()
+    db.query(Review).filter(Review.created_at >= start_date).all()
+    db.expunge_all()
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드/성능 분석 집계 벤치마크 (SQLite)")
+    parser.add_argument("--orders", type=int, default=1_000_000, help="생성할 주문 수")
+    parser.add_argument("--span-days", type=int, default=365, help="주문 생성 기간(일)")
+    parser.add_argument("--days", type=int, action="append", help="조회 기간 (여러 번 지정 가능, 기본값: 30, 365)")
+    parser.add_argument("--db", help="SQLite 파일 경로 (기본값: 임시 파일, 이미 있으면 재사용)")
+    parser.add_argument("--compare", action="store_true", help="행을 모두 불러오는 기존 방식과 비교")
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), "dashboard_benchmark.db")
+    engine = create_engine(f"sqlite:///{path}")
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        started = time.perf_counter()
+        seed(engine, args.orders, args.span_days)
+        print(f"데이터 생성: 주문 {args.orders:,}건 ({time.perf_counter() - started:.1f}초, {path})")
+
+        db = sessionmaker(bind=engine)()
+        started = time.perf_counter()
+        written = RollupService().rebuild(db)
+        db.close()
+        print(f"집계 테이블 백필: {sum(written.values()):,}행 ({time.perf_counter() - started:.1f}초)")
+
+    db = sessionmaker(bind=engine)()
+    service = DashboardService(OrderService(), ShippingOrderService(), ReviewService())
+    for days in args.days or [30, 365]:
+        result = measure(service.get_dashboard_stats, db, days)
+        print(f"최근 {days}일 대시보드: {result['elapsed_ms']:.0f}ms, 최대 메모리 {result['peak_mb']:.2f}MB")
+        result = measure(company_performance, db, days)
+        print(f"최근 {days}일 배송사 성능 분석: {result['elapsed_ms']:.0f}ms, 최대 메모리 {result['peak_mb']:.2f}MB")
+        result = measure(performance_reports, db, days)
+        print(f"최근 {days}일 기사 랭킹/배송 시간/지역별 분석: {result['elapsed_ms']:.0f}ms, 최대 메모리 {result['peak_mb']:.2f}MB")
+        if args.compare:
+            result = measure(load_rows, db, days)
+            print(f"최근 {days}일 행 전체 로드: {result['elapsed_ms']:.0f}ms, 최대 메모리 {result['peak_mb']:.2f}MB")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import sys
+import os
+import argparse
+import random
+import time
+import numpy as np
+
+# 백엔드 앱 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.price_calculator import PriceCalculator, get_price_calculator
+
+def generate_orders(count: int, seed: int = 42):
+    """벤치마크용 주문 데이터 생성"""
+    rng = random.Random(seed)
+    return [
+        {
+            "product_selection": {"category": rng.choice(["small", "medium", "large", "unknown"])},
+            "address_input": {"distance_km": round(rng.uniform(0, 120), 1)},
+            "date_selection": {
+                "is_weekend": rng.random() < 0.3,
+                "is_holiday": rng.random() < 0.1,
+                "is_night": rng.random() < 0.2
+            },
+            "additional_options": {
+                "selected_options": [
+                    {"price": rng.choice([10000, 30000, 70000]), "quantity": rng.randint(1, 2)}
+                    for _ in range(rng.randint(0, 3))
+                ]
+            }
+        }
+        for _ in range(count)
+    ]
+
+def best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def run_batch_benchmark(count: int, repeat: int):
+    """건별 계산과 NumPy 일괄 계산 비교"""
+    orders = generate_orders(count)
+    calculator = get_price_calculator()
+
+    scalar_prices = np.array([calculator.calculate_total_price(order) for order in orders], dtype=np.float64)
+    batch_prices = calculator.calculate_total_prices(orders)
+    assert np.array_equal(scalar_prices, batch_prices), "일괄 계산 결과가 건별 계산과 다릅니다"
+
+    columns, _ = calculator.extract_price_columns(orders)
+    scalar = best_of(repeat, lambda: [calculator.calculate_total_price(order) for order in orders])
+    batch = best_of(repeat, lambda: calculator.calculate_total_prices(orders))
+    kernel = best_of(repeat, lambda: calculator.calculate_price_columns(columns))
+
+    print(f"일괄 계산 {count}건 (결과 일치 확인 완료)")
+    print(f"- 건별 계산:             {scalar * 1000:>10.1f} ms")
+    print(f"- 일괄 계산 (dict 입력):  {batch * 1000:>10.1f} ms ({scalar / batch:.1f}x)")
+    print(f"- 컬럼 연산만:           {kernel * 1000:>10.1f} ms ({scalar / kernel:.1f}x)")
+
+def run_benchmark(count: int, repeat: int):
+    orders = generate_orders(count)
+    shared = get_price_calculator()
+
+    best_shared = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for order in orders:
+            shared.calculate_total_price(order)
+        best_shared = min(best_shared, time.perf_counter() - started)
+
+    # 비교용: 호출마다 계산기를 새로 만드는 기존 방식
+    best_per_call = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for order in orders:
+            PriceCalculator().calculate_total_price(order)
+        best_per_call = min(best_per_call, time.perf_counter() - started)
+
+    print(f"주문 {count}건, {repeat}회 반복 중 최고 기록")
+    print(f"- 공유 엔진:        {count / best_shared:>12,.0f} quotes/s ({best_shared * 1e6 / count:.2f} us/quote)")
+    print(f"- 호출마다 생성:    {count / best_per_call:>12,.0f} quotes/s ({best_per_call * 1e6 / count:.2f} us/quote)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PriceCalculator 마이크로 벤치마크")
+    parser.add_argument("--count", type=int, default=100000, help="계산할 주문 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수")
+    parser.add_argument("--batch", action="store_true", help="NumPy 일괄 계산과 비교")
+    args = parser.parse_args()
+    if args.batch:
+        run_batch_benchmark(args.count, args.repeat)
+    else:
+        run_benchmark(args.count, args.repeat)
@@ -1,89 +1,126 @@
 import pandas as pd
-import re
 import os
+import argparse
 import chardet
 
-def generate_id(row):
-    # NaN 값 처리 및 문자열 변환
-    base = str(row['subcategory']).lower() if pd.notna(row['subcategory']) else ''
-    size = str(row['size']).lower() if pd.notna(row['size']) else ''
-    
-    # 특수문자 제거 및 공백을 하이픈으로 변경
-    base = re.sub(r'[^\w\s-]', '', base)
-    size = re.sub(r'[^\w\s-]', '', size)
-    
-    base = base.replace(' ', '-')
-    size = size.replace(' ', '-')
-    
-    return f"{base}-{size}"
-
-def convert_txt_to_csv():
+# 인코딩 감지에 사용할 최대 바이트 수 (파일 전체를 읽지 않음)
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+INPUT_COLUMNS = ['category', 'subcategory', 'size', 'description', 'base_price']
+OUTPUT_COLUMNS = ['id', 'category', 'subcategory', 'name', 'description', 'base_price', 'options']
+
+# 카테고리 매핑
+CATEGORY_MAPPING = {
+    '침실/거실': 'bedroom-living',
+    '서재': 'study',
+    '주방': 'kitchen',
+    '디지털/가전': 'digital',
+    '운동/이동수단': 'exercise',
+    '기타': 'etc'
+}
+
+def detect_encoding(input_path: str, sample_size: int = ENCODING_SAMPLE_SIZE) -> str:
+    """파일 앞부분만 읽어 인코딩 감지"""
+    with open(input_path, 'rb') as file:
+        raw = file.read(sample_size)
+    encoding = chardet.detect(raw)['encoding'] or 'utf-8'
+    # 앞부분이 ASCII뿐이어도 뒤쪽에 한글이 나올 수 있으므로 UTF-8로 읽음
+    if encoding.lower() == 'ascii':
+        encoding = 'utf-8'
+    return encoding
+
+def _normalize_id_part(values: pd.Series) -> pd.Series:
+    # NaN 값 처리, 특수문자 제거 및 공백을 하이픈으로 변경
+    return (
+        values.fillna('')
+        .astype(str)
+        .str.lower()
+        .str.replace(r'[^\w\s-]', '', regex=True)
+        .str.replace(' ', '-', regex=False)
+    )
+
+def generate_ids(df: pd.DataFrame) -> pd.Series:
+    """subcategory와 size로 id 컬럼 생성 (벡터화된 문자열 연산)"""
+    return _normalize_id_part(df['subcategory']) + '-' + _normalize_id_part(df['size'])
+
+def transform_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.dropna(how='all')
+
+    # size를 options 컬럼으로 변환
+    df = df.assign(
+        options=df['size'],          # 기존 size 값을 options로 저장
+        name=df['subcategory'],      # subcategory를 기본 이름으로 사용
+        id=generate_ids(df),
+        category=df['category'].map(CATEGORY_MAPPING)
+    )
+
+    # 가격 처리
+    base_price = df['base_price'].replace('기본 가격은 확인 후 연락드립니다', '0')
+    df['base_price'] = pd.to_numeric(base_price, errors='coerce').fillna(0)
+
+    # 최종 컬럼 순서 재배치
+    return df[OUTPUT_COLUMNS]
+
+def convert_txt_to_csv(input_path: str = None, output_path: str = None, chunksize: int = None):
+    """탭 구분 공급사 파일을 furniture_data.csv로 변환
+
+    chunksize를 지정하면 입력을 청크 단위로 읽고 결과를 바로 이어 쓰므로
+    파일 크기와 관계없이 메모리 사용량이 일정하게 유지됩니다.
+    """
     try:
         # 프로젝트 루트 디렉토리 경로 설정
         current_dir = os.path.dirname(os.path.abspath(__file__))
         project_root = os.path.dirname(current_dir)
-        
-        input_path = os.path.join(project_root, '1-2-3 choice.txt')
-        output_dir = os.path.join(project_root, 'app', 'data')
-        output_path = os.path.join(output_dir, 'furniture_data.csv')
-        
+
+        input_path = input_path or os.path.join(project_root, '1-2-3 choice.txt')
+        output_path = output_path or os.path.join(project_root, 'app', 'data', 'furniture_data.csv')
+        output_dir = os.path.dirname(os.path.abspath(output_path))
+
         # 디버깅을 위한 경로 출력
-        print(f"현재 디렉토리: {current_dir}")
-        print(f"프로젝트 루트: {project_root}")
         print(f"입력 파일 경로: {input_path}")
         print(f"출력 파일 경로: {output_path}")
-        
+
         if not os.path.exists(input_path):
             raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {input_path}")
-        
+
         # 출력 디렉토리 생성
         os.makedirs(output_dir, exist_ok=True)
-        
-        # 파일 읽기 전 인코딩 확인
-        with open(input_path, 'rb') as file:
-            raw = file.read()
-            result = chardet.detect(raw)
-            encoding = result['encoding']
-            print(f"감지된 파일 인코딩: {encoding}")
-        
-        # 데이터 읽기
-        df = pd.read_csv(input_path, sep='\t', encoding=encoding, dtype=str)
-        
-        df = df.dropna(how='all')
-        
-        # 컬럼명 변경
-        df.columns = ['category', 'subcategory', 'size', 'description', 'base_price']
-        
-        # size를 options 컬럼으로 변환
-        df['options'] = df['size']  # 기존 size 값을 options로 저장
-        df['name'] = df['subcategory']  # subcategory를 기본 이름으로 사용
-        
-        # id 필드 생성
-        df['id'] = df.apply(generate_id, axis=1)
-        
-        # 카테고리 매핑
-        category_mapping = {
-            '침실/거실': 'bedroom-living',
-            '서재': 'study',
-            '주방': 'kitchen',
-            '디지털/가전': 'digital',
-            '운동/이동수단': 'exercise',
-            '기타': 'etc'
-        }
-        df['category'] = df['category'].map(category_mapping)
-        
-        # 가격 처리
-        df['base_price'] = df['base_price'].replace('기본 가격은 확인 후 연락드립니다', '0')
-        df['base_price'] = pd.to_numeric(df['base_price'], errors='coerce').fillna(0)
-        
-        # 최종 컬럼 순서 재배치
-        df = df[['id', 'category', 'subcategory', 'name', 'description', 'base_price', 'options']]
-        
-        # CSV 파일로 저장
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
-        print("CSV 파일 생성 완료")
+
+        encoding = detect_encoding(input_path)
+        print(f"감지된 파일 인코딩: {encoding}")
+
+        # 데이터 읽기 (chunksize가 없으면 한 번에 읽음)
+        reader = pd.read_csv(
+            input_path,
+            sep='\t',
+            encoding=encoding,
+            dtype=str,
+            header=0,
+            names=INPUT_COLUMNS,
+            chunksize=chunksize
+        )
+        chunks = reader if chunksize else [reader]
+
+        total_rows = 0
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as output_file:
+            for index, chunk in enumerate(chunks):
+                converted = transform_chunk(chunk)
+                converted.to_csv(output_file, index=False, header=(index == 0))
+                total_rows += len(converted)
+
+        print(f"CSV 파일 생성 완료: {total_rows}건")
     except Exception as e:
         print(f"CSV 변환 중 오류 발생: {e}")
 
 if __name__ == "__main__":
-    convert_txt_to_csv()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="공급사 TXT 파일을 가구 CSV로 변환")
+    parser.add_argument("--input", dest="input_path", default=None, help="입력 TXT 파일 경로")
+    parser.add_argument("--output", dest="output_path", default=None, help="출력 CSV 파일 경로")
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="지정 시 해당 행 수 단위로 스트리밍 변환 (대용량 파일용)"
+    )
+    args = parser.parse_args()
+    convert_txt_to_csv(args.input_path, args.output_path, args.chunksize)
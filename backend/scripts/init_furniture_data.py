@@ -1,5 +1,6 @@
 import sys
 import os
+import argparse
 from pathlib import Path
 
 # 백엔드 앱 디렉토리를 Python 경로에 추가
@@ -8,16 +9,19 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.database import SessionLocal, init_db
 from app.services.furniture_service import FurnitureService
 
-def init_furniture_data():
+def init_furniture_data(csv_path: str = None):
     # 데이터베이스 초기화
     init_db()
     
     db = SessionLocal()
     try:
         service = FurnitureService()
-        success = service.import_csv_data(db)
-        if success:
-            print("가구 데이터 초기화 완료")
+        result = service.import_csv_data(db, csv_path=csv_path)
+        if result:
+            print(
+                f"가구 데이터 초기화 완료: {result['rows']}건, "
+                f"{result['elapsed_seconds']:.2f}초 ({result['rows_per_second']:,.0f} rows/s)"
+            )
         else:
             print("가구 데이터 초기화 실패")
     except Exception as e:
@@ -26,4 +30,7 @@ def init_furniture_data():
         db.close()
 
 if __name__ == "__main__":
-    init_furniture_data() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="가구 카탈로그 CSV를 DB로 임포트")
+    parser.add_argument("--csv", dest="csv_path", default=None, help="임포트할 CSV 파일 경로 (기본값: app/data/furniture_data.csv)")
+    args = parser.parse_args()
+    init_furniture_data(args.csv_path)
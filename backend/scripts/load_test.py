@@ -0,0 +1,91 @@
+import sys
+import os
+import argparse
+import asyncio
+import time
+import httpx
+import numpy as np
+
+# 백엔드 앱 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+async def run_load(
+    base_url: str,
+    paths: list,
+    requests: int,
+    concurrency: int,
+    headers: dict
+) -> dict:
+    """동시 요청 concurrency개로 총 requests건을 보내고 처리량/지연 시간 집계"""
+    latencies = []
+    errors = 0
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers=headers,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=concurrency)
+    ) as client:
+        async def worker():
+            nonlocal errors
+            for index in counter:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(paths[index % len(paths)])
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    timings = np.array(latencies) * 1000
+    return {
+        "requests": requests,
+        "errors": errors,
+        "elapsed_s": elapsed,
+        "throughput_rps": requests / elapsed,
+        "p50_ms": float(np.percentile(timings, 50)),
+        "p95_ms": float(np.percentile(timings, 95)),
+        "p99_ms": float(np.percentile(timings, 99))
+    }
+
+def make_token(email: str) -> str:
+    # 서버와 같은 JWT_SECRET_KEY 환경 변수가 필요
+    from app.utils.auth import create_access_token
+    return create_access_token({"sub": email})
+
+def main():
+    parser = argparse.ArgumentParser(description="실행 중인 API 서버 동시 요청 부하 테스트")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", action="append", dest="paths",
+                        help="요청할 경로 (여러 번 지정 가능, 기본값: /api/notifications/)")
+    parser.add_argument("--requests", type=int, default=2000, help="총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--token", help="Bearer 토큰")
+    parser.add_argument("--email", help="토큰을 직접 만들 사용자 이메일 (--token 대신)")
+    args = parser.parse_args()
+
+    headers = {}
+    token = args.token or (make_token(args.email) if args.email else None)
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    result = asyncio.run(run_load(
+        args.base_url,
+        args.paths or ["/api/notifications/"],
+        args.requests,
+        args.concurrency,
+        headers
+    ))
+
+    print(f"요청 {result['requests']}건 (오류 {result['errors']}건), 동시 {args.concurrency}")
+    print(f"  처리량: {result['throughput_rps']:.1f} req/s ({result['elapsed_s']:.2f}초)")
+    print(f"  지연 시간: p50 {result['p50_ms']:.1f}ms, p95 {result['p95_ms']:.1f}ms, p99 {result['p99_ms']:.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import sys
+import asyncio
+import pytest
+import pytest_asyncio
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.database import to_async_url
+from app.models import Notification, User
+from app.services.notification_service import NotificationService
+from app.utils.auth import create_access_token, get_current_user
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(User.__table__.create)
+        await connection.run_sync(Notification.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+def test_async_url_conversion():
+    assert to_async_url("sqlite:///./bigmove.db") == "sqlite+aiosqlite:///./bigmove.db"
+    assert to_async_url("postgresql://u:p@db:5432/bigmove") == "postgresql+asyncpg://u:p@db:5432/bigmove"
+    assert to_async_url("postgresql+psycopg2://u:p@db/bigmove") == "postgresql+asyncpg://u:p@db/bigmove"
+    assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+
+@pytest.mark.asyncio
+async def test_current_user_and_notifications_on_async_session(session_factory):
+    async with session_factory() as db:
+        user = User(email="async@example.com", name="비동기")
+        db.add(user)
+        await db.flush()
+        db.add_all([Notification(user_id=user.id, type="order", content={"n": i}) for i in range(3)])
+        await db.commit()
+
+    token = create_access_token({"sub": "async@example.com"})
+    service = NotificationService({})
+
+    async def request():
+        # 요청마다 별도 세션 (동시 요청이 이벤트 루프를 막지 않음)
+        async with session_factory() as db:
+            current_user = await get_current_user(token=token, db=db)
+            return await service.get_user_notifications(db, current_user.id)
+
+    results = await asyncio.gather(*(request() for _ in range(10)))
+    assert all(len(notifications) == 3 for notifications in results)
+
+    async with session_factory() as db:
+        notification = results[0][0]
+        assert (await service.mark_as_read(db, notification.id, user.id)).is_read
+        await service.delete_notification(db, notification.id, user.id)
+        assert len(await service.get_user_notifications(db, user.id)) == 2
@@ -0,0 +1,70 @@
+import sys
+import asyncio
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.database import SessionLocal
+from app.utils.cache_manager import LRUCache, cache
+
+def test_lru_cache_respects_entry_and_byte_limits():
+    entries = LRUCache(maxsize=2)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.get("a")
+    entries.set("c", 3)
+    assert entries.get("b") is None
+    assert entries.get("a") == 1
+    assert entries.stats()["evictions"] == 1
+
+    sized = LRUCache(maxsize=None, max_bytes=100, sizeof=len)
+    sized.set("a", "x" * 60)
+    sized.set("b", "y" * 60)
+    sized.set("huge", "z" * 101)
+    assert sized.get("a") is None
+    assert sized.get("b") == "y" * 60
+    assert sized.get("huge") is None
+    assert sized.stats()["bytes"] == 60
+
+@pytest.mark.asyncio
+async def test_cache_key_ignores_db_session():
+    calls = []
+
+    @cache(ttl=60)
+    async def get_items(db, category_id: str, limit: int = 10):
+        calls.append(category_id)
+        return [category_id] * limit
+
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        await get_items(first, "study")
+        await get_items(second, "study", limit=10)
+        await get_items(db=second, category_id="kitchen")
+    finally:
+        first.close()
+        second.close()
+
+    assert calls == ["study", "kitchen"]
+    assert get_items.cache_stats()["hits"] == 1
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    version = 0
+
+    @cache(ttl=0.05, stale_ttl=60)
+    async def load(key):
+        nonlocal version
+        version += 1
+        return version
+
+    assert await load("k") == 1
+    await asyncio.sleep(0.06)
+    # 만료된 값을 바로 반환하고 백그라운드에서 갱신
+    assert await load("k") == 1
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert await load("k") == 2
+    assert load.cache_stats()["stale_hits"] == 1
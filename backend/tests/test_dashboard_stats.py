@@ -0,0 +1,84 @@
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models import Address, Furniture, Order, Review, ShippingOrder
+from app.services.dashboard_service import DashboardService
+from app.services.order_service import OrderService
+from app.services.review_service import ReviewService
+from app.services.rollup_service import ROLLUP_MODELS, track_rollups
+from app.services.shipping_order_service import ShippingOrderService
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}")
+    for model in (Address, Furniture, Order, ShippingOrder, Review) + ROLLUP_MODELS:
+        model.__table__.create(engine)
+    track_rollups(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def test_dashboard_stats_read_daily_rollups(db):
+    now = datetime.utcnow()
+    old = now - timedelta(days=90)
+    db.add_all([
+        Furniture(id="bed", name="침대"),
+        Furniture(id="desk", name="책상"),
+        Order(id=1, items=[{"id": "bed"}, {"id": "desk"}], total_price=100000, created_at=now),
+        Order(id=2, items=[{"id": "bed"}], total_price=50000, created_at=now - timedelta(days=1)),
+        Order(id=3, items=[{"id": "desk"}], total_price=70000, created_at=old),
+        ShippingOrder(order_id=1, status="delivered", region="서울특별시",
+                      created_at=now - timedelta(hours=10), delivered_at=now - timedelta(hours=4)),
+        ShippingOrder(order_id=2, status="delivered", region="서울특별시",
+                      created_at=now - timedelta(hours=12), delivered_at=now - timedelta(hours=2)),
+        ShippingOrder(order_id=2, status="in_transit", region="부산광역시", created_at=now),
+        ShippingOrder(order_id=3, status="delivered", region="서울특별시", created_at=old, delivered_at=old),
+        Review(order_id=1, rating=5.0, created_at=now),
+        Review(order_id=2, rating=4.5, created_at=now),
+        Review(order_id=2, rating=2.0, created_at=now),
+        Review(order_id=3, rating=1.0, created_at=old)
+    ])
+    db.commit()
+    # 상태가 비어 있는 배송 (이전 응답과 같이 None 키로 집계)
+    unknown = ShippingOrder(order_id=2, created_at=now)
+    db.add(unknown)
+    db.commit()
+    unknown.status = None
+    db.commit()
+
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    service = DashboardService(OrderService(), ShippingOrderService(), ReviewService())
+    stats = service.get_dashboard_stats(db, days=30)
+
+    # 원본 테이블이 아닌 집계 테이블에서 주문/배송/리뷰/인기 가구/지역별 각 1회 조회
+    assert len(statements) == 5
+    assert all("rollups" in statement for statement in statements)
+    assert stats["summary"] == {
+        "total_orders": 2,
+        "total_revenue": 150000,
+        "completed_deliveries": 2,
+        "pending_deliveries": 2,
+        "average_rating": pytest.approx(11.5 / 3),
+        "total_reviews": 3
+    }
+    assert stats["trends"]["shipping_status_distribution"] == {"delivered": 2, "in_transit": 1, None: 1}
+    assert stats["trends"]["review_distribution"] == {"1": 0, "2": 1, "3": 0, "4": 1, "5": 1}
+    assert stats["performance_metrics"]["average_delivery_time"] == pytest.approx(8.0, abs=0.01)
+    assert stats["performance_metrics"]["customer_satisfaction"] == pytest.approx(200 / 3)
+    assert stats["popular_items"] == [
+        {"id": "bed", "name": "침대", "order_count": 2, "total_revenue": 150000.0},
+        {"id": "desk", "name": "책상", "order_count": 1, "total_revenue": 100000.0}
+    ]
+    assert stats["regional_stats"][0] == {
+        "region": "서울특별시", "total_shipments": 2, "completed_deliveries": 2, "success_rate": 100.0
+    }
@@ -0,0 +1,48 @@
+import sys
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import exc, text
+from app.core.config import settings
+from app.core.db_pool import pool_stats
+from app.database import create_db_engine, engine_options
+
+def test_sqlite_file_engine_uses_wal_and_reports_pool_metrics(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SQLITE_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "SQLITE_MAX_OVERFLOW", 1)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT_SECONDS", 0.05)
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}", name="test_pool")
+
+    first = engine.connect()
+    assert first.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert first.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+    # 풀 1개 + overflow 1개를 모두 사용하면 다음 체크아웃은 타임아웃
+    second = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+
+    stats = pool_stats()["test_pool"]
+    assert stats["checkouts"] == 2
+    assert stats["overflow_checkouts"] == 1
+    assert stats["peak_overflow"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_ms_max"] >= 50
+    assert stats["checked_out"] == 2
+
+    first.close()
+    second.close()
+    engine.dispose()
+
+def test_postgres_engine_options():
+    url, options = engine_options("postgresql+asyncpg://user:pw@db:5432/bigmove")
+    assert url.endswith(f"prepared_statement_cache_size={settings.DB_STATEMENT_CACHE_SIZE}")
+    assert options["connect_args"]["server_settings"]["statement_timeout"] == str(settings.DB_STATEMENT_TIMEOUT_MS)
+    assert options["pool_pre_ping"] and options["pool_size"] == settings.DB_POOL_SIZE
+
+    _, options = engine_options("postgresql://user:pw@db:5432/bigmove")
+    assert options["connect_args"]["options"] == f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
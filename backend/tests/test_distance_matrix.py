@@ -0,0 +1,57 @@
+import sys
+import json
+import struct
+import numpy as np
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.services.distance_providers import HaversineDistanceProvider
+from app.services.distance_matrix_service import (
+    DistanceMatrixService, iter_binary_matrix, iter_ndjson_rows
+)
+
+POINTS = [(127.0276, 37.4979), (126.9780, 37.5665), (129.0756, 35.1796)]
+
+def test_matrix_is_cached_by_coordinate_set():
+    service = DistanceMatrixService(HaversineDistanceProvider(road_factor=1.0))
+
+    matrix = service.get_matrix(POINTS)
+    assert matrix.shape == (3, 3)
+    assert np.allclose(np.diag(matrix), 0.0)
+    assert np.allclose(matrix, matrix.T)
+    assert service.get_matrix([list(point) for point in POINTS]) is matrix
+    assert service.get_matrix(POINTS, POINTS[:2]).shape == (3, 2)
+    assert service.cache.stats()["hits"] == 1
+
+def test_streamed_formats_round_trip():
+    service = DistanceMatrixService(HaversineDistanceProvider())
+    matrix = service.get_matrix(POINTS, POINTS[:2])
+
+    lazy = service.matrix(POINTS, POINTS[:2])
+    rows = [json.loads(line) for line in b"".join(iter_ndjson_rows(lazy.blocks(chunk_rows=2))).splitlines()]
+    assert np.allclose(rows, matrix, atol=0.005)
+
+    body = b"".join(iter_binary_matrix(lazy.shape, lazy.blocks(chunk_rows=2)))
+    shape = struct.unpack("<II", body[:8])
+    assert shape == (3, 2)
+    assert np.array_equal(np.frombuffer(body[8:], dtype="<f4").reshape(shape), matrix)
+
+def test_large_matrices_stream_in_blocks_without_caching():
+    # 3×3 float32 행렬(36바이트)보다 작은 한도 → 캐시하지 않고 행 블록만 순회
+    service = DistanceMatrixService(HaversineDistanceProvider(road_factor=1.0), cache_bytes=32)
+    expected = DistanceMatrixService(HaversineDistanceProvider(road_factor=1.0)).get_matrix(POINTS)
+
+    blocks = list(service.matrix(POINTS).blocks(chunk_rows=2))
+    assert [block.shape for block in blocks] == [(2, 3), (1, 3)]
+    assert np.array_equal(np.concatenate(blocks), expected)
+    assert len(service.cache) == 0
+
+    # 한도 안의 행렬은 바이트 수만큼 캐시에 기록
+    service = DistanceMatrixService(HaversineDistanceProvider(road_factor=1.0), cache_bytes=40)
+    service.get_matrix(POINTS)
+    service.get_matrix(POINTS[:2])
+    assert service.cache.stats()["bytes"] == 16
+    assert len(service.cache) == 1
@@ -0,0 +1,107 @@
+import sys
+import asyncio
+import httpx
+import numpy as np
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.services.distance_providers import (
+    DistanceProvider, FallbackDistanceProvider, HaversineDistanceProvider, haversine_km
+)
+
+GANGNAM = {"x": 127.0276, "y": 37.4979}
+CITY_HALL = {"x": 126.9780, "y": 37.5665}
+BUSAN = {"x": 129.0756, "y": 35.1796}
+
+class SlowProvider(DistanceProvider):
+    name = "slow"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def distance_km(self, start, end):
+        self.calls += 1
+        await asyncio.sleep(1)
+        return 0.0
+
+    async def distance_matrix(self, origins, destinations):
+        await asyncio.sleep(1)
+        return np.zeros((len(origins), len(destinations)))
+
+class FailingProvider(DistanceProvider):
+    name = "failing"
+
+    def __init__(self, error: Exception):
+        self.error = error
+        self.calls = 0
+
+    async def distance_km(self, start, end):
+        self.calls += 1
+        raise self.error
+
+    async def distance_matrix(self, origins, destinations):
+        self.calls += 1
+        raise self.error
+
+def test_haversine_matrix_matches_scalar():
+    provider = HaversineDistanceProvider(road_factor=1.0)
+    matrix = provider.matrix_km([GANGNAM, CITY_HALL], [CITY_HALL, BUSAN, GANGNAM])
+
+    assert matrix.shape == (2, 3)
+    assert matrix[0, 0] == pytest.approx(haversine_km(37.4979, 127.0276, 37.5665, 126.9780))
+    assert matrix[1, 0] == pytest.approx(0.0)
+    assert 310 < matrix[0, 1] < 320
+
+def test_road_factor_is_calibrated_from_observations():
+    provider = HaversineDistanceProvider(road_factor=1.3, min_samples=3)
+    straight = haversine_km(37.4979, 127.0276, 37.5665, 126.9780)
+    for _ in range(3):
+        provider.observe(GANGNAM, CITY_HALL, straight * 1.5)
+
+    assert provider.road_factor == pytest.approx(1.5)
+
+@pytest.mark.asyncio
+async def test_slow_primary_falls_back_to_local_distance():
+    primary = SlowProvider()
+    provider = FallbackDistanceProvider(primary, HaversineDistanceProvider(), latency_budget=0.01)
+
+    local = await HaversineDistanceProvider().distance_km(GANGNAM, CITY_HALL)
+    assert await provider.distance_km(GANGNAM, CITY_HALL) == local
+    # 쿨다운 동안은 기본 백엔드를 호출하지 않음
+    assert await provider.distance_km(GANGNAM, CITY_HALL) == local
+    assert primary.calls == 1
+    assert provider.stats()["fallback_count"] == 2
+
+@pytest.mark.asyncio
+async def test_only_outages_disable_primary():
+    request = httpx.Request("GET", "https://apis-navi.kakaomobility.com/v1/directions")
+    not_found = httpx.HTTPStatusError("400", request=request, response=httpx.Response(400, request=request))
+    primary = FailingProvider(not_found)
+    provider = FallbackDistanceProvider(primary, HaversineDistanceProvider())
+
+    # 4xx/경로 없음은 해당 요청만 로컬 계산하고 다음 요청은 다시 기본 백엔드 호출
+    await provider.distance_km(GANGNAM, CITY_HALL)
+    await provider.distance_km(GANGNAM, CITY_HALL)
+    assert primary.calls == 2
+    assert provider.stats()["primary_available"]
+
+    primary.error = httpx.ConnectError("connection refused", request=request)
+    await provider.distance_km(GANGNAM, CITY_HALL)
+    await provider.distance_km(GANGNAM, CITY_HALL)
+    assert primary.calls == 3
+    assert not provider.stats()["primary_available"]
+
+@pytest.mark.asyncio
+async def test_matrix_is_computed_locally():
+    primary = SlowProvider()
+    provider = FallbackDistanceProvider(primary, HaversineDistanceProvider(), latency_budget=0.01)
+
+    matrix = await provider.distance_matrix([GANGNAM], [CITY_HALL, BUSAN])
+    assert matrix.shape == (1, 2)
+    # 행렬 요청은 기본 백엔드를 호출하지 않으므로 단건 거리 계산의 cooldown에 영향 없음
+    assert primary.calls == 0
+    assert provider.stats()["primary_available"]
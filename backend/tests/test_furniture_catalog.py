@@ -0,0 +1,96 @@
+import sys
+import os
+import json
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.models import Furniture
+from app.services.furniture_catalog import FurnitureCatalog
+from app.services.furniture_service import FurnitureService
+from app.utils.http_cache import etag_matches
+
+CSV_HEADER = "id,category,subcategory,name,description,base_price\n"
+
+def write_csv(path: Path, rows):
+    path.write_text(CSV_HEADER + "".join(f"{row}\n" for row in rows), encoding="utf-8")
+
+def test_catalog_lookups(tmp_path):
+    csv_path = tmp_path / "furniture_data.csv"
+    write_csv(csv_path, [
+        "bed-single,bedroom-living,침대,싱글 침대,설명,40000",
+        "bed-king,bedroom-living,침대,킹 침대,설명,80000",
+        "sofa-1,bedroom-living,쇼파,1인 쇼파,,30000",
+        "desk-1,study,책상,책상,설명,20000",
+    ])
+    catalog = FurnitureCatalog(csv_path)
+
+    assert catalog.get_item("bed-king")["base_price"] == 80000.0
+    assert catalog.get_item("missing") is None
+
+    items = catalog.get_category_items("bedroom-living")
+    assert [item["name"] for item in items] == sorted(["침대", "쇼파"])
+    assert {item["id"] for item in items} == {"bed-single", "sofa-1"}
+    assert catalog.get_category_items("unknown") == []
+
+    related = catalog.get_related_items("bedroom-living", "bed-single")
+    assert [item["id"] for item in related] == ["bed-single", "bed-king"]
+    assert catalog.get_related_items("study", "bed-single") == []
+    assert catalog.get_related_items("bedroom-living", "missing") is None
+
+    sofa = catalog.get_related_items("bedroom-living", "sofa-1")[0]
+    assert sofa["description"] is None
+
+def test_catalog_reloads_on_mtime_change(tmp_path):
+    csv_path = tmp_path / "furniture_data.csv"
+    write_csv(csv_path, ["desk-1,study,책상,책상,설명,20000"])
+    catalog = FurnitureCatalog(csv_path, check_interval=0)
+    first = catalog.snapshot
+
+    write_csv(csv_path, ["desk-1,study,책상,책상,설명,25000"])
+    stat = os.stat(csv_path)
+    os.utime(csv_path, (stat.st_atime, first.mtime + 10))
+
+    assert catalog.snapshot is not first
+    assert catalog.get_item("desk-1")["base_price"] == 25000.0
+    # 이전 스냅샷은 변경되지 않음
+    assert first.by_id["desk-1"]["base_price"] == 20000.0
+
+def test_category_listing_is_preserialized(tmp_path):
+    csv_path = tmp_path / "furniture_data.csv"
+    write_csv(csv_path, ["desk-1,study,책상,책상,설명,20000"])
+    catalog = FurnitureCatalog(csv_path)
+
+    listing = catalog.get_category_listing("study")
+    assert listing is catalog.get_category_listing("study")
+    assert json.loads(listing.body) == catalog.get_category_items("study")
+    assert etag_matches(listing.etag, listing.etag)
+    assert etag_matches(f'"other", W/{listing.etag}', listing.etag)
+    assert not etag_matches('"other"', listing.etag)
+    assert catalog.get_category_listing("unknown").body == b"[]"
+
+def test_import_invalidates_catalog_listing(tmp_path):
+    csv_path = tmp_path / "furniture_data.csv"
+    write_csv(csv_path, ["desk-1,study,책상,책상,설명,20000"])
+    # 수정 시각 확인 없이도 임포트가 스냅샷을 교체해야 함
+    catalog = FurnitureCatalog(csv_path, check_interval=3600)
+    service = FurnitureService(catalog)
+    listing = catalog.get_category_listing("study")
+    all_categories = service.get_all_categories_listing()
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'furniture.db'}")
+    Furniture.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    write_csv(csv_path, ["desk-1,study,책상,책상,설명,25000"])
+    service.import_csv_data(db, str(csv_path))
+
+    new_listing = catalog.get_category_listing("study")
+    assert new_listing.etag != listing.etag
+    assert json.loads(new_listing.body)[0]["base_price"] == 25000.0
+    assert service.get_all_categories_listing() is not all_categories
+    db.close()
+    engine.dispose()
@@ -0,0 +1,105 @@
+import sys
+import runpy
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app import database
+from app.models import Furniture
+from app.services.furniture_catalog import FurnitureCatalog
+from app.services.furniture_service import FurnitureService
+
+CSV = (
+    "id,category,subcategory,name,description,base_price\n"
+    " bed-1 ,bedroom-living, 침대 , 싱글 침대 ,설명 ,40000\n"
+    "bed-2,bedroom-living,침대,킹 침대,,0\n"
+    "bed-1,bedroom-living,침대,중복 행,설명,99999\n"
+    ",study,책상,아이디 없음,설명,10000\n"
+    "desk-1,study,책상,,이름 없음,10000\n"
+    "desk-2,study,책상,책상,설명,20000.5\n"
+)
+
+@pytest.fixture
+def setup(tmp_path):
+    csv_path = tmp_path / "furniture_data.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    engine = create_engine(f"sqlite:///{tmp_path / 'furniture.db'}")
+    Furniture.__table__.create(engine)
+    db = sessionmaker(bind=engine)()
+    yield FurnitureService(FurnitureCatalog(csv_path)), db, str(csv_path)
+    db.close()
+    engine.dispose()
+
+@pytest.fixture
+def script_db(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'script.db'}")
+    Furniture.__table__.create(engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(database, "init_db", lambda: None)
+    yield engine
+    engine.dispose()
+
+def rows(db):
+    return [
+        (item.id, item.category, item.subcategory, item.name, item.description, item.base_price, item.price_type)
+        for item in db.query(Furniture).order_by(Furniture.id)
+    ]
+
+def test_import_cleans_rows_and_reports_throughput(setup):
+    service, db, csv_path = setup
+    db.add(Furniture(id="old", name="이전 상품"))
+    db.commit()
+
+    result = service.import_csv_data(db, csv_path, batch_size=2)
+
+    # 중복 id는 첫 행, id/이름이 없는 행은 제외, 공백 제거, 0원은 문의 가격
+    assert rows(db) == [
+        ("bed-1", "bedroom-living", "침대", "싱글 침대", "설명", 40000.0, "fixed"),
+        ("bed-2", "bedroom-living", "침대", "킹 침대", None, 0.0, "contact"),
+        ("desk-2", "study", "책상", "책상", "설명", 20000.5, "fixed"),
+    ]
+    assert result["rows"] == 3
+    assert result["elapsed_seconds"] > 0
+    assert result["rows_per_second"] == pytest.approx(3 / result["elapsed_seconds"])
+
+def test_failed_batch_rolls_back_whole_import(setup, monkeypatch):
+    service, db, csv_path = setup
+    db.add(Furniture(id="old", name="이전 상품"))
+    db.commit()
+
+    # 두 번째 배치에서 삽입 실패
+    execute = db.execute
+    batches = []
+
+    def failing_execute(statement, params=None, *args, **kwargs):
+        if isinstance(params, list):
+            batches.append(params)
+            if len(batches) == 2:
+                raise RuntimeError("batch failed")
+        return execute(statement, params, *args, **kwargs)
+
+    monkeypatch.setattr(db, "execute", failing_execute)
+    with pytest.raises(HTTPException) as exc_info:
+        service.import_csv_data(db, csv_path, batch_size=2)
+    assert exc_info.value.status_code == 500
+
+    # 삭제와 첫 번째 배치도 롤백되어 이전 데이터가 그대로 남음
+    assert len(batches) == 2
+    monkeypatch.undo()
+    assert [item.id for item in db.query(Furniture)] == ["old"]
+
+def test_init_script_imports_csv_given_by_flag(setup, script_db, monkeypatch, capsys):
+    _, _, csv_path = setup
+    monkeypatch.setattr(sys, "argv", ["init_furniture_data.py", "--csv", csv_path])
+    runpy.run_path(str(backend_dir / "scripts" / "init_furniture_data.py"), run_name="__main__")
+
+    assert "3건" in capsys.readouterr().out
+    db = sessionmaker(bind=script_db)()
+    assert [item.id for item in db.query(Furniture).order_by(Furniture.id)] == ["bed-1", "bed-2", "desk-2"]
+    db.close()
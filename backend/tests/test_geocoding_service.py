@@ -0,0 +1,84 @@
+import sys
+import asyncio
+from datetime import datetime, timedelta
+import httpx
+import pytest
+from pathlib import Path
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.models.geocode_cache import GeocodeCache
+from app.services.geocoding_service import GeocodingService, normalize_query
+
+DOCUMENTS = [{"address_name": "서울 강남구 역삼동", "x": "127.03", "y": "37.50"}]
+
+def make_session_factory():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    GeocodeCache.__table__.create(engine)
+    return sessionmaker(bind=engine)
+
+@pytest.mark.asyncio
+async def test_concurrent_searches_share_one_upstream_call_and_persist():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"documents": DOCUMENTS})
+
+    session_factory = make_session_factory()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        service = GeocodingService("test-key", session_factory=session_factory, http_client=http_client)
+        results = await asyncio.gather(
+            service.search("서울  강남구 역삼동"),
+            service.search(" 서울 강남구 역삼동"),
+            service.search("서울 강남구 역삼동")
+        )
+
+    assert results == [DOCUMENTS] * 3
+    assert len(requests) == 1
+    # 캐시 키만 정규화하고 외부 API에는 입력한 검색어 그대로 전달
+    assert requests[0].url.params["query"] == "서울  강남구 역삼동"
+
+    # 재시작 후에도 저장소에서 조회 (외부 API 호출 없음)
+    restarted = GeocodingService("test-key", session_factory=session_factory, http_client=httpx.AsyncClient())
+    assert restarted.prewarm() == 1
+    assert await restarted.search("서울 강남구 역삼동") == DOCUMENTS
+    assert restarted.stats()["upstream_calls"] == 0
+
+@pytest.mark.asyncio
+async def test_memory_cache_expires_with_store_ttl():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"documents": DOCUMENTS})
+
+    session_factory = make_session_factory()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        service = GeocodingService(
+            "test-key", store_ttl=timedelta(seconds=60),
+            session_factory=session_factory, http_client=http_client
+        )
+        await service.search("서울 강남구 역삼동")
+
+        # 저장소에서 만료 직전인 항목은 메모리에서도 남은 시간만 유지
+        with session_factory() as db:
+            entry = db.get(GeocodeCache, normalize_query("서울 강남구 역삼동"))
+            entry.updated_at = datetime.utcnow() - timedelta(seconds=59.9)
+            db.commit()
+        restarted = GeocodingService(
+            "test-key", store_ttl=timedelta(seconds=60),
+            session_factory=session_factory, http_client=http_client
+        )
+        assert restarted.prewarm() == 1
+        await asyncio.sleep(0.2)
+        assert await restarted.search("서울 강남구 역삼동") == DOCUMENTS
+        assert restarted.stats()["upstream_calls"] == 1
+
+    assert len(requests) == 2
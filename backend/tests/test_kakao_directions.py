@@ -0,0 +1,64 @@
+import sys
+import httpx
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.services.kakao_directions import KakaoDirectionsClient
+
+ROUTE = {"routes": [{"result_code": 0, "result_msg": "길찾기 성공", "summary": {"distance": 12345}}]}
+
+@pytest.mark.asyncio
+async def test_repeated_routes_are_served_from_cache():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=ROUTE)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = KakaoDirectionsClient("test-key", http_client=http_client)
+
+        start, end = {"x": 127.0276, "y": 37.4979}, {"x": 126.9780, "y": 37.5665}
+        assert await client.get_distance_km(start, end) == 12.3
+        # 반올림 후 같은 좌표는 같은 경로로 취급
+        nearby = {"x": 127.02761, "y": 37.49791}
+        assert await client.get_distance_km(nearby, end) == 12.3
+
+    assert len(requests) == 1
+    assert requests[0].headers["Authorization"] == "KakaoAK test-key"
+    stats = client.stats()
+    assert (stats["local"]["hits"], stats["local"]["misses"], stats["upstream_calls"]) == (1, 1, 1)
+
+@pytest.mark.asyncio
+async def test_failed_responses_are_not_cached():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = KakaoDirectionsClient("test-key", http_client=http_client)
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.get_directions("127.0,37.5", "126.9,37.5")
+
+    assert client.stats()["upstream_calls"] == 2
+    assert len(client.route_cache.local) == 0
+
+@pytest.mark.asyncio
+async def test_no_route_responses_are_not_cached():
+    # 카카오는 경로가 없을 때도 200 응답에 result_code로 실패를 알림
+    no_route = {"routes": [{"result_code": 104, "result_msg": "출발지와 도착지가 5 m 이내로 설정된 경우 경로를 탐색할 수 없음"}]}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=no_route)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = KakaoDirectionsClient("test-key", http_client=http_client)
+        for _ in range(2):
+            assert await client.get_directions("127.0,37.5", "127.0,37.5") == no_route
+
+    assert client.stats()["upstream_calls"] == 2
+    assert len(client.route_cache.local) == 0
@@ -0,0 +1,242 @@
+import sys
+import time
+import pytest
+import pytest_asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.fake_redis import FakeRedis
+from app.core.service_container import get_service_container
+from app.database import Base, get_async_db
+from app.models.order_progress import OrderProgress
+from app.models import User
+from app.routes import orders
+from app.services.order_progress_service import OrderProgressService
+from app.utils.auth import get_current_user
+
+PRODUCT = {"category": "가구", "product": "침대", "details": {"size": "Q"}}
+DATE = {"date": "2026-11-01", "loading_time": "09:00", "unloading_time": "13:00"}
+
+@pytest_asyncio.fixture
+async def databases(tmp_path):
+    # 요청 경로는 비동기 세션, 백그라운드 기록과 검증은 동기 세션 사용 (같은 파일 DB)
+    path = tmp_path / "progress.db"
+    engine = create_engine(f"sqlite:///{path}")
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    OrderProgress.__table__.create(engine)
+    yield sessionmaker(bind=engine), async_sessionmaker(async_engine, expire_on_commit=False)
+    await async_engine.dispose()
+    engine.dispose()
+
+@pytest.mark.asyncio
+async def test_step_saves_are_partial_and_flushed_in_batches(databases):
+    session_factory, async_session_factory = databases
+    redis = FakeRedis()
+    service = OrderProgressService(redis=redis, session_factory=session_factory, flush_interval=60)
+    db = session_factory()
+    adb = async_session_factory()
+
+    await service.save_step_data(adb, 1, "product_selection", PRODUCT)
+    await service.save_step_data(adb, 1, "date_selection", DATE)
+    assert await service.get_progress(adb, 1) == {
+        "product_selection": PRODUCT,
+        "date_selection": DATE,
+        "current_step": "date_selection"
+    }
+    # flush 전에는 테이블에 기록되지 않음
+    assert db.query(OrderProgress).count() == 0
+
+    assert await service.flush() == 1
+    row = db.query(OrderProgress).filter_by(user_id=1).one()
+    assert (row.product_selection, row.date_selection, row.current_step) == (PRODUCT, DATE, "date_selection")
+
+    # 다시 저장하면 변경된 단계만 기록
+    await service.save_step_data(adb, 1, "date_selection", {**DATE, "date": "2026-11-02"})
+    assert service._dirty == {1: {"date_selection", "current_step", "total_price"}}
+    await service.flush()
+    db.expire_all()
+    assert db.query(OrderProgress).filter_by(user_id=1).one().date_selection["date"] == "2026-11-02"
+
+    # Redis가 비어도 테이블에서 다시 적재
+    await redis.delete(service.progress_key(1))
+    assert (await service.get_progress(adb, 1))["date_selection"]["date"] == "2026-11-02"
+    assert await redis.hget(service.progress_key(1), "product_selection") is not None
+
+    await service.clear_progress(1, adb)
+    assert await service.get_progress(adb, 1) is None
+    assert db.query(OrderProgress).count() == 0
+    await service.stop_flusher()
+    await adb.close()
+    db.close()
+
+@pytest.mark.asyncio
+async def test_price_is_updated_per_step_and_matches_full_calculation(databases):
+    session_factory, async_session_factory = databases
+    service = OrderProgressService(redis=FakeRedis(), session_factory=session_factory, flush_interval=60)
+    calculator = service.price_calculator
+    db = session_factory()
+    adb = async_session_factory()
+
+    steps = [
+        ("product_selection", {**PRODUCT, "category": "large"}),
+        ("date_selection", {**DATE, "is_weekend": True}),
+        ("address_input", {
+            "loading_address": {"address": "서울", "detail_address": "1", "postal_code": "04524"},
+            "unloading_address": {"address": "부산", "detail_address": "2", "postal_code": "48058"},
+            "distance_km": 325.0
+        }),
+        ("additional_options", {"selected_options": [{"price": 30000, "quantity": 2}]})
+    ]
+    for step, data in steps:
+        await service.save_step_data(adb, 4, step, data)
+        progress, price = await service.get_progress_and_price(adb, 4)
+        assert price["total_price"] == calculator.calculate_total_price(progress)
+
+    # 날짜만 바꾸면 할증 배율과 합계만 달라짐
+    await service.save_step_data(adb, 4, "date_selection", DATE)
+    progress, price = await service.get_progress_and_price(adb, 4)
+    assert price == {
+        "base_price": 150000,
+        "distance_fee": 20000 + 305 * 1000,
+        "surcharge": 1.0,
+        "options_fee": 60000,
+        "total_price": calculator.calculate_total_price(progress)
+    }
+    assert await service.calculate_current_price(adb, 4) == price["total_price"]
+
+    await service.stop_flusher()
+    assert db.query(OrderProgress).filter_by(user_id=4).one().total_price == price["total_price"]
+    await adb.close()
+    db.close()
+
+@pytest.mark.asyncio
+async def test_step_save_requires_previous_step(databases):
+    session_factory, async_session_factory = databases
+    service = OrderProgressService(redis=FakeRedis(), session_factory=session_factory)
+    async with async_session_factory() as adb:
+        with pytest.raises(Exception) as exc_info:
+            await service.save_step_data(adb, 2, "date_selection", DATE)
+    assert exc_info.value.status_code == 400
+
+@pytest.mark.asyncio
+async def test_step_save_latency(databases):
+    session_factory, async_session_factory = databases
+    service = OrderProgressService(redis=FakeRedis(), session_factory=session_factory, flush_interval=60)
+    db = session_factory()
+    adb = async_session_factory()
+    await service.save_step_data(adb, 3, "product_selection", PRODUCT)
+
+    timings = []
+    for _ in range(500):
+        started = time.perf_counter()
+        await service.save_step_data(adb, 3, "date_selection", DATE)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    # 단계 저장은 DB를 거치지 않으므로 p99가 수 ms 이내
+    assert timings[int(len(timings) * 0.99)] < 0.005
+
+    await service.stop_flusher()
+    assert db.query(OrderProgress).filter_by(user_id=3).count() == 1
+    await adb.close()
+    db.close()
+
+@pytest.mark.asyncio
+async def test_flush_writes_the_row_that_is_read(databases):
+    session_factory, async_session_factory = databases
+    redis = FakeRedis()
+    service = OrderProgressService(redis=redis, session_factory=session_factory, flush_interval=60)
+    db = session_factory()
+    # 이전 버전에서 남은 중복 행: 조회는 id가 가장 큰 행을 사용
+    db.add_all([OrderProgress(user_id=5), OrderProgress(user_id=5)])
+    db.commit()
+
+    async with async_session_factory() as adb:
+        await service.save_step_data(adb, 5, "product_selection", PRODUCT)
+        await service.save_step_data(adb, 6, "product_selection", PRODUCT)
+        assert await service.flush() == 2
+
+        await redis.delete(service.progress_key(5))
+        assert (await service.get_progress(adb, 5))["product_selection"] == PRODUCT
+
+    rows = db.query(OrderProgress).filter_by(user_id=5).order_by(OrderProgress.id).all()
+    assert rows[0].product_selection is None
+    assert rows[1].product_selection == PRODUCT
+    await service.stop_flusher()
+    db.close()
+
+@pytest.mark.asyncio
+async def test_summary_route_returns_draft_and_price(databases):
+    session_factory, async_session_factory = databases
+    service = OrderProgressService(redis=FakeRedis(), session_factory=session_factory, flush_interval=60)
+
+    async def async_db():
+        async with async_session_factory() as session:
+            yield session
+
+    app = FastAPI()
+    app.include_router(orders.router, prefix="/api/orders")
+    app.dependency_overrides[get_async_db] = async_db
+    app.dependency_overrides[get_current_user] = lambda: User(id=7, name="홍길동", email="hong@example.com")
+    app.dependency_overrides[get_service_container] = lambda: SimpleNamespace(order_progress_service=service)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        assert (await client.get("/api/orders/summary")).status_code == 404
+
+        response = await client.post("/api/orders/progress/product_selection", json={**PRODUCT, "category": "large"})
+        assert response.status_code == 200
+        response = await client.get("/api/orders/summary")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["order_steps"]["product"] == {**PRODUCT, "category": "large"}
+    assert body["price_details"] == {
+        "base_price": 150000, "distance_fee": 20000, "option_fees": 0, "total_price": 170000
+    }
+    assert body["status"] == "product_selection"
+    assert body["user_info"] == {"name": "홍길동", "email": "hong@example.com", "phone": None}
+    await service.stop_flusher()
+
+@pytest.mark.asyncio
+async def test_cold_read_does_not_overwrite_concurrent_save(databases):
+    session_factory, async_session_factory = databases
+    redis = FakeRedis()
+    service = OrderProgressService(redis=redis, session_factory=session_factory, flush_interval=60)
+    new_date = {**DATE, "date": "2026-11-05", "is_weekend": True}
+
+    async with async_session_factory() as adb:
+        await service.save_step_data(adb, 8, "product_selection", PRODUCT)
+        await service.save_step_data(adb, 8, "date_selection", DATE)
+        await service.flush()
+        await redis.delete(service.progress_key(8))
+
+        # 조회가 테이블을 읽은 직후, Redis에 적재하기 전에 다른 요청이 단계를 저장
+        read_row = service._read_row
+        interleaved = []
+
+        async def read_then_save(db, user_id):
+            progress = await read_row(db, user_id)
+            if not interleaved:
+                interleaved.append(True)
+                async with async_session_factory() as other:
+                    await service.save_step_data(other, user_id, "date_selection", new_date)
+            return progress
+
+        service._read_row = read_then_save
+        progress, price = await service.get_progress_and_price(adb, 8)
+
+    assert interleaved
+    assert progress["date_selection"] == new_date
+    assert price["total_price"] == service.price_calculator.calculate_total_price(progress)
+    service._read_row = read_row
+    async with async_session_factory() as adb:
+        assert (await service.get_progress(adb, 8))["date_selection"] == new_date
+    await service.stop_flusher()
@@ -0,0 +1,119 @@
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from app.models import Address, Order, Review, ShippingOrder
+from app.services.performance_analysis_service import PerformanceAnalysisService
+from app.services.rollup_service import ROLLUP_MODELS, track_rollups
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'performance.db'}")
+    for model in (Address, Order, ShippingOrder, Review) + ROLLUP_MODELS:
+        model.__table__.create(engine)
+    track_rollups(engine)
+    session = sessionmaker(bind=engine)()
+
+    now = datetime.utcnow().replace(microsecond=0) - timedelta(days=1)
+    # 기사 11 (배송사 1, 서울): 1~10시간 배송 완료 10건 / 기사 12 (배송사 2, 부산): 20, 40시간 완료 + 대기 1건
+    shipments = [(11, 1, "서울특별시", hours) for hours in range(1, 11)]
+    shipments += [(12, 2, "부산광역시", 20), (12, 2, "부산광역시", 40), (12, 2, "부산광역시", None)]
+    for shipment_id, (driver_id, company_id, region, hours) in enumerate(shipments, start=1):
+        session.add(ShippingOrder(
+            id=shipment_id, order_id=shipment_id, company_id=company_id, driver_id=driver_id, region=region,
+            status="delivered" if hours else "pending", shipping_fee=1000, created_at=now,
+            delivered_at=now + timedelta(hours=hours) if hours else None
+        ))
+    session.add_all([
+        Review(order_id=1, shipping_order_id=1, rating=4, driver_rating=4, created_at=now),
+        Review(order_id=11, shipping_order_id=11, rating=5, driver_rating=5, created_at=now)
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+def window():
+    end_date = datetime.utcnow()
+    return end_date - timedelta(days=7), end_date
+
+def count_queries(db, function, *args):
+    statements = []
+    listener = lambda *params: statements.append(params[2])
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        result = function(*args)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    return result, statements
+
+def test_driver_ranking(db):
+    ranking, statements = count_queries(
+        db, PerformanceAnalysisService(None, None).get_driver_performance_ranking, db, *window(), 10
+    )
+
+    # 집계 테이블 랭킹 1회 + 상위 기사 분위수 1회
+    assert len(statements) == 2
+    assert [driver["driver_id"] for driver in ranking] == [12, 11]
+    assert ranking[0]["total_deliveries"] == 3
+    assert ranking[0]["completed_deliveries"] == 2
+    assert ranking[0]["avg_rating"] == 5
+    assert ranking[0]["avg_delivery_time"] == pytest.approx(30, abs=0.01)
+    assert ranking[1]["rank"] == 2
+    assert ranking[1]["delivery_time_percentiles"] == {
+        "p50": pytest.approx(5, abs=0.01), "p90": pytest.approx(9, abs=0.01),
+        "p95": pytest.approx(10, abs=0.01), "p99": pytest.approx(10, abs=0.01)
+    }
+
+    # 상위 기사 분위수는 (driver_id, created_at) 인덱스만 읽음
+    plan = " ".join(str(row) for row in db.execute(text(
+        "EXPLAIN QUERY PLAN SELECT created_at, delivered_at FROM shipping_orders "
+        "WHERE driver_id IN (11, 12) AND created_at >= '2000-01-01' AND delivered_at IS NOT NULL"
+    )))
+    assert "COVERING INDEX ix_shipping_orders_driver_created_at" in plan
+
+def test_delivery_times_by_company(db):
+    service = PerformanceAnalysisService(None, None)
+    stats, statements = count_queries(db, service.analyze_delivery_times, db, *window(), 2)
+
+    # 집계 테이블 합계 1회 + 일별 스케치 버킷 합산 1회 (원본 배송 행 조회 없음)
+    assert len(statements) == 2
+    assert not any("FROM shipping_orders" in statement for statement in statements)
+    assert stats["total_orders"] == 3
+    assert stats["completed_orders"] == 2
+    assert stats["delivery_time_distribution"] == {"0-2h": 0, "2-4h": 0, "4-8h": 0, "8-24h": 1, "24h+": 1}
+    assert stats["delivery_time_percentiles"] == {
+        "p50": pytest.approx(20, rel=0.01), "p90": pytest.approx(40, rel=0.01),
+        "p95": pytest.approx(40, rel=0.01), "p99": pytest.approx(40, rel=0.01)
+    }
+
+    everyone = service.analyze_delivery_times(db, *window())
+    assert everyone["delivery_time_percentiles"]["p50"] == pytest.approx(6, rel=0.01)
+    assert everyone["delivery_time_percentiles"]["p95"] == pytest.approx(40, rel=0.01)
+
+    empty = service.analyze_delivery_times(db, *window(), 99)
+    assert empty["total_orders"] == 0
+    assert empty["delivery_time_percentiles"] == {"p50": 0, "p90": 0, "p95": 0, "p99": 0}
+
+def test_regional_performance(db):
+    regions, statements = count_queries(
+        db, PerformanceAnalysisService(None, None).analyze_regional_performance, db, *window()
+    )
+
+    assert len(statements) == 2
+    assert [region["region"] for region in regions] == ["서울특별시", "부산광역시"]
+    assert regions[0]["success_rate"] == 100
+    assert regions[0]["total_shipping_fee"] == 10000
+    assert regions[0]["delivery_time_percentiles"]["p50"] == pytest.approx(5, abs=0.01)
+    assert regions[1]["success_rate"] == pytest.approx(200 / 3)
+    assert regions[1]["delivery_time_percentiles"]["p90"] == pytest.approx(40, abs=0.01)
+
+    busan = PerformanceAnalysisService(None, None).analyze_regional_performance(db, *window(), "부산광역시")
+    assert [region["region"] for region in busan] == ["부산광역시"]
@@ -0,0 +1,108 @@
+import sys
+import pytest
+from pathlib import Path
+from pydantic import ValidationError
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.schemas.quote import BatchPriceRequest
+from app.services.price_calculator import PriceCalculator, get_price_calculator
+from app.services.quote_service import QuoteService
+
+def test_calculate_total_price():
+    calculator = get_price_calculator()
+    order_data = {
+        "product_selection": {"category": "medium"},
+        "address_input": {"distance_km": 30},
+        "date_selection": {"is_weekend": True, "is_night": True},
+        "additional_options": {
+            "selected_options": [
+                {"name": "사다리차", "price": 50000},
+                {"name": "포장", "price": 30000}
+            ]
+        }
+    }
+    # (100,000 + 20,000 + 10 * 1,000) * 1.2 * 1.2 + 80,000
+    assert calculator.calculate_total_price(order_data) == 267200
+    # 알 수 없는 카테고리는 소형 기본 요금, 20km 이내는 기본 거리 요금
+    assert calculator.calculate_total_price({"product_selection": {"category": "?"}}) == 70000
+    assert calculator.calculate_total_price({"product_selection": None}) == 0.0
+
+def test_surcharge_table_matches_sequential_rates():
+    plan = PriceCalculator().plan
+    assert plan.surcharge_table[0] == 1.0
+    assert plan.surcharge_table[0b111] == 1.0 * 1.2 * 1.3 * 1.2
+    assert get_price_calculator() is get_price_calculator()
+
+def test_calculate_quote_price():
+    breakdown = get_price_calculator().calculate_quote_price({
+        "items": [{"price": 40000}, {"price": 30000}, {}]
+    })
+    assert breakdown["base_price"] == 70000
+    assert breakdown["final_price"] == 70000
+
+def test_batch_prices_match_scalar_path():
+    calculator = get_price_calculator()
+    orders = [
+        {
+            "product_selection": {"category": category},
+            "address_input": {"distance_km": distance},
+            "date_selection": {"is_weekend": weekend, "is_holiday": holiday, "is_night": night},
+            "additional_options": {"selected_options": [{"price": 12345, "quantity": 2}]}
+        }
+        for category in ["small", "large", "unknown"]
+        for distance in [0, 20, 20.5, 37.3, 150]
+        for weekend in [False, True]
+        for holiday in [False, True]
+        for night in [False, True]
+    ]
+    # 잘못된 입력도 건별 계산과 같은 결과여야 함
+    orders += [
+        {},
+        {"product_selection": None},
+        {"address_input": {"distance_km": "abc"}},
+        {"address_input": {"distance_km": float("nan")}},
+        {"date_selection": "weekend"},
+        {"additional_options": {"selected_options": [{"price": "free"}]}},
+    ]
+
+    batch_prices = calculator.calculate_total_prices(orders)
+    assert batch_prices.tolist() == [calculator.calculate_total_price(order) for order in orders]
+
+def test_column_input_matches_scalar_path():
+    calculator = get_price_calculator()
+    service = QuoteService()
+    cases = [
+        (category, distance, weekend, holiday, fee)
+        for category in ["small", "medium", "unknown"]
+        for distance in [0, 20, 37.3, 150]
+        for weekend in [False, True]
+        for holiday in [False, True]
+        for fee in [0, 24690]
+    ]
+    columns = BatchPriceRequest(columns={
+        "category": [case[0] for case in cases],
+        "distance_km": [case[1] for case in cases],
+        "is_weekend": [case[2] for case in cases],
+        "is_holiday": [case[3] for case in cases],
+        "options_fee": [case[4] for case in cases]
+    }).columns
+    assert service.calculate_batch_price_columns(columns) == [
+        calculator.calculate_total_price({
+            "product_selection": {"category": category},
+            "address_input": {"distance_km": distance},
+            "date_selection": {"is_weekend": weekend, "is_holiday": holiday},
+            "additional_options": {"selected_options": [{"price": fee, "quantity": 1}]}
+        })
+        for category, distance, weekend, holiday, fee in cases
+    ]
+
+def test_batch_request_validation():
+    with pytest.raises(ValidationError):
+        BatchPriceRequest(columns={"category": ["small", "large"], "distance_km": [10.0]})
+    with pytest.raises(ValidationError):
+        BatchPriceRequest()
+    with pytest.raises(ValidationError):
+        BatchPriceRequest(orders=[], columns={"category": [], "distance_km": []})
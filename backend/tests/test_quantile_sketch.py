@@ -0,0 +1,50 @@
+import sys
+import math
+import random
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.utils.quantile_sketch import DDSketch
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)), 1) - 1]
+
+def test_quantiles_within_relative_accuracy():
+    rng = random.Random(7)
+    values = [rng.lognormvariate(2, 1) for _ in range(20000)]
+    sketch = DDSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.add(value)
+
+    assert sketch.count == len(values)
+    # 버킷 수는 값의 로그 범위에만 비례
+    assert len(sketch.bins) < 1000
+    for q in (0.01, 0.5, 0.9, 0.95, 0.99, 1.0):
+        assert sketch.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.01)
+
+def test_merge_and_remove_by_bucket_counts():
+    rng = random.Random(11)
+    first, second = DDSketch(), DDSketch()
+    combined = DDSketch()
+    for sketch in (first, second):
+        for _ in range(500):
+            value = rng.uniform(0.5, 72)
+            sketch.add(value)
+            combined.add(value)
+
+    first.merge(second)
+    assert first.bins == combined.bins
+
+    # 건수를 빼면 해당 값이 제거됨
+    first.add_bins((key, -count) for key, count in second.bins.items())
+    first.add(1000)
+    assert first.quantile(1.0) == pytest.approx(1000, rel=0.01)
+
+    with pytest.raises(ValueError):
+        first.merge(DDSketch(relative_accuracy=0.02))
+    assert DDSketch().quantile(0.5) is None
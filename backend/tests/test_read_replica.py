@@ -0,0 +1,51 @@
+import sys
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app import database
+from app.core.db_pool import pool_stats
+from app.database import create_read_engine, get_read_db, read_sessionmaker
+from app.models import User
+from app.routes import admin, dashboard, performance
+
+def test_read_engine_falls_back_to_primary():
+    assert create_read_engine(None) is database.engine
+    assert create_read_engine("") is database.engine
+
+def test_replica_sessions_are_separate_and_read_only(tmp_path):
+    replica = create_read_engine(f"sqlite:///{tmp_path / 'replica.db'}")
+    assert replica is not database.engine
+    assert "replica" in pool_stats()
+
+    User.__table__.create(replica)
+    db = read_sessionmaker(replica)()
+    assert db.query(User).count() == 0
+
+    db.add(User(email="replica@example.com", name="복제본"))
+    with pytest.raises(RuntimeError):
+        db.flush()
+    db.rollback()
+    db.close()
+    replica.dispose()
+
+def test_analytics_routes_use_read_sessions():
+    def dependencies(router):
+        return {
+            dependency.call
+            for route in router.routes
+            for dependency in route.dependant.dependencies
+        }
+
+    assert get_read_db in dependencies(performance.router)
+    for router in (dashboard.router, performance.router):
+        assert database.get_db not in dependencies(router)
+    # 대시보드 캐시 로더는 요청 세션 대신 자체 읽기 세션을 엶
+    assert dashboard.ReadSessionLocal is database.ReadSessionLocal
+
+    routes = {route.path: route for route in admin.router.routes}
+    for path in ("/dashboard", "/delivery/statistics"):
+        assert get_read_db in {d.call for d in routes[path].dependant.dependencies}
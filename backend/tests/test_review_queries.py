@@ -0,0 +1,82 @@
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from app.models import Address, Order, Review, ShippingOrder
+from app.services.performance_analysis_service import PerformanceAnalysisService
+from app.services.review_service import ReviewService
+from app.services.rollup_service import ROLLUP_MODELS, track_rollups
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'reviews.db'}")
+    for model in (Address, Order, ShippingOrder, Review) + ROLLUP_MODELS:
+        model.__table__.create(engine)
+    track_rollups(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def add_orders(db, start_id: int, count: int, now: datetime):
+    for order_id in range(start_id, start_id + count):
+        db.add(Order(id=order_id, items=[], total_price=10000, created_at=now))
+        db.add(ShippingOrder(id=order_id, order_id=order_id, company_id=1, driver_id=order_id % 3 + 1,
+                             status="delivered", shipping_fee=3000, created_at=now,
+                             delivered_at=now + timedelta(hours=3)))
+        db.add(Review(order_id=order_id, shipping_order_id=order_id, rating=order_id % 5 + 1, created_at=now))
+    db.commit()
+
+def count_queries(db, function, *args):
+    statements = []
+    listener = lambda *params: statements.append(params[2])
+    event.listen(db.get_bind(), "before_cursor_execute", listener)
+    try:
+        result = function(*args)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+    return result, len(statements)
+
+def test_company_performance_query_count_is_constant(db):
+    now = datetime.utcnow()
+    service = PerformanceAnalysisService(None, None)
+    window = (db, 1, now - timedelta(days=1), now + timedelta(days=1))
+
+    add_orders(db, 1, 10, now)
+    small, small_queries = count_queries(db, service.analyze_company_performance, *window)
+    add_orders(db, 11, 200, now)
+    large, large_queries = count_queries(db, service.analyze_company_performance, *window)
+
+    # 배송/리뷰 건수와 무관하게 조회 횟수가 일정해야 함 (주문별 리뷰 조회 없음)
+    print(f"analyze_company_performance: {small_queries} queries (10건), {large_queries} queries (210건)")
+    assert small_queries == large_queries == 5
+    assert small["customer_satisfaction"]["total_reviews"] == 10
+    assert large["customer_satisfaction"]["total_reviews"] == 210
+
+def test_get_reviews_by_order_ids_batches_lookup(db):
+    now = datetime.utcnow()
+    add_orders(db, 1, 30, now)
+    db.add(Review(order_id=5, rating=1, created_at=now))
+    db.commit()
+
+    service = ReviewService()
+    reviews, queries = count_queries(db, service.get_reviews_by_order_ids, db, [5, 7, 5, 999])
+    print(f"get_reviews_by_order_ids: {queries} queries")
+    assert queries == 1
+    assert list(reviews) == [5, 7, 999]
+    assert [review.rating for review in reviews[5]] == [1, 1]
+    assert [review.order_id for review in reviews[7]] == [7]
+    assert reviews[999] == []
+
+    # 바인드 파라미터 제한을 넘지 않도록 청크 단위로 조회
+    service.IN_QUERY_CHUNK_SIZE = 10
+    reviews, queries = count_queries(db, service.get_reviews_by_order_ids, db, range(1, 31))
+    assert queries == 3
+    assert sum(len(rows) for rows in reviews.values()) == 31
@@ -0,0 +1,138 @@
+import sys
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+from app.models import Address, Order, Review, ShippingOrder
+from app.models.rollup import (
+    DailyDriverRollup, DailyItemRollup, DailyOrderRollup, DailyReviewRollup, DailyShipmentRollup
+)
+from app.services.performance_analysis_service import PerformanceAnalysisService
+from app.services.rollup_service import ROLLUP_MODELS, RollupService, track_rollups
+from app.utils.sql_functions import increment_rows
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'rollup.db'}")
+    for model in (Address, Order, ShippingOrder, Review) + ROLLUP_MODELS:
+        model.__table__.create(engine)
+    track_rollups(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+def snapshot(db):
+    # 0건이 된 키는 비교에서 제외
+    result = {}
+    for model in ROLLUP_MODELS:
+        count_column = [c for c in model.__table__.columns if c.name.endswith("_count")][0]
+        rows = db.execute(select(model.__table__).where(count_column != 0)).mappings().all()
+        result[model.__tablename__] = sorted(tuple(sorted(row.items())) for row in rows)
+    return result
+
+def test_incremental_updates_match_backfill(db):
+    now = datetime(2026, 10, 1, 9, 0)
+    address = Address(address="서울특별시 강남구 테헤란로 1")
+    db.add(address)
+    db.flush()
+    order = Order(items=[{"id": "bed"}, {"id": "desk"}], total_price=300000, status="pending",
+                  to_address_id=address.id, created_at=now)
+    db.add(order)
+    db.flush()
+    shipment = ShippingOrder(order_id=order.id, company_id=1, driver_id=7, region="서울특별시",
+                             status="pending", shipping_fee=30000, tracking_number="T1", created_at=now)
+    other = ShippingOrder(order_id=order.id, company_id=1, driver_id=8, region="부산광역시",
+                          status="pending", shipping_fee=20000, tracking_number="T2", created_at=now)
+    db.add_all([shipment, other])
+    db.commit()
+
+    # 상태 변경/배송 완료/리뷰 작성/삭제가 같은 트랜잭션에서 집계에 반영
+    order.status = "completed"
+    shipment.status = "delivered"
+    shipment.delivered_at = now + timedelta(hours=3)
+    db.add(Review(order_id=order.id, shipping_order_id=shipment.id, rating=4.5,
+                  service_rating=5, driver_rating=4, created_at=now))
+    db.commit()
+    db.delete(other)
+    db.commit()
+
+    orders = db.query(DailyOrderRollup).filter(DailyOrderRollup.order_count != 0).all()
+    assert [(o.region, o.status, o.order_count, o.revenue) for o in orders] == [("서울특별시", "completed", 1, 300000)]
+    assert db.query(DailyItemRollup).filter_by(furniture_id="bed").one().order_count == 1
+    delivered = db.query(DailyShipmentRollup).filter_by(status="delivered").one()
+    assert (delivered.region, delivered.timed_count, delivered.hours_2_4) == ("서울특별시", 1, 1)
+    assert delivered.delivery_hours == pytest.approx(3.0)
+    driver = db.query(DailyDriverRollup).filter_by(driver_id=7).one()
+    assert (driver.shipment_count, driver.delivered_count, driver.delivered_fee) == (1, 1, 30000)
+    assert db.query(DailyDriverRollup).filter_by(driver_id=8).one().shipment_count == 0
+    review = db.query(DailyReviewRollup).one()
+    assert (review.company_id, review.driver_id, review.rating_4) == (1, 7, 1)
+
+    incremental = snapshot(db)
+    RollupService(batch_size=2).rebuild(db)
+    assert snapshot(db) == incremental
+
+    stats = PerformanceAnalysisService(None, None).analyze_company_performance(
+        db, 1, now - timedelta(days=1), now + timedelta(days=1)
+    )
+    assert stats["summary"]["total_orders"] == 1
+    assert stats["summary"]["avg_delivery_time"] == pytest.approx(3.0)
+    assert stats["delivery_performance"]["delivery_time_distribution"]["2-4h"] == 1
+    assert stats["customer_satisfaction"]["avg_driver_rating"] == 4
+    assert stats["financial_metrics"]["completed_revenue"] == 30000
+    assert stats["driver_performance"] == [{"driver_id": 7, "total_deliveries": 1, "avg_rating": 4.0}]
+
+def test_reassignment_updates_dependent_rollups(db):
+    now = datetime(2026, 10, 1, 9, 0)
+    address = Address(address="서울특별시 강남구 테헤란로 1")
+    db.add(address)
+    db.flush()
+    order = Order(items=[{"id": "bed"}], total_price=100000, status="completed", to_address_id=address.id, created_at=now)
+    db.add(order)
+    db.flush()
+    shipment = ShippingOrder(order_id=order.id, company_id=1, driver_id=7, status="delivered",
+                             tracking_number="T1", created_at=now, delivered_at=now + timedelta(hours=2))
+    db.add(shipment)
+    db.flush()
+    db.add(Review(order_id=order.id, shipping_order_id=shipment.id, rating=5, driver_rating=5, created_at=now))
+    db.commit()
+
+    # 기사/배송사 재배정과 주소 수정은 리뷰/주문 집계 키도 바꿈
+    shipment.driver_id = 9
+    shipment.company_id = 2
+    address.address = "부산광역시 해운대구 해운대로 1"
+    db.commit()
+
+    review = db.query(DailyReviewRollup).filter(DailyReviewRollup.review_count != 0).one()
+    assert (review.company_id, review.driver_id) == (2, 9)
+    order_rollup = db.query(DailyOrderRollup).filter(DailyOrderRollup.order_count != 0).one()
+    assert order_rollup.region == "부산광역시"
+
+    incremental = snapshot(db)
+    RollupService().rebuild(db)
+    assert snapshot(db) == incremental
+
+def test_increment_rows_writes_in_primary_key_order(db):
+    # 동시 트랜잭션이 같은 순서로 행을 잠그도록 기본 키 순서로 실행되어야 함
+    day = datetime(2026, 10, 1).date()
+    written = []
+    connection = db.connection()
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        written.extend(parameters if executemany else [parameters])
+
+    increment_rows(connection, DailyOrderRollup.__table__, [
+        {"day": day, "region": "서울특별시", "status": "pending", "order_count": 1, "revenue": 0},
+        {"day": day, "region": "부산광역시", "status": "pending", "order_count": 1, "revenue": 0},
+        {"day": day, "region": "부산광역시", "status": "completed", "order_count": 1, "revenue": 0},
+    ])
+    keys = [(row[1], row[2]) for row in written]
+    assert keys == [("부산광역시", "completed"), ("부산광역시", "pending"), ("서울특별시", "pending")]
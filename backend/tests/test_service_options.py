@@ -0,0 +1,32 @@
+import sys
+import json
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.services.service_options_service import ServiceOptionsService
+
+def test_total_fee_uses_fee_index():
+    service = ServiceOptionsService()
+
+    assert service.calculate_total_fee([("floor", "floor-3"), ("ladder", "ladder-normal")]) == 100000
+    # 가격 협의 옵션, 선택 안 함(None), 없는 id는 0원
+    assert service.calculate_total_fee([("ladder", "ladder-high"), ("special", None), ("floor", "unknown")]) == 0
+    assert service.get_option_fee("floor", "floor-1") == 0
+    assert service.get_option_fee("floor", "unknown") is None
+
+def test_option_id_must_match_its_field():
+    service = ServiceOptionsService()
+
+    # 층수 옵션 id를 사다리차 옵션으로 보내면 과금하지 않음
+    assert service.calculate_total_fee([("ladder", "floor-5"), ("special", "ladder-normal")]) == 0
+    assert service.get_option_fee("ladder", "floor-5") is None
+
+def test_options_listing_is_preserialized():
+    service = ServiceOptionsService()
+
+    listing = service.get_options_listing()
+    assert listing is service.get_options_listing()
+    assert json.loads(listing.body) == service.get_all_options().model_dump()
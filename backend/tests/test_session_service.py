@@ -0,0 +1,88 @@
+import sys
+import asyncio
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from redis.exceptions import WatchError
+from app.core.fake_redis import FakeRedis
+from app.services.session_service import SessionService
+from app.utils.tiered_cache import TieredCache
+
+@pytest.mark.asyncio
+async def test_session_updates_merge_without_lost_writes():
+    redis = FakeRedis()
+    service = SessionService(redis)
+    session_id = await service.create_session()
+
+    # 동시에 들어온 수정도 모두 반영되어야 함
+    await asyncio.gather(*(
+        service.update_session_data(session_id, {f"step_{i}": i}) for i in range(10)
+    ))
+    await service.update_session_data(session_id, {"step_0": "updated"})
+
+    data = await service.get_session_data(session_id)
+    assert data == {"step_0": "updated", **{f"step_{i}": i for i in range(1, 10)}}
+    assert 0 < await redis.ttl(f"session:{session_id}") <= service.expire_time
+
+    await service.migrate_to_user(session_id, user_id=1)
+    assert await service.get_session_data(session_id) == {}
+
+@pytest.mark.asyncio
+async def test_session_update_merges_instead_of_replacing():
+    # 이전에는 update_session_data가 세션 전체를 덮어썼음 (지금은 전달한 키만 갱신)
+    service = SessionService(FakeRedis())
+    session_id = await service.create_session()
+
+    await service.update_session_data(session_id, {"product": "침대", "date": "2026-11-01"})
+    assert await service.update_session_data(session_id, {"date": "2026-11-02"}) == {
+        "product": "침대", "date": "2026-11-02"
+    }
+    assert await service.get_session_data(session_id) == {"product": "침대", "date": "2026-11-02"}
+
+@pytest.mark.asyncio
+async def test_watch_detects_concurrent_modification():
+    redis = FakeRedis()
+    await redis.set("key", "1")
+
+    async with redis.pipeline() as pipe:
+        await pipe.watch("key")
+        await redis.set("key", "2")
+        pipe.multi()
+        pipe.set("key", "3")
+        with pytest.raises(WatchError):
+            await pipe.execute()
+    assert await redis.get("key") == b"2"
+
+@pytest.mark.asyncio
+async def test_tiered_cache_is_shared_between_workers():
+    redis = FakeRedis()
+    workers = [TieredCache("stats", redis=redis) for _ in range(3)]
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return {"total_orders": 10}
+
+    results = await asyncio.gather(*(worker.get_or_set("summary", load) for worker in workers))
+    assert results == [{"total_orders": 10}] * 3
+    assert len(calls) == 1
+
+def test_memory_backend_requires_opt_in(monkeypatch):
+    from app.core import redis as redis_module
+    monkeypatch.setattr(redis_module.settings, "REDIS_URL", None)
+
+    monkeypatch.setattr(redis_module.settings, "REDIS_ALLOW_MEMORY_BACKEND", False)
+    with pytest.raises(RuntimeError, match="REDIS_ALLOW_MEMORY_BACKEND=True"):
+        redis_module.create_redis()
+    # 앱 시작 시에는 해결 방법을 로그로 남기고 중단
+    monkeypatch.setattr(redis_module, "_client", None)
+    with pytest.raises(RuntimeError):
+        asyncio.run(redis_module.start_redis())
+
+    monkeypatch.setattr(redis_module.settings, "REDIS_ALLOW_MEMORY_BACKEND", True)
+    assert isinstance(redis_module.create_redis(), FakeRedis)
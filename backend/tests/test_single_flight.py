@@ -0,0 +1,54 @@
+import sys
+import asyncio
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.utils.single_flight import SingleFlight
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_are_merged():
+    flight = SingleFlight("test")
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return f"result-{key}"
+
+    results = await asyncio.gather(*(
+        flight.do(key, lambda key=key: fetch(key)) for key in ["a", "a", "a", "b"]
+    ))
+
+    assert results == ["result-a", "result-a", "result-a", "result-b"]
+    assert sorted(calls) == ["a", "b"]
+    assert flight.stats() == {"calls": 2, "coalesced": 2, "in_flight": 0}
+
+    # 완료된 결과는 보관하지 않음
+    await flight.do("a", lambda: fetch("a"))
+    assert calls.count("a") == 2
+
+@pytest.mark.asyncio
+async def test_errors_and_cancellation_are_isolated():
+    flight = SingleFlight("test")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream")
+
+    results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+    assert [type(result) for result in results] == [ValueError, ValueError]
+
+    async def slow():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    first = asyncio.ensure_future(flight.do("s", slow))
+    second = asyncio.ensure_future(flight.do("s", slow))
+    await asyncio.sleep(0)
+    first.cancel()
+    # 한 대기자가 취소되어도 공유 호출은 계속 진행
+    assert await second == "ok"
@@ -0,0 +1,130 @@
+import sys
+import asyncio
+from datetime import datetime, date
+import pytest
+from pathlib import Path
+
+# 백엔드 디렉토리를 Python 경로에 추가
+backend_dir = Path(__file__).parent.parent
+sys.path.append(str(backend_dir))
+
+from app.core.config import settings
+from app.core.fake_redis import FakeRedis
+from app.utils import tiered_cache
+from app.utils.tiered_cache import (
+    TieredCache, get_tiered_cache, invalidate_tags, invalidate_tags_sync, pack, unpack
+)
+
+VALUE = {"date": date(2026, 1, 2), "at": datetime(2026, 1, 2, 3, 4, 5), "items": [1, 2.5, "침대", None]}
+
+class SyncFakeRedis:
+    """동기 Redis 클라이언트 대신 FakeRedis 명령을 동기로 실행 (invalidate_tags_sync용)"""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+
+    def __getattr__(self, name):
+        command = getattr(self.redis, name)
+        return lambda *args, **kwargs: asyncio.run(command(*args, **kwargs))
+
+def worker_cache(redis: FakeRedis, namespace: str = "test-remote", **kwargs) -> TieredCache:
+    # 같은 Redis를 공유하는 다른 워커의 캐시
+    return TieredCache(namespace, redis=redis, prefix=settings.CACHE_KEY_PREFIX, **kwargs)
+
+def test_msgpack_round_trip():
+    assert unpack(pack(VALUE)) == VALUE
+
+@pytest.mark.asyncio
+async def test_get_or_set_computes_once_and_tags_invalidate():
+    cache = get_tiered_cache("test-catalog")
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"items": ["desk"]}
+
+    results = await asyncio.gather(*(
+        cache.get_or_set(("listing", "study"), load, tags=("test-catalog",)) for _ in range(5)
+    ))
+    assert results == [{"items": ["desk"]}] * 5
+    assert len(calls) == 1
+
+    await invalidate_tags("test-catalog")
+    assert await cache.get(("listing", "study")) is None
+    await cache.get_or_set(("listing", "study"), load, tags=("test-catalog",))
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_workers():
+    redis = FakeRedis()
+    first, second = worker_cache(redis, ttl=30), worker_cache(redis, ttl=30)
+
+    await first.set("key", VALUE)
+    # Redis에는 msgpack으로 저장되고 TTL이 설정됨
+    assert unpack(await redis.get(first.redis_key("key"))) == VALUE
+    assert 0 < await redis.ttl(first.redis_key("key")) <= 30
+
+    assert await second.get("key") == VALUE
+    assert second.stats()["remote_hits"] == 1
+    # 두 번째 조회는 로컬 계층에서 처리
+    assert await second.get("key") == VALUE
+    assert second.stats()["remote_hits"] == 1
+
+@pytest.mark.asyncio
+async def test_rebuild_lock_computes_once_across_workers():
+    redis = FakeRedis()
+    first, second = worker_cache(redis), worker_cache(redis)
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return VALUE
+
+    results = await asyncio.gather(first.get_or_set("report", load), second.get_or_set("report", load))
+    assert results == [VALUE, VALUE]
+    assert len(calls) == 1
+    assert await redis.get(first.redis_key("report") + ":lock") is None
+
+@pytest.mark.asyncio
+async def test_rebuild_lock_held_elsewhere_times_out_and_is_not_released():
+    redis = FakeRedis()
+    cache = worker_cache(redis, lock_timeout=0.1)
+    lock_key = cache.redis_key("report") + ":lock"
+    await redis.set(lock_key, "other-worker", nx=True, px=10000)
+
+    async def load():
+        return "computed"
+
+    # 잠금을 가진 워커가 결과를 저장하지 않으면 lock_timeout 후 직접 계산
+    assert await cache.get_or_set("report", load) == "computed"
+    assert await redis.get(lock_key) == b"other-worker"
+
+@pytest.mark.asyncio
+async def test_invalidate_tags_clears_redis_and_local_tiers(monkeypatch):
+    redis = FakeRedis()
+    cache = worker_cache(redis, namespace="test-tags")
+    monkeypatch.setattr(tiered_cache, "get_cache_redis", lambda: redis)
+    monkeypatch.setitem(tiered_cache._caches, "test-tags", cache)
+
+    await cache.set("tagged", VALUE, tags=("furniture",))
+    await cache.set("untagged", VALUE)
+
+    assert await invalidate_tags("furniture") == 1
+    assert await redis.get(cache.redis_key("tagged")) is None
+    assert await redis.smembers(cache.tag_key("furniture")) == set()
+    assert cache.local.get(cache.redis_key("tagged")) is None
+    assert await cache.get("untagged") == VALUE
+
+def test_invalidate_tags_sync_clears_redis_and_local_tiers(monkeypatch):
+    redis = FakeRedis()
+    cache = worker_cache(redis, namespace="test-tags-sync")
+    monkeypatch.setattr(tiered_cache, "get_sync_cache_redis", lambda: SyncFakeRedis(redis))
+    monkeypatch.setitem(tiered_cache._caches, "test-tags-sync", cache)
+
+    asyncio.run(cache.set("tagged", VALUE, tags=("furniture",)))
+
+    assert invalidate_tags_sync("furniture") == 1
+    assert asyncio.run(redis.get(cache.redis_key("tagged"))) is None
+    assert cache.local.get(cache.redis_key("tagged")) is None